@@ -0,0 +1,203 @@
+"""Bounded in-process write-behind buffer flushed by a background thread."""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+_writers: "weakref.WeakSet[BackgroundBatchWriter]" = weakref.WeakSet()
+
+
+class BackgroundBatchWriter[T]:
+    """Buffers items in memory and hands them to ``flush_func`` in batches.
+
+    A flush is triggered when ``flush_size`` items are buffered or when the oldest
+    buffered item is ``flush_interval`` seconds old, whichever comes first. Producers
+    block for at most ``put_timeout`` seconds when the buffer is full and are told so,
+    leaving the caller to decide how to apply backpressure.
+
+    The flusher thread is started lazily in the process that first enqueues, so a
+    writer created before gunicorn forks is safe to use in every worker.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        flush_func: Callable[[list[T]], None],
+        capacity: int,
+        flush_size: int,
+        flush_interval: float,
+        put_timeout: float = 0.0,
+        max_retries: int = 3,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            name: Name used for the flusher thread and log lines
+            flush_func: Callable that persists a batch; exceptions trigger retries
+            capacity: Maximum number of buffered items
+            flush_size: Number of items that triggers an immediate flush
+            flush_interval: Maximum age in seconds of a buffered item before flushing
+            put_timeout: Seconds a producer may wait for room before giving up
+            max_retries: Flush attempts per batch before the batch is dropped
+
+        """
+        self.name = name
+        self.flush_func = flush_func
+        self.capacity = capacity
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.max_retries = max_retries
+        self._reset()
+        _writers.add(self)
+
+    def _reset(self) -> None:
+        """(Re)initialize per-process state."""
+        self._pid = os.getpid()
+        self._items: deque[T] = deque()
+        self._oldest_at = 0.0
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._in_flight = 0
+
+    def _reset_after_fork(self) -> None:
+        """Drop state inherited from the parent process (call before taking ``_cond``)."""
+        if self._pid != os.getpid():
+            # Items and locks copied from the parent belong to the parent
+            self._reset()
+
+    def _ensure_started(self) -> None:
+        """Start the flusher thread if it is not running (lock held by caller)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name=f"{self.name}-flusher", daemon=True)
+            self._thread.start()
+
+    def put_many(self, items: Iterable[T]) -> bool:
+        """Enqueue items for a later flush.
+
+        Args:
+            items: Items to enqueue (all or nothing)
+
+        Returns:
+            True if the items were buffered, False if the buffer stayed full for ``put_timeout``
+
+        """
+        items = list(items)
+        if not items:
+            return True
+
+        self._reset_after_fork()
+        with self._cond:
+            self._ensure_started()
+            deadline = time.monotonic() + self.put_timeout
+            while len(self._items) + len(items) > self.capacity:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stopping:
+                    return False
+                self._cond.wait(remaining)
+
+            was_empty = not self._items
+            if was_empty:
+                self._oldest_at = time.monotonic()
+            self._items.extend(items)
+            # The flusher sleeps without a timeout while the buffer is empty, so it
+            # must be woken to start the flush_interval clock, not only at flush_size
+            if was_empty or len(self._items) >= self.flush_size:
+                self._cond.notify_all()
+            return True
+
+    def __len__(self) -> int:
+        """Return the number of buffered items."""
+        return len(self._items)
+
+    def _take_batch(self) -> list[T]:
+        """Wait until a flush is due and pop up to ``flush_size`` items (lock held by caller)."""
+        while True:
+            if self._items and (
+                self._stopping
+                or len(self._items) >= self.flush_size
+                or time.monotonic() - self._oldest_at >= self.flush_interval
+            ):
+                break
+            if self._stopping:
+                return []
+            timeout = self.flush_interval - (time.monotonic() - self._oldest_at) if self._items else None
+            self._cond.wait(timeout)
+
+        batch = [self._items.popleft() for _ in range(min(self.flush_size, len(self._items)))]
+        self._oldest_at = time.monotonic()
+        self._in_flight = len(batch)
+        # Wake producers waiting for room
+        self._cond.notify_all()
+        return batch
+
+    def _flush_batch(self, batch: list[T]) -> None:
+        """Hand a batch to ``flush_func``, retrying with a short backoff."""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                self.flush_func(batch)
+            except Exception:
+                logger.exception(
+                    "[%s] Flush of %s items failed (attempt %s/%s)",
+                    self.name,
+                    len(batch),
+                    attempt,
+                    self.max_retries,
+                )
+                time.sleep(min(0.1 * 2**attempt, 2.0))
+            else:
+                return
+        logger.error("[%s] Dropping %s items after %s failed flushes", self.name, len(batch), self.max_retries)
+
+    def _run(self) -> None:
+        """Flusher thread main loop."""
+        while True:
+            with self._cond:
+                batch = self._take_batch()
+                if not batch:
+                    self._cond.notify_all()
+                    return
+            try:
+                self._flush_batch(batch)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Flush everything buffered and stop the flusher thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the drain
+
+        """
+        if self._pid != os.getpid():
+            return
+        thread = self._thread
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if thread is not None and thread.is_alive():
+            thread.join(timeout)
+        if self._items:
+            logger.error("[%s] Shutdown left %s unflushed items", self.name, len(self._items))
+        else:
+            logger.info("[%s] Drained on shutdown", self.name)
+
+
+def shutdown_all_writers(timeout: float = 10.0) -> None:
+    """Drain every BackgroundBatchWriter in this process (e.g. from gunicorn's worker_exit hook)."""
+    for writer in list(_writers):
+        writer.shutdown(timeout)
+
+
+atexit.register(shutdown_all_writers)
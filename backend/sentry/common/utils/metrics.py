@@ -0,0 +1,39 @@
+"""Host-wide counters shared by all worker processes."""
+
+from django.core.cache import caches
+
+COUNTER_KEY = "metrics:counter:{name}"
+NAMES_KEY = "metrics:names"
+CACHE_ALIAS = "shared"
+
+
+def incr_counter(name: str, amount: float = 1) -> None:
+    """Add ``amount`` to a named counter.
+
+    Increments are read-modify-write on the shared cache, so concurrent workers
+    can occasionally lose an update; counters are for monitoring, not accounting.
+
+    Args:
+        name: Dotted counter name, e.g. ``crash_verdict_cache.misses``
+        amount: Value to add
+
+    """
+    cache = caches[CACHE_ALIAS]
+    key = COUNTER_KEY.format(name=name)
+    if cache.add(key, amount, None):
+        names = cache.get(NAMES_KEY) or []
+        if name not in names:
+            cache.set(NAMES_KEY, [*names, name], None)
+        return
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.set(key, amount, None)
+
+
+def get_counters(prefix: str = "") -> dict[str, float]:
+    """Return all counters whose name starts with ``prefix``."""
+    cache = caches[CACHE_ALIAS]
+    names = sorted(n for n in cache.get(NAMES_KEY) or [] if n.startswith(prefix))
+    values = cache.get_many([COUNTER_KEY.format(name=n) for n in names])
+    return {n: values.get(COUNTER_KEY.format(name=n), 0) for n in names}
@@ -0,0 +1,112 @@
+"""Micro-batching of concurrent crash analyses into single Gemini requests."""
+
+import logging
+import threading
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any
+
+from sentry.settings.config import settings as app_settings
+
+from core.ai.gemini_service import GeminiService
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisBatcher:
+    """Coalesces analyses requested concurrently in this process.
+
+    The first analysis to arrive opens a batch; it is sent when it reaches
+    ``max_size`` cases or ``window_ms`` after it opened, whichever comes first,
+    and each caller gets its own verdict back. When no other alert is being
+    processed in the process the analysis is sent straight away, so a lone alert
+    (e.g. in a sync gunicorn worker) never waits for the window.
+    """
+
+    def __init__(self, window_ms: int, max_size: int) -> None:
+        """Initialize the batcher.
+
+        Args:
+            window_ms: Maximum time a batch stays open (the added latency cap)
+            max_size: Maximum alerts per request
+
+        """
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._pending: list[tuple[dict[str, Any], Future]] = []
+        self._generation = 0
+        self._active = 0
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Mark an alert as being processed (lets the batcher know whether to wait)."""
+        with self._lock:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    def analyze(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Analyze one alert, possibly batched with concurrent ones.
+
+        Args:
+            **kwargs: Keyword arguments of ``GeminiService.analyze_crash_data``
+
+        Returns:
+            The analysis result for this alert
+
+        """
+        future: Future = Future()
+        batch = None
+        with self._lock:
+            if not app_settings.crash_batch_enabled or (self._active <= 1 and not self._pending):
+                batch = [(kwargs, future)]
+            else:
+                self._pending.append((kwargs, future))
+                if len(self._pending) >= self.max_size:
+                    batch = self._take()
+                elif len(self._pending) == 1:
+                    timer = threading.Timer(self.window, self._flush_generation, args=(self._generation,))
+                    timer.daemon = True
+                    timer.start()
+        if batch is not None:
+            self._run(batch)
+        return future.result()
+
+    def _take(self) -> list[tuple[dict[str, Any], Future]]:
+        """Detach the open batch (caller holds the lock)."""
+        batch, self._pending = self._pending, []
+        self._generation += 1
+        return batch
+
+    def _flush_generation(self, generation: int) -> None:
+        """Send the batch opened at ``generation`` if it is still open when its window ends."""
+        with self._lock:
+            if generation != self._generation or not self._pending:
+                return
+            batch = self._take()
+        self._run(batch)
+
+    def _run(self, batch: list[tuple[dict[str, Any], Future]]) -> None:
+        """Analyze a batch and hand each caller its result."""
+        cases = [kwargs for kwargs, _ in batch]
+        try:
+            if len(batch) > 1:
+                logger.info("[BATCH] Sending %s crash analyses in one request", len(batch))
+            results = GeminiService().analyze_crash_batch(cases)
+        except Exception as e:  # noqa: BLE001
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            future.set_result(result)
+
+
+analysis_batcher = AnalysisBatcher(
+    window_ms=app_settings.crash_batch_window_ms,
+    max_size=app_settings.crash_batch_max_size,
+)
@@ -0,0 +1,223 @@
+"""Circuit breaker shared across worker processes."""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from django.conf import settings as django_settings
+from django.core.cache import caches
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker with its state in the shared cache.
+
+    Every worker on the host records call outcomes into the same window, so one
+    worker seeing timeouts protects the others. Closed: calls pass and are
+    recorded. Open: calls fail fast until ``open_seconds`` have passed. Half-open:
+    a single probe call is let through; success closes the circuit, failure
+    re-opens it. The probe slot is an exclusive ``flock`` on a file next to the
+    shared cache, which is atomic across processes and released by the kernel if
+    the holder dies.
+
+    Updates are read-modify-write on the cache without a lock, so concurrent
+    workers can occasionally drop a sample; the rates stay representative.
+
+    ``record`` must be called from the thread whose ``allow_request`` let the
+    call through: that is how the half-open probe is told apart from calls that
+    started before the circuit opened, whose late outcomes are ignored. Paths that
+    end without calling ``record`` must call ``release_probe``.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        name: str,
+        *,
+        window_seconds: int,
+        min_calls: int,
+        failure_rate: float,
+        slow_call_seconds: float,
+        open_seconds: int,
+        max_samples: int = 200,
+        cache_alias: str = "shared",
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            name: Name of the protected dependency (cache key prefix)
+            window_seconds: Rolling window of outcomes considered
+            min_calls: Calls needed in the window before the circuit can open
+            failure_rate: Share of failed or slow calls that opens the circuit
+            slow_call_seconds: Calls at least this slow count as failures
+            open_seconds: Time to stay open before allowing a probe
+            max_samples: Maximum outcomes kept in the window
+            cache_alias: Django cache shared by all workers
+
+        """
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.max_samples = max_samples
+        self.cache_alias = cache_alias
+        self.key = f"circuit:{name}"
+        self.probe_key = f"circuit:{name}:probe"
+        self._local = threading.local()  # The probe slot held by this thread, if any
+
+    @property
+    def cache(self) -> Any:  # noqa: ANN401
+        """Return the shared cache backend."""
+        return caches[self.cache_alias]
+
+    def _load(self) -> dict[str, Any]:
+        return self.cache.get(self.key) or {"state": STATE_CLOSED, "opened_at": None, "calls": []}
+
+    def _store(self, data: dict[str, Any]) -> None:
+        self.cache.set(self.key, data, None)
+
+    def _state(self, data: dict[str, Any], now: float) -> str:
+        if data["state"] == STATE_OPEN:
+            return STATE_HALF_OPEN if now - data["opened_at"] >= self.open_seconds else STATE_OPEN
+        return STATE_CLOSED
+
+    def _probe_lock_path(self) -> Path:
+        """Return the probe lock file, kept beside the shared file-based cache."""
+        location = django_settings.CACHES.get(self.cache_alias, {}).get("LOCATION")
+        lock_dir = Path(location) if location else Path(tempfile.gettempdir())
+        lock_dir.mkdir(parents=True, exist_ok=True)
+        return lock_dir / f"circuit-{self.name}.probe.lock"
+
+    def _claim_probe(self) -> bool:
+        """Try to take the host-wide probe slot without blocking."""
+        if fcntl is None:
+            # No flock on this platform: best effort through the cache
+            self._local.probe = bool(self.cache.add(self.probe_key, 1, self.open_seconds))
+            return self._local.probe
+
+        fd = os.open(self._probe_lock_path(), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._local.probe = True
+        self._local.probe_fd = fd
+        return True
+
+    def release_probe(self) -> None:
+        """Give up the probe slot if this thread holds it (a no-op otherwise)."""
+        if not getattr(self._local, "probe", False):
+            return
+        self._local.probe = False
+        fd = getattr(self._local, "probe_fd", None)
+        self._local.probe_fd = None
+        if fd is not None:
+            os.close(fd)  # Closing the only descriptor drops the flock
+        else:
+            self.cache.delete(self.probe_key)
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go ahead (False means fail fast)."""
+        self.release_probe()
+        state = self._state(self._load(), time.time())
+        if state == STATE_CLOSED:
+            return True
+        if state == STATE_HALF_OPEN:
+            # Only one caller on the host gets to probe
+            return self._claim_probe()
+        return False
+
+    def record(self, *, success: bool, latency: float) -> None:
+        """Record the outcome of a call that was allowed through.
+
+        Args:
+            success: Whether the call produced a usable result
+            latency: Call duration in seconds
+
+        """
+        try:
+            self._record(success=success, latency=latency)
+        finally:
+            # Only after the new state is stored, so no second probe sees the old one
+            self.release_probe()
+
+    def _record(self, *, success: bool, latency: float) -> None:
+        now = time.time()
+        data = self._load()
+        failed = not success or latency >= self.slow_call_seconds
+
+        if data["state"] == STATE_OPEN:
+            if not getattr(self._local, "probe", False):
+                # A call that started before the circuit opened (e.g. a long hedged race);
+                # only the probe that won the slot may close or re-open the circuit
+                return
+            if failed:
+                data["opened_at"] = now
+                logger.warning("[BREAKER] %s probe failed - circuit stays open", self.name)
+            else:
+                data = {"state": STATE_CLOSED, "opened_at": None, "calls": []}
+                logger.info("[BREAKER] %s probe succeeded - circuit closed", self.name)
+            self._store(data)
+            return
+
+        calls = [c for c in data["calls"] if now - c[0] < self.window_seconds]
+        calls.append([now, int(not success), latency])
+        data["calls"] = calls[-self.max_samples :]
+
+        failures = sum(1 for _, error, duration in data["calls"] if error or duration >= self.slow_call_seconds)
+        if len(data["calls"]) >= self.min_calls and failures / len(data["calls"]) >= self.failure_rate:
+            data["state"] = STATE_OPEN
+            data["opened_at"] = now
+            logger.warning(
+                "[BREAKER] %s circuit opened: %s/%s failed or slow calls in the last %ss",
+                self.name,
+                failures,
+                len(data["calls"]),
+                self.window_seconds,
+            )
+        self._store(data)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return breaker state and rolling statistics for the metrics endpoint."""
+        now = time.time()
+        data = self._load()
+        calls = [c for c in data["calls"] if now - c[0] < self.window_seconds]
+        latencies = np.array([c[2] for c in calls]) if calls else np.empty(0)
+        errors = sum(c[1] for c in calls)
+        slow = int((latencies >= self.slow_call_seconds).sum()) if calls else 0
+        state = self._state(data, now)
+        return {
+            "name": self.name,
+            "state": state,
+            "opened_at": (datetime.fromtimestamp(data["opened_at"], tz=UTC).isoformat() if data["opened_at"] else None),
+            "retry_in_seconds": (
+                max(0.0, self.open_seconds - (now - data["opened_at"])) if state == STATE_OPEN else 0.0
+            ),
+            "window_seconds": self.window_seconds,
+            "calls": len(calls),
+            "errors": errors,
+            "slow_calls": slow,
+            "failure_rate": (
+                sum(1 for c in calls if c[1] or c[2] >= self.slow_call_seconds) / len(calls) if calls else 0.0
+            ),
+            "latency_p50_ms": float(np.percentile(latencies, 50) * 1000) if calls else None,
+            "latency_p95_ms": float(np.percentile(latencies, 95) * 1000) if calls else None,
+        }
@@ -0,0 +1,174 @@
+"""Compact, token-budgeted prompt encoding for crash analysis."""
+
+import math
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from sentry.settings.config import settings as app_settings
+
+if TYPE_CHECKING:
+    from device.services.sensor_window import SensorWindow
+
+# Conservative: numeric text tokenises to fewer characters per token than prose
+CHARS_PER_TOKEN = 3.0
+GRAVITY = 9.81
+TABLE_HEADER = "W: t,ax,ay,az,roll,pitch,tilt"
+
+# Static part of every request, sent once as the system instruction
+SYSTEM_INSTRUCTION = (
+    "You analyse threshold alerts from a motorcycle helmet crash detection system and decide whether "
+    "each is an actual crash or a false positive (e.g. sudden braking, helmet removal, normal riding).\n"
+    "\n"
+    "Input sections (acceleration m/s^2, angles degrees, g = |accel|/9.81, t = seconds relative to the alert):\n"
+    "F: window summary features as key=value\n"
+    'W: sampled readings, one "t,ax,ay,az,roll,pitch,tilt" row per line, oldest first '
+    "(tilt 1 = tilt detected)\n"
+    'H: recent events for this device, one "age_s,verdict,severity,confidence,type,max_g" row per line '
+    "(verdict C = confirmed crash, F = false positive)\n"
+    "A: the reading that triggered the alert\n"
+    "\n"
+    "Important considerations:\n"
+    "- High G-force alone might be sudden braking (false positive)\n"
+    "- Sustained tilt might indicate actual crash or helmet removal\n"
+    "- Look at the pattern over time, not just the current reading\n"
+    "- Consider motorcycle riding context (acceleration, braking, cornering)\n"
+    "- Multiple recent false positives may indicate a pattern (aggressive riding, sensor issues); recent "
+    "confirmed crashes may indicate follow-up impacts\n"
+    "\n"
+    "Respond with ONLY a JSON object, fields in this order:\n"
+    '{"is_crash": boolean, "severity": "low"|"medium"|"high", "confidence": float 0-1, '
+    '"false_positive_risk": float 0-1, '
+    '"crash_type": string (e.g. "frontal_impact", "side_impact", "fall", "false_positive"), '
+    '"key_indicators": array of strings (e.g. ["high_g_force", "sudden_tilt"]), '
+    '"reasoning": brief string}'
+)
+
+
+# Appended to SYSTEM_INSTRUCTION for micro-batched requests
+BATCH_INSTRUCTION = (
+    "\n"
+    "\n"
+    'This request contains several independent alerts, each introduced by a line "### case <id>" and '
+    "followed by its own F/W/H/A sections. Analyse every case on its own and respond with ONLY "
+    '{"verdicts": [{"case_id": "<id>", "verdict": {...}}]}, one entry per case, each verdict being the '
+    "JSON object described above."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` (no API call)."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def token_budget_for(lookback_seconds: int) -> int:
+    """Return the prompt token budget for a lookback window."""
+    return min(
+        app_settings.gemini_prompt_token_max,
+        app_settings.gemini_prompt_token_base + app_settings.gemini_prompt_tokens_per_second * lookback_seconds,
+    )
+
+
+def _num(value: Any) -> str:  # noqa: ANN401
+    """Format a number compactly (3 significant digits, booleans as 0/1)."""
+    if isinstance(value, bool | np.bool_):
+        return str(int(value))
+    if isinstance(value, int | np.integer):
+        return str(value)
+    return f"{value:.3g}"
+
+
+def _table_rows(sensor_window: "SensorWindow", max_rows: int) -> list[str]:
+    """Render up to ``max_rows`` evenly spaced readings, always keeping the G-force peak."""
+    count = len(sensor_window)
+    if count == 0 or max_rows <= 0:
+        return []
+    if count <= max_rows:
+        indices = np.arange(count)
+    else:
+        g = np.sqrt(sensor_window.ax**2 + sensor_window.ay**2 + sensor_window.az**2)
+        indices = np.unique(np.append(np.linspace(0, count - 1, max_rows - 1).round().astype(int), np.argmax(g)))
+
+    t = (sensor_window.timestamps[indices] - sensor_window.timestamps[-1]) / 1_000_000
+    return [
+        f"{t[j]:.2f},{sensor_window.ax[i]:.1f},{sensor_window.ay[i]:.1f},{sensor_window.az[i]:.1f},"
+        f"{sensor_window.roll[i]:.0f},{sensor_window.pitch[i]:.0f},{int(sensor_window.tilt[i])}"
+        for j, i in enumerate(indices)
+    ]
+
+
+def build_crash_prompt(  # noqa: PLR0913
+    sensor_window: "SensorWindow",
+    current_reading: dict[str, Any],
+    context_seconds: int,
+    crash_events: list[dict[str, Any]] | None = None,
+    features: dict[str, Any] | None = None,
+    token_budget: int | None = None,
+) -> str:
+    """Encode an alert as a compact prompt that fits a token budget.
+
+    Features, crash history and the triggering reading are always included; the
+    remaining budget is filled with a downsampled numeric table of the window.
+
+    Args:
+        sensor_window: Recent sensor readings (columnar window, oldest first)
+        current_reading: Current sensor reading that triggered alert
+        context_seconds: Lookback of the window (scales the default budget)
+        crash_events: Optional list of recent crash events for context
+        features: Optional window features
+        token_budget: Budget override (defaults to ``token_budget_for(context_seconds)``)
+
+    Returns:
+        Prompt text (pair with ``SYSTEM_INSTRUCTION``)
+
+    """
+    budget = token_budget if token_budget is not None else token_budget_for(context_seconds)
+
+    head = []
+    if features:
+        head.append("F: " + ",".join(f"{name}={_num(value)}" for name, value in features.items()))
+
+    tail = []
+    if crash_events:
+        now = datetime.now(tz=UTC)
+        tail.append("H:")
+        tail.extend(
+            f"{(now - event['crash_timestamp']).total_seconds():.0f},"
+            f"{'C' if event.get('is_confirmed_crash') else 'F'},"
+            f"{event.get('severity', 'unknown')},{event.get('confidence_score') or 0:.2f},"
+            f"{event.get('crash_type') or 'unknown'},{event.get('max_g_force') or 0:.2f}"
+            for event in crash_events
+        )
+    ax, ay, az = (float(current_reading.get(axis, 0)) for axis in ("ax", "ay", "az"))
+    tail.append(
+        f"A: ax={ax:.2f},ay={ay:.2f},az={az:.2f},roll={current_reading.get('roll', 0):.1f},"
+        f"pitch={current_reading.get('pitch', 0):.1f},tilt={int(bool(current_reading.get('tilt_detected')))},"
+        f"g={math.sqrt(ax**2 + ay**2 + az**2) / GRAVITY:.2f}",
+    )
+
+    fixed = estimate_tokens("\n".join(head + tail)) + estimate_tokens(TABLE_HEADER) + 1
+    rows: list[str] = []
+    if len(sensor_window) and budget > fixed:
+        # Size the sample from a rendered row, then trim if the estimate was optimistic
+        per_row = estimate_tokens(_table_rows(sensor_window, 1)[0]) + 1
+        max_rows = (budget - fixed) // per_row
+        rows = _table_rows(sensor_window, max_rows)
+        while rows and fixed + estimate_tokens("\n".join(rows)) + len(rows) > budget:
+            max_rows = int(max_rows * 0.9)
+            rows = _table_rows(sensor_window, max_rows)
+
+    table = [TABLE_HEADER, *rows] if rows else []
+    return "\n".join(head + table + tail)
+
+
+def build_batch_prompt(case_prompts: dict[str, str]) -> str:
+    """Combine per-case prompts (from ``build_crash_prompt``) into one multi-case prompt.
+
+    Args:
+        case_prompts: Prompt per case ID
+
+    Returns:
+        Prompt text (pair with ``SYSTEM_INSTRUCTION + BATCH_INSTRUCTION``)
+
+    """
+    return "\n".join(f"### case {case_id}\n{prompt}" for case_id, prompt in case_prompts.items())
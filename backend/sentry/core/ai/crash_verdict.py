@@ -0,0 +1,107 @@
+"""Crash verdict response schema and incremental (streaming) parser."""
+
+import json
+import re
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+# Fields needed to act on a verdict; a dismissed (not a crash) stream stops once all have arrived
+EARLY_EXIT_FIELDS = ("is_crash", "severity", "confidence")
+
+
+class CrashVerdict(BaseModel):
+    """Schema the model's JSON output is constrained to.
+
+    Field order is the generation order: decision fields first, free-text
+    reasoning last, so a streamed response can be acted on early.
+    """
+
+    is_crash: bool
+    severity: Literal["low", "medium", "high"]
+    confidence: float = Field(ge=0.0, le=1.0)
+    false_positive_risk: float = Field(ge=0.0, le=1.0)
+    crash_type: str
+    key_indicators: list[str]
+    reasoning: str
+
+
+class CaseVerdict(BaseModel):
+    """Verdict for one case of a batched (multi-alert) request."""
+
+    case_id: str
+    verdict: CrashVerdict
+
+
+class CrashVerdictBatch(BaseModel):
+    """Schema of a batched response: one verdict per case."""
+
+    verdicts: list[CaseVerdict]
+
+
+_NUMBER = r"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)(?=\s*[,}\]])"
+_STRING = r'"((?:[^"\\]|\\.)*)"'
+_FIELD_PATTERNS: dict[str, re.Pattern[str]] = {
+    "is_crash": re.compile(r'"is_crash"\s*:\s*(true|false)'),
+    "severity": re.compile(r'"severity"\s*:\s*"(low|medium|high)"'),
+    "confidence": re.compile(r'"confidence"\s*:\s*' + _NUMBER),
+    "false_positive_risk": re.compile(r'"false_positive_risk"\s*:\s*' + _NUMBER),
+    "crash_type": re.compile(r'"crash_type"\s*:\s*' + _STRING),
+    "key_indicators": re.compile(r'"key_indicators"\s*:\s*(\[[^\]]*\])'),
+    "reasoning": re.compile(r'"reasoning"\s*:\s*' + _STRING),
+}
+
+
+class IncrementalVerdictParser:
+    """Extracts completed top-level verdict fields from a partially streamed JSON object."""
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.text = ""
+        self.fields: dict[str, Any] = {}
+
+    def feed(self, chunk: str) -> bool:
+        """Append a streamed chunk and pick up any fields it completed.
+
+        Args:
+            chunk: Next piece of response text
+
+        Returns:
+            True once all ``EARLY_EXIT_FIELDS`` are available
+
+        """
+        self.text += chunk
+        for name, pattern in _FIELD_PATTERNS.items():
+            if name in self.fields:
+                continue
+            match = pattern.search(self.text)
+            if match is None:
+                continue
+            raw = match.group(1)
+            if name == "is_crash":
+                self.fields[name] = raw == "true"
+            elif name in ("confidence", "false_positive_risk"):
+                self.fields[name] = float(raw)
+            elif name == "key_indicators":
+                self.fields[name] = json.loads(raw)
+            elif name == "severity":
+                self.fields[name] = raw
+            else:
+                self.fields[name] = json.loads(f'"{raw}"')
+        return self.ready
+
+    @property
+    def ready(self) -> bool:
+        """Return whether every field needed for a decision has arrived."""
+        return all(name in self.fields for name in EARLY_EXIT_FIELDS)
+
+    def verdict(self) -> dict[str, Any]:
+        """Return the verdict so far, filling fields that had not streamed yet."""
+        confidence = self.fields["confidence"]
+        return {
+            "false_positive_risk": 1.0 - confidence if self.fields["is_crash"] else confidence,
+            "crash_type": "unknown",
+            "key_indicators": [],
+            "reasoning": "Dismissed from streamed response (reasoning not awaited)",
+            **self.fields,
+        }
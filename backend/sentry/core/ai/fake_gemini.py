@@ -0,0 +1,363 @@
+"""Local stand-in for the Gemini API, for load, latency and failure-path testing.
+
+Serves the subset of the Generative Language REST API that ``GeminiService``
+uses (``models.list``, ``generateContent`` and SSE ``streamGenerateContent``)
+with schema-valid crash verdicts. Point the client at it with
+``GEMINI_BASE_URL=http://127.0.0.1:<port>`` (any ``GEMINI_API_KEY`` works).
+
+Verdicts are deterministic per prompt: alerts whose ``g_peak`` feature reaches
+``crash_g`` are crashes; prompts without features fall back to a hash of the
+prompt. Latency, error rate, missing models and stream pacing are configurable,
+and request volume is exposed at ``GET /_fake/stats`` (reset with
+``POST /_fake/reset``).
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+ROUTE = re.compile(r"^/(?P<version>v1\w*)/models(?:/(?P<model>[^/:]+)(?::(?P<method>\w+))?)?$")
+CASE_HEADER = re.compile(r"^### case (\S+)$", re.MULTILINE)
+G_PEAK = re.compile(r"\bg_peak=(-?\d+(?:\.\d+)?(?:e[-+]?\d+)?)")
+DEFAULT_MODELS = ("gemini-2.0-flash-exp", "gemini-2.5-flash", "gemini-2.5-pro", "gemini-pro")
+CHARS_PER_TOKEN = 4
+ERROR_STATUS_NAMES = {
+    HTTPStatus.NOT_FOUND: "NOT_FOUND",
+    HTTPStatus.TOO_MANY_REQUESTS: "RESOURCE_EXHAUSTED",
+    HTTPStatus.INTERNAL_SERVER_ERROR: "INTERNAL",
+    HTTPStatus.SERVICE_UNAVAILABLE: "UNAVAILABLE",
+    HTTPStatus.GATEWAY_TIMEOUT: "DEADLINE_EXCEEDED",
+}
+
+
+@dataclass(slots=True)
+class FakeGeminiConfig:
+    """Behaviour of the fake endpoint.
+
+    Attributes:
+        models: Model names listed by ``models.list`` and served
+        missing_models: Model names that answer 404 NOT_FOUND
+        latency_ms: Median time to first byte of a response
+        latency_sigma: Log-normal spread of the latency (0 for a fixed latency)
+        error_rate: Share of generate requests failing with ``error_status``
+        error_status: HTTP status of injected failures (429, 500, 503 or 504)
+        stream_chunk_chars: Characters of verdict JSON per streamed chunk
+        stream_chunk_delay_ms: Pause between streamed chunks
+        crash_g: g_peak at or above which a verdict is a crash
+        crash_rate: Share of crash verdicts for prompts without a g_peak feature
+        seed: Seed of the latency and error draws
+
+    """
+
+    models: list[str] = field(default_factory=lambda: list(DEFAULT_MODELS))
+    missing_models: list[str] = field(default_factory=list)
+    latency_ms: float = 800.0
+    latency_sigma: float = 0.35
+    error_rate: float = 0.0
+    error_status: int = HTTPStatus.SERVICE_UNAVAILABLE
+    stream_chunk_chars: int = 24
+    stream_chunk_delay_ms: float = 40.0
+    crash_g: float = 3.0
+    crash_rate: float = 0.5
+    seed: int = 0
+
+
+def fake_verdict(prompt: str, config: FakeGeminiConfig) -> dict[str, Any]:
+    """Return a deterministic, schema-valid verdict for one case prompt."""
+    digest = int.from_bytes(hashlib.sha256(prompt.encode()).digest()[:8], "big") / 2**64
+    match = G_PEAK.search(prompt)
+    if match:
+        g_peak = float(match.group(1))
+        is_crash = g_peak >= config.crash_g
+        margin = min(abs(g_peak - config.crash_g) / config.crash_g, 1.0)
+    else:
+        g_peak = None
+        is_crash = digest < config.crash_rate
+        margin = abs(digest - config.crash_rate)
+    confidence = round(0.55 + 0.4 * margin, 2)
+    if not is_crash:
+        severity = "low"
+    elif g_peak is not None and g_peak >= 2 * config.crash_g:
+        severity = "high"
+    else:
+        severity = "medium"
+    return {
+        "is_crash": is_crash,
+        "severity": severity,
+        "confidence": confidence,
+        "false_positive_risk": round(1.0 - confidence, 2),
+        "crash_type": "impact" if is_crash else "false_positive",
+        "key_indicators": ["high_g_force"] if is_crash else [],
+        "reasoning": f"Fake verdict (g_peak={g_peak if g_peak is not None else 'n/a'}, threshold={config.crash_g}g).",
+    }
+
+
+def fake_response_text(prompt: str, config: FakeGeminiConfig) -> str:
+    """Return the JSON text answering a single or batched (``### case`` sections) prompt."""
+    headers = list(CASE_HEADER.finditer(prompt))
+    if not headers:
+        return json.dumps(fake_verdict(prompt, config))
+    verdicts = []
+    for index, header in enumerate(headers):
+        end = headers[index + 1].start() if index + 1 < len(headers) else len(prompt)
+        case_prompt = prompt[header.end() : end]
+        verdicts.append({"case_id": header.group(1), "verdict": fake_verdict(case_prompt, config)})
+    return json.dumps({"verdicts": verdicts})
+
+
+def _prompt_text(body: dict[str, Any]) -> tuple[str, str]:
+    """Return the (system instruction, user prompt) text of a generate request body."""
+
+    def text_of(content: dict[str, Any] | None) -> str:
+        return "".join(part.get("text", "") for part in (content or {}).get("parts", []))
+
+    system = text_of(body.get("systemInstruction") or body.get("system_instruction"))
+    prompt = "".join(text_of(content) for content in body.get("contents", []))
+    return system, prompt
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    """Request handler of ``FakeGeminiServer`` (one instance per request)."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_FakeHTTPServer"
+
+    @property
+    def fake(self) -> "FakeGeminiServer":
+        """Return the fake server whose config and counters this request uses."""
+        return self.server.fake
+
+    def log_message(self, fmt: str, *args: Any) -> None:  # noqa: ANN401
+        """Route http.server's access log to the debug logger."""
+        logger.debug("[FAKE-GEMINI] " + fmt, *args)  # noqa: G003
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str) -> None:
+        status_name = ERROR_STATUS_NAMES.get(status, "UNKNOWN")
+        self._send_json(status, {"error": {"code": status, "message": message, "status": status_name}})
+
+    def _read_body(self) -> dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self) -> None:
+        """Serve ``models.list``, ``models.get`` and ``/_fake/stats``."""
+        path = urlsplit(self.path).path
+        if path == "/_fake/stats":
+            self._send_json(HTTPStatus.OK, self.fake.stats())
+            return
+        route = ROUTE.match(path)
+        if route is None or route["method"]:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {path}")
+            return
+        model = route["model"]
+        if model is None:
+            self.fake._record("*", "list", HTTPStatus.OK)  # noqa: SLF001
+            served = [name for name in self.fake.config.models if name not in self.fake.config.missing_models]
+            self._send_json(HTTPStatus.OK, {"models": [_model_info(name) for name in served]})
+        elif model in self.fake.config.missing_models or model not in self.fake.config.models:
+            self.fake._record(model, "get", HTTPStatus.NOT_FOUND)  # noqa: SLF001
+            self._send_error(HTTPStatus.NOT_FOUND, f"models/{model} is not found")
+        else:
+            self.fake._record(model, "get", HTTPStatus.OK)  # noqa: SLF001
+            self._send_json(HTTPStatus.OK, _model_info(model))
+
+    def do_POST(self) -> None:
+        """Serve ``generateContent``, ``streamGenerateContent`` and ``/_fake/reset``."""
+        path = urlsplit(self.path).path
+        if path == "/_fake/reset":
+            self.fake.reset_stats()
+            self._send_json(HTTPStatus.OK, {"reset": True})
+            return
+        route = ROUTE.match(path)
+        method = route["method"] if route else None
+        if method not in ("generateContent", "streamGenerateContent"):
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {path}")
+            return
+        model = route["model"]  # type: ignore[index]
+        body = self._read_body()
+        if model in self.fake.config.missing_models or model not in self.fake.config.models:
+            self.fake._record(model, method, HTTPStatus.NOT_FOUND)  # noqa: SLF001
+            self._send_error(HTTPStatus.NOT_FOUND, f"models/{model} is not found for API version")
+            return
+
+        latency, failed = self.fake._enter()  # noqa: SLF001
+        try:
+            time.sleep(latency)
+            if failed:
+                status = self.fake.config.error_status
+                self.fake._record(model, method, status)  # noqa: SLF001
+                self._send_error(status, "Injected failure from fake Gemini server")
+                return
+            system, prompt = _prompt_text(body)
+            text = fake_response_text(prompt, self.fake.config)
+            usage = {
+                "promptTokenCount": (len(system) + len(prompt)) // CHARS_PER_TOKEN,
+                "candidatesTokenCount": len(text) // CHARS_PER_TOKEN,
+                "totalTokenCount": (len(system) + len(prompt) + len(text)) // CHARS_PER_TOKEN,
+            }
+            self.fake._record(model, method, HTTPStatus.OK)  # noqa: SLF001
+            if method == "generateContent":
+                self._send_json(HTTPStatus.OK, _response_chunk(model, text, "STOP", usage))
+            else:
+                self._stream(model, text, usage)
+        finally:
+            self.fake._leave()  # noqa: SLF001
+
+    def _stream(self, model: str, text: str, usage: dict[str, int]) -> None:
+        """Send the verdict as paced SSE chunks, stopping quietly if the client hangs up."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        step = max(self.fake.config.stream_chunk_chars, 1)
+        pieces = [text[i : i + step] for i in range(0, len(text), step)]
+        try:
+            for index, piece in enumerate(pieces):
+                last = index == len(pieces) - 1
+                chunk = _response_chunk(model, piece, "STOP" if last else None, usage if last else None)
+                self.wfile.write(f"data: {json.dumps(chunk)}\r\n\r\n".encode())
+                self.wfile.flush()
+                if not last:
+                    time.sleep(self.fake.config.stream_chunk_delay_ms / 1000)
+        except (BrokenPipeError, ConnectionResetError):
+            logger.debug("[FAKE-GEMINI] Client closed the stream early (model=%s)", model)
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server that hands its requests the owning ``FakeGeminiServer``."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], fake: "FakeGeminiServer") -> None:
+        super().__init__(address, FakeGeminiHandler)
+        self.fake = fake
+
+
+class FakeGeminiServer:
+    """Threaded HTTP server emulating the Gemini endpoints ``GeminiService`` calls.
+
+    Usable in-process (``with FakeGeminiServer(config) as server: ...``) or via the
+    ``run_fake_gemini`` management command.
+    """
+
+    def __init__(self, config: FakeGeminiConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Bind the server (port 0 picks a free port); call ``start`` to serve."""
+        self.config = config or FakeGeminiConfig()
+        self._rng = random.Random(self.config.seed)  # noqa: S311 - test traffic, not security
+        self._lock = threading.Lock()
+        self._requests: Counter[str] = Counter()
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._started = time.monotonic()
+        self._httpd = _FakeHTTPServer((host, port), self)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        """URL to use as ``GEMINI_BASE_URL``."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> Self:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="fake-gemini", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> Self:  # noqa: D105
+        return self.start()
+
+    def __exit__(self, *_exc: object) -> None:  # noqa: D105
+        self.stop()
+
+    def stats(self) -> dict[str, Any]:
+        """Return request counts keyed ``"<model>:<method>:<status>"`` and concurrency."""
+        with self._lock:
+            elapsed = time.monotonic() - self._started
+            total = sum(self._requests.values())
+            return {
+                "requests": dict(self._requests),
+                "total": total,
+                "requests_per_second": total / elapsed if elapsed else 0.0,
+                "in_flight": self._in_flight,
+                "max_in_flight": self._max_in_flight,
+                "elapsed_seconds": elapsed,
+                "config": asdict(self.config),
+            }
+
+    def reset_stats(self) -> None:
+        """Clear request counters."""
+        with self._lock:
+            self._requests.clear()
+            self._max_in_flight = self._in_flight
+            self._started = time.monotonic()
+
+    def _record(self, model: str, method: str, status: int) -> None:
+        with self._lock:
+            self._requests[f"{model}:{method}:{status}"] += 1
+
+    def _enter(self) -> tuple[float, bool]:
+        """Count an in-flight generate request and draw its latency and failure."""
+        with self._lock:
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+            latency = self.config.latency_ms * self._rng.lognormvariate(0.0, self.config.latency_sigma)
+            failed = self._rng.random() < self.config.error_rate
+        return latency / 1000, failed
+
+    def _leave(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+def _model_info(name: str) -> dict[str, Any]:
+    return {
+        "name": f"models/{name}",
+        "displayName": name,
+        "supportedGenerationMethods": ["generateContent", "streamGenerateContent"],
+    }
+
+
+def _response_chunk(
+    model: str,
+    text: str,
+    finish_reason: str | None,
+    usage: dict[str, int] | None,
+) -> dict[str, Any]:
+    candidate: dict[str, Any] = {"content": {"role": "model", "parts": [{"text": text}]}, "index": 0}
+    if finish_reason:
+        candidate["finishReason"] = finish_reason
+    chunk: dict[str, Any] = {"candidates": [candidate], "modelVersion": model}
+    if usage:
+        chunk["usageMetadata"] = usage
+    return chunk
@@ -2,45 +2,153 @@
 
 import json
 import logging
-from typing import Any
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
 
 try:
     import google.genai as genai
 except ImportError:
     genai = None  # type: ignore
 
+from django.core.cache import caches
+from pydantic import BaseModel
 from sentry.settings.config import settings as app_settings
 
+from core.ai.circuit_breaker import CircuitBreaker
+from core.ai.crash_prompt import (
+    BATCH_INSTRUCTION,
+    SYSTEM_INSTRUCTION,
+    build_batch_prompt,
+    build_crash_prompt,
+    estimate_tokens,
+)
+from core.ai.crash_verdict import CrashVerdict, CrashVerdictBatch, IncrementalVerdictParser
+
+if TYPE_CHECKING:
+    from device.services.sensor_window import SensorWindow
+
 logger = logging.getLogger(__name__)
 
 
+MODEL_CACHE_KEY = "gemini:resolved_model:{configured}"
+MODEL_CACHE_FAILURE_SECONDS = 60  # Retry listing sooner if it failed
+
+# Fallback models (newer models that should work), raced after the configured one.
+# v1beta API has deprecated many models, so we try multiple options
+FALLBACK_MODELS = [
+    "gemini-2.0-flash-exp",
+    "gemini-2.5-flash",
+    "gemini-pro",
+]
+
+_client_lock = threading.Lock()
+_client: Any = None
+_client_pid: int | None = None
+_executor: ThreadPoolExecutor | None = None
+_executor_pid: int | None = None
+
+gemini_circuit_breaker = CircuitBreaker(
+    "gemini",
+    window_seconds=app_settings.gemini_breaker_window_seconds,
+    min_calls=app_settings.gemini_breaker_min_calls,
+    failure_rate=app_settings.gemini_breaker_failure_rate,
+    slow_call_seconds=app_settings.gemini_breaker_slow_call_seconds,
+    open_seconds=app_settings.gemini_breaker_open_seconds,
+)
+
+
+def get_gemini_client() -> Any:  # noqa: ANN401
+    """Return the process-wide Gemini client, creating it on first use.
+
+    The client is rebuilt after a fork so workers never share a connection pool
+    inherited from the parent process.
+
+    Returns:
+        The ``genai.Client``, or None if the package or API key is missing
+
+    """
+    global _client, _client_pid  # noqa: PLW0603
+
+    if _client is not None and _client_pid == os.getpid():
+        return _client
+    if genai is None:
+        logger.warning("google-genai package not installed")
+        return None
+    if not app_settings.gemini_api_key:
+        logger.warning("Gemini API key not configured")
+        return None
+
+    with _client_lock:
+        if _client is None or _client_pid != os.getpid():
+            try:
+                _client = genai.Client(
+                    api_key=app_settings.gemini_api_key,
+                    http_options=genai.types.HttpOptions(
+                        timeout=int(app_settings.gemini_request_timeout_seconds * 1000),
+                        base_url=app_settings.gemini_base_url,
+                    ),
+                )
+                _client_pid = os.getpid()
+            except Exception as e:
+                logger.error("Failed to initialize Gemini client: %s", e)
+                return None
+    return _client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool used for hedged model requests."""
+    global _executor, _executor_pid  # noqa: PLW0603
+
+    with _client_lock:
+        if _executor is None or _executor_pid != os.getpid():
+            _executor = ThreadPoolExecutor(
+                max_workers=max(2, app_settings.gemini_hedge_max_in_flight) * 4,
+                thread_name_prefix="gemini",
+            )
+            _executor_pid = os.getpid()
+    return _executor
+
+
+def remember_model_name(model_name: str, timeout: int | None = None) -> None:
+    """Share a working model name with every worker on this host."""
+    caches["shared"].set(
+        MODEL_CACHE_KEY.format(configured=app_settings.gemini_model),
+        model_name,
+        timeout if timeout is not None else app_settings.gemini_model_cache_seconds,
+    )
+
+
 class GeminiService:
-    """Service for interacting with Google Gemini AI."""
+    """Service for interacting with Google Gemini AI.
+
+    Cheap to construct: the client is process-wide and the resolved model name
+    is cached across workers, so an alert costs a single model call.
+    """
 
     def __init__(self) -> None:
         """Initialize Gemini service."""
-        self.client = None
+        self.client = get_gemini_client()
         self.model_name = app_settings.gemini_model
 
-        if genai is None:
-            logger.warning("google-genai package not installed")
-            return
-
-        if not app_settings.gemini_api_key:
-            logger.warning("Gemini API key not configured")
+        if self.client is None:
             return
 
-        # Initialize client with API key
-        try:
-            self.client = genai.Client(api_key=app_settings.gemini_api_key)
+        cached = caches["shared"].get(MODEL_CACHE_KEY.format(configured=app_settings.gemini_model))
+        if cached:
+            self.model_name = cached
+        else:
             # Try to list available models to verify connection and find working model
             self._verify_model_availability()
-        except Exception as e:
-            logger.error("Failed to initialize Gemini client: %s", e)
-            self.client = None
 
     def _verify_model_availability(self) -> None:
-        """Verify that the configured model is available, or suggest alternatives."""
+        """Verify that the configured model is available, or suggest alternatives.
+
+        The outcome is cached (see ``remember_model_name``) so other workers skip the listing.
+        """
         if self.client is None:
             return
         
@@ -77,93 +185,36 @@ class GeminiService:
                                 suggested,
                             )
                             break
+            remember_model_name(self.model_name)
         except Exception as e:
             logger.warning("Could not list available models: %s", e)
+            remember_model_name(self.model_name, timeout=MODEL_CACHE_FAILURE_SECONDS)
 
-    def format_sensor_data_for_ai(
-        self,
-        sensor_data: list[dict[str, Any]],
-        current_reading: dict[str, Any],
-        include_metrics: bool = True,
-        crash_events: list[dict[str, Any]] | None = None,
-    ) -> str:
-        """Format sensor data for AI analysis.
-
-        Args:
-            sensor_data: List of sensor readings from database
-            current_reading: Current sensor reading that triggered alert
-            include_metrics: Whether to include calculated metrics
-            crash_events: Optional list of recent crash events for context
-
-        Returns:
-            Formatted string for AI prompt
-        """
-        lines = ["=== SENSOR DATA CONTEXT ==="]
-
-        # Add recent sensor data
-        if sensor_data:
-            lines.append(f"\nRecent sensor readings ({len(sensor_data)} readings):")
-            for reading in sensor_data[-10:]:  # Last 10 readings
-                lines.append(
-                    f"  - Time: {reading.get('timestamp', 'N/A')}, "
-                    f"Accel: ({reading.get('ax', 0):.2f}, {reading.get('ay', 0):.2f}, {reading.get('az', 0):.2f}), "
-                    f"Tilt: roll={reading.get('roll', 0):.1f}°, pitch={reading.get('pitch', 0):.1f}°"
-                )
-
-        # Add crash event history if available
-        if crash_events:
-            lines.append("\n=== RECENT CRASH EVENT HISTORY ===")
-            for i, event in enumerate(crash_events, 1):
-                status = "CONFIRMED CRASH" if event.get("is_confirmed_crash") else "FALSE POSITIVE"
-                lines.append(
-                    f"  Event {i}: {status} | "
-                    f"Time: {event.get('crash_timestamp', 'N/A')} | "
-                    f"Severity: {event.get('severity', 'unknown')} | "
-                    f"Confidence: {event.get('confidence_score', 0):.2f} | "
-                    f"Type: {event.get('crash_type', 'unknown')} | "
-                    f"Max G-force: {event.get('max_g_force', 0):.2f}g"
-                )
-            lines.append(
-                "\nNote: Consider recent crash patterns when analyzing. "
-                "Multiple false positives may indicate a pattern (e.g., aggressive riding, sensor issues). "
-                "Recent confirmed crashes may indicate follow-up impacts or related incidents."
-            )
-
-        # Add current reading (the one that triggered alert)
-        lines.append("\n=== CURRENT READING (ALERT TRIGGER) ===")
-        lines.append(
-            f"Acceleration: ({current_reading.get('ax', 0):.2f}, "
-            f"{current_reading.get('ay', 0):.2f}, {current_reading.get('az', 0):.2f})"
-        )
-        lines.append(
-            f"Tilt: roll={current_reading.get('roll', 0):.1f}°, pitch={current_reading.get('pitch', 0):.1f}°"
-        )
-        lines.append(f"Tilt detected: {current_reading.get('tilt_detected', False)}")
-
-        if include_metrics:
-            # Calculate G-force for current reading
-            ax = current_reading.get("ax", 0)
-            ay = current_reading.get("ay", 0)
-            az = current_reading.get("az", 0)
-            g_force = (ax**2 + ay**2 + az**2) ** 0.5 / 9.81
-            lines.append(f"Calculated G-force: {g_force:.2f}g")
-
-        return "\n".join(lines)
-
-    def analyze_crash_data(
+    def analyze_crash_data(  # noqa: PLR0913
         self,
-        sensor_data: list[dict[str, Any]],
+        sensor_window: "SensorWindow",
         current_reading: dict[str, Any],
         context_seconds: int = 30,
         crash_events: list[dict[str, Any]] | None = None,
+        features: dict[str, Any] | None = None,
+        fallback: dict[str, Any] | None = None,
+        stats: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Analyze crash data using Gemini AI.
 
+        Calls are guarded by ``gemini_circuit_breaker``: while the circuit is open
+        no request is made and ``fallback`` is returned straight away.
+
         Args:
-            sensor_data: List of sensor readings from database
+            sensor_window: Recent sensor readings (columnar window, oldest first)
             current_reading: Current sensor reading that triggered alert
             context_seconds: Number of seconds of context to analyze
             crash_events: Optional list of recent crash events for enhanced context
+            features: Optional window features sent in place of raw readings
+            fallback: Verdict to return when AI is unavailable (defaults to ``_default_response()``)
+            stats: Optional dict filled with call statistics: ``outcome`` ('gemini',
+                'no_api_key', 'circuit_open', 'no_client' or 'error'), ``model``,
+                ``latency_ms``, ``prompt_chars``, ``prompt_tokens``, ``output_tokens``
 
         Returns:
             Dictionary containing AI analysis results:
@@ -177,68 +228,61 @@ class GeminiService:
                 'false_positive_risk': float (0-1)
             }
         """
+        stats = {} if stats is None else stats
+        started = time.monotonic()
+        try:
+            return self._analyze_crash_data(
+                sensor_window=sensor_window,
+                current_reading=current_reading,
+                context_seconds=context_seconds,
+                crash_events=crash_events,
+                features=features,
+                fallback=fallback,
+                stats=stats,
+            )
+        finally:
+            stats["latency_ms"] = (time.monotonic() - started) * 1000
+            stats.setdefault("model", self.model_name)
+
+    def _analyze_crash_data(  # noqa: PLR0913
+        self,
+        sensor_window: "SensorWindow",
+        current_reading: dict[str, Any],
+        context_seconds: int,
+        crash_events: list[dict[str, Any]] | None,
+        features: dict[str, Any] | None,
+        fallback: dict[str, Any] | None,
+        stats: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Run one analysis, recording its outcome in ``stats`` (see ``analyze_crash_data``)."""
         if not app_settings.gemini_api_key:
             logger.error("Gemini API key not configured")
-            return self._default_response()
+            stats["outcome"] = "no_api_key"
+            return fallback or self._default_response()
 
         try:
-            # Format sensor data with crash event history
-            formatted_data = self.format_sensor_data_for_ai(
-                sensor_data=sensor_data,
+            # Compact numeric encoding within a token budget that scales with the lookback;
+            # the static instructions travel separately as the system instruction
+            prompt = build_crash_prompt(
+                sensor_window=sensor_window,
                 current_reading=current_reading,
-                include_metrics=True,
+                context_seconds=context_seconds,
                 crash_events=crash_events,
+                features=features,
             )
 
-            # Create prompt with crash event history context
-            crash_history_note = ""
-            if crash_events:
-                confirmed_count = sum(1 for e in crash_events if e.get("is_confirmed_crash"))
-                false_positive_count = len(crash_events) - confirmed_count
-                crash_history_note = f"""
-
-CRASH EVENT HISTORY CONTEXT:
-- Recent events in this time window: {len(crash_events)}
-- Confirmed crashes: {confirmed_count}
-- False positives: {false_positive_count}
-
-IMPORTANT: Consider this history when analyzing:
-- Multiple false positives may indicate a pattern (aggressive riding, sensor issues, threshold too sensitive)
-- Recent confirmed crashes may indicate follow-up impacts or related incidents
-- Use this context to improve accuracy and reduce false positives"""
-
-            # Create prompt
-            prompt = f"""You are analyzing sensor data from a motorcycle helmet crash detection system. 
-A threshold alert was triggered (G-force or tilt exceeded limits).
-
-{formatted_data}{crash_history_note}
-
-Analyze this data and determine if this represents an actual crash event or a false positive (e.g., sudden braking, helmet removal, normal riding).
-
-Respond with a JSON object containing:
-{{
-    "is_crash": boolean,
-    "confidence": float (0.0 to 1.0),
-    "severity": "low" | "medium" | "high",
-    "crash_type": string (e.g., "frontal_impact", "side_impact", "fall", "false_positive"),
-    "reasoning": string (brief explanation),
-    "key_indicators": array of strings (e.g., ["high_g_force", "sudden_tilt", "sustained_acceleration"]),
-    "false_positive_risk": float (0.0 to 1.0)
-}}
-
-Important considerations:
-- High G-force alone might be sudden braking (false positive)
-- Sustained tilt might indicate actual crash or helmet removal
-- Look at the pattern over time, not just the current reading
-- Consider motorcycle riding context (acceleration, braking, cornering)
-- Use crash event history to identify patterns and improve accuracy
-
-Respond with ONLY the JSON object, no additional text."""
+            stats["prompt_chars"] = len(prompt)
 
             # Call Gemini API
             if self.client is None:
                 logger.error("Gemini client not initialized")
-                return self._default_response()
+                stats["outcome"] = "no_client"
+                return fallback or self._default_response()
+
+            if not gemini_circuit_breaker.allow_request():
+                logger.warning("[BREAKER] Gemini circuit open - using fallback verdict without calling AI")
+                stats["outcome"] = "circuit_open"
+                return fallback or self._default_response()
 
             # Log comprehensive AI analysis request
             logger.info(
@@ -246,9 +290,9 @@ Respond with ONLY the JSON object, no additional text."""
                 "sensor_data_points=%s | context_seconds=%s | "
                 "current_reading: ax=%.2f, ay=%.2f, az=%.2f | "
                 "roll=%.1f deg, pitch=%.1f deg | "
-                "tilt_detected=%s | prompt_length=%s",
+                "tilt_detected=%s | prompt_length=%s | prompt_tokens_est=%s",
                 self.model_name,
-                len(sensor_data),
+                len(sensor_window),
                 context_seconds,
                 current_reading.get('ax', 0),
                 current_reading.get('ay', 0),
@@ -257,109 +301,15 @@ Respond with ONLY the JSON object, no additional text."""
                 current_reading.get('pitch', 0),
                 current_reading.get('tilt_detected', False),
                 len(prompt),
+                estimate_tokens(prompt),
             )
 
-            # Generate content using the new API
-            # Note: The exact API structure for google.genai may vary
-            # Please refer to the official documentation: https://github.com/google-gemini/generative-ai-python
-            
-            # Try different model name formats and fallback models
-            # v1beta API has deprecated many models, so we try multiple options
-            models_to_try = [
-                self.model_name,  # Try configured model first
-                f"models/{self.model_name}",  # Try with models/ prefix
-            ]
-            
-            # Add fallback models (newer models that should work)
-            fallback_models = [
-                "gemini-2.0-flash-exp",
-                "models/gemini-2.0-flash-exp",
-                "gemini-2.5-flash",
-                "models/gemini-2.5-flash",
-                "gemini-pro",
-                "models/gemini-pro",
-            ]
-            
-            # Only add fallbacks if they're different from configured model
-            for fallback in fallback_models:
-                if fallback not in models_to_try and self.model_name not in fallback:
-                    models_to_try.append(fallback)
-            
-            response = None
-            last_error = None
-            for model_to_try in models_to_try:
-                try:
-                    logger.debug("[DEBUG] Trying model: %s", model_to_try)
-                    response = self.client.models.generate_content(
-                        model=model_to_try,
-                        contents=prompt,
-                    )
-                    # Success! Update model_name for future use
-                    if model_to_try != self.model_name and model_to_try != f"models/{self.model_name}":
-                        logger.info(
-                            "[INFO] Successfully using fallback model: %s (configured: %s)",
-                            model_to_try,
-                            self.model_name,
-                        )
-                        # Store without models/ prefix for consistency
-                        self.model_name = model_to_try.split("/")[-1]
-                    break
-                except Exception as e:
-                    last_error = e
-                    error_str = str(e)
-                    # If it's a 404/model not found, try next model
-                    if "404" in error_str or "not found" in error_str.lower():
-                        continue
-                    # For other errors, re-raise immediately
-                    raise
-            
-            if response is None:
-                # All models failed
-                raise last_error or Exception("All model attempts failed")
-
-            # Parse response - access text from the response object
-            # The exact structure may vary between API versions, so we handle multiple formats
-            response_text = ""
-            if hasattr(response, 'text'):
-                response_text = response.text.strip()
-            elif hasattr(response, 'candidates') and response.candidates:
-                # Handle candidate-based response structure
-                if hasattr(response.candidates[0], 'content'):
-                    if hasattr(response.candidates[0].content, 'parts'):
-                        response_text = response.candidates[0].content.parts[0].text.strip()
-                    elif hasattr(response.candidates[0].content, 'text'):
-                        response_text = response.candidates[0].content.text.strip()
-            elif hasattr(response, 'content'):
-                # Handle direct content attribute
-                if hasattr(response.content, 'text'):
-                    response_text = response.content.text.strip()
-                elif hasattr(response.content, 'parts'):
-                    response_text = response.content.parts[0].text.strip()
-            
-            if not response_text:
-                # Fallback: try to extract text from response string representation
-                logger.warning("Could not extract text from response, using string representation")
-                response_text = str(response).strip()
-
-            # Remove markdown code blocks if present
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
-
-            # Parse JSON
-            result = json.loads(response_text)
+            # Race the configured model against fallbacks; first valid JSON verdict wins
+            result = self._guarded_generate(prompt)
+            stats.update(result.pop("_usage", {}), outcome="gemini", model=self.model_name)
 
             # Validate and sanitize response
-            ai_result = {
-                "is_crash": bool(result.get("is_crash", False)),
-                "confidence": float(result.get("confidence", 0.5)),
-                "severity": result.get("severity", "low"),
-                "crash_type": str(result.get("crash_type", "unknown")),
-                "reasoning": str(result.get("reasoning", "Analysis completed")),
-                "key_indicators": result.get("key_indicators", []),
-                "false_positive_risk": float(result.get("false_positive_risk", 0.5)),
-            }
+            ai_result = self._sanitize_verdict(result)
 
             # Log comprehensive AI analysis result
             logger.info(
@@ -389,10 +339,11 @@ Respond with ONLY the JSON object, no additional text."""
                 "error=%s | response_text_length=%s | response_preview=%s...",
                 self.model_name,
                 str(e),
-                len(response_text),
-                response_text[:200],
+                len(e.doc),
+                e.doc[:200],
             )
-            return self._default_response()
+            stats["outcome"] = "error"
+            return fallback or self._default_response()
         except Exception as e:
             error_str = str(e)
             logger.error(
@@ -410,7 +361,338 @@ Respond with ONLY the JSON object, no additional text."""
                     self.model_name,
                 )
             
-            return self._default_response()
+            stats["outcome"] = "error"
+            return fallback or self._default_response()
+        finally:
+            # No-op once the call was recorded; frees the half-open probe slot otherwise
+            gemini_circuit_breaker.release_probe()
+
+    def analyze_crash_batch(self, cases: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Analyze several alerts with a single multi-case request.
+
+        Args:
+            cases: Keyword arguments of ``analyze_crash_data`` for each alert
+
+        Returns:
+            One analysis result per case, in order. Cases missing from the response
+            are analysed individually; on failure each case gets its ``fallback``.
+            Each case's ``stats`` dict (if given) gets the batch's outcome, model and
+            ``batch_size``, with token usage split evenly across the cases.
+
+        """
+        if len(cases) == 1:
+            return [self.analyze_crash_data(**cases[0])]
+
+        def fallbacks(outcome: str) -> list[dict[str, Any]]:
+            for case in cases:
+                self._annotate_batch_case(case, outcome, len(cases))
+            return [case.get("fallback") or self._default_response() for case in cases]
+
+        if not app_settings.gemini_api_key or self.client is None:
+            logger.error("Gemini client not initialized")
+            return fallbacks("no_client")
+        case_prompts = {
+            str(i): build_crash_prompt(
+                sensor_window=case["sensor_window"],
+                current_reading=case["current_reading"],
+                context_seconds=case.get("context_seconds", 30),
+                crash_events=case.get("crash_events"),
+                features=case.get("features"),
+            )
+            for i, case in enumerate(cases, 1)
+        }
+        prompt = build_batch_prompt(case_prompts)
+        # Checked last: nothing between here and _guarded_generate, which records the
+        # outcome, may leave a half-open probe slot claimed
+        if not gemini_circuit_breaker.allow_request():
+            logger.warning("[BREAKER] Gemini circuit open - using fallback verdicts for %s batched alerts", len(cases))
+            return fallbacks("circuit_open")
+        logger.info(
+            "[AI] Calling Gemini AI for %s batched crash analyses | model=%s | prompt_length=%s | prompt_tokens_est=%s",
+            len(cases),
+            self.model_name,
+            len(prompt),
+            estimate_tokens(prompt),
+        )
+
+        try:
+            response = self._guarded_generate(prompt, batch=True)
+        except Exception:
+            logger.exception("[ERROR] Batched Gemini analysis failed | model=%s", self.model_name)
+            return fallbacks("error")
+
+        return self._split_batch_response(cases, case_prompts, response)
+
+    def _split_batch_response(
+        self,
+        cases: list[dict[str, Any]],
+        case_prompts: dict[str, str],
+        response: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Match a multi-case response back to its cases, in order.
+
+        Args:
+            cases: Keyword arguments of ``analyze_crash_data`` for each alert
+            case_prompts: Prompt per case ID, as sent in the batch
+            response: Parsed batch response (with ``_usage``)
+
+        Returns:
+            One analysis result per case; cases missing from the response are analysed individually
+
+        """
+        usage = response.pop("_usage", {})
+        verdicts = {item["case_id"]: item["verdict"] for item in response["verdicts"]}
+        results = []
+        for case_id, case in zip(case_prompts, cases, strict=True):
+            if case_id in verdicts:
+                self._annotate_batch_case(
+                    case,
+                    "gemini",
+                    len(cases),
+                    prompt_chars=len(case_prompts[case_id]),
+                    **{
+                        name: round(count / len(cases)) if count is not None else None
+                        for name, count in usage.items()
+                    },
+                )
+                results.append(self._sanitize_verdict(verdicts[case_id]))
+            else:
+                logger.warning("[WARN] Case %s missing from batched response - analysing individually", case_id)
+                results.append(self.analyze_crash_data(**case))
+        return results
+
+    def _annotate_batch_case(self, case: dict[str, Any], outcome: str, batch_size: int, **values: Any) -> None:  # noqa: ANN401
+        """Record a batched case's outcome in its ``stats`` dict, if it has one."""
+        if case.get("stats") is not None:
+            case["stats"].update(outcome=outcome, model=self.model_name, batch_size=batch_size, **values)
+
+    def _guarded_generate(self, prompt: str, *, batch: bool = False) -> dict[str, Any]:
+        """Run the hedged model race, recording the outcome with the circuit breaker.
+
+        Remembers the winning model when it is not the current one.
+        """
+        started = time.monotonic()
+        try:
+            model_used, result = self._generate_verdict(prompt, batch=batch)
+        except Exception:
+            gemini_circuit_breaker.record(success=False, latency=time.monotonic() - started)
+            raise
+        gemini_circuit_breaker.record(success=True, latency=time.monotonic() - started)
+        if model_used != self.model_name:
+            logger.info(
+                "[INFO] Successfully using fallback model: %s (configured: %s)",
+                model_used,
+                self.model_name,
+            )
+            self.model_name = model_used
+            remember_model_name(model_used)
+        return result
+
+    @staticmethod
+    def _sanitize_verdict(result: dict[str, Any]) -> dict[str, Any]:
+        """Normalise a parsed verdict into the analysis result shape."""
+        return {
+            "is_crash": bool(result.get("is_crash", False)),
+            "confidence": float(result.get("confidence", 0.5)),
+            "severity": result.get("severity", "low"),
+            "crash_type": str(result.get("crash_type", "unknown")),
+            "reasoning": str(result.get("reasoning", "Analysis completed")),
+            "key_indicators": result.get("key_indicators", []),
+            "false_positive_risk": float(result.get("false_positive_risk", 0.5)),
+            "source": "gemini",
+        }
+
+    def _candidate_models(self) -> list[str]:
+        """Return the models to try, configured (or last winning) model first."""
+        candidates = [self.model_name]
+        # Only add fallbacks if they're different from configured model
+        for fallback in FALLBACK_MODELS:
+            if fallback not in candidates and self.model_name not in fallback:
+                candidates.append(fallback)
+        return candidates
+
+    def _call_model(
+        self,
+        model: str,
+        prompt: str,
+        cancelled: threading.Event,
+        batch: bool = False,  # noqa: FBT001, FBT002
+    ) -> dict[str, Any]:
+        """Ask one model for a verdict, constrained to the ``CrashVerdict`` JSON schema.
+
+        In ``stream`` mode the response is parsed as it arrives. A dismissed alert
+        (``is_crash`` false) closes the stream as soon as ``is_crash``, ``severity``
+        and ``confidence`` are known; a confirmed crash is read to the end, since its
+        type, indicators and reasoning are persisted and pushed to the rider.
+        Batched requests use the ``CrashVerdictBatch`` schema and are never streamed.
+
+        Raises:
+            CancelledError: If another model already won before this call started
+            json.JSONDecodeError: If the model did not return a JSON verdict
+            pydantic.ValidationError: If the verdict does not match the schema
+
+        """
+        if cancelled.is_set():
+            raise CancelledError
+        logger.debug("[DEBUG] Trying model: %s", model)
+        schema = CrashVerdictBatch if batch else CrashVerdict
+        config = genai.types.GenerateContentConfig(
+            system_instruction=SYSTEM_INSTRUCTION + BATCH_INSTRUCTION if batch else SYSTEM_INSTRUCTION,
+            response_mime_type="application/json",
+            response_schema=schema,
+        )
+
+        if app_settings.gemini_response_mode == "stream" and not batch:
+            parser = IncrementalVerdictParser()
+            stream = self.client.models.generate_content_stream(  # type: ignore[union-attr]
+                model=model,
+                contents=prompt,
+                config=config,
+            )
+            # Usage metadata only arrives with the final chunk; estimate it on early exit
+            usage = {
+                "prompt_tokens": estimate_tokens(config.system_instruction + prompt),
+                "output_tokens": None,
+            }
+            metadata = None
+            try:
+                for chunk in stream:
+                    if cancelled.is_set():
+                        raise CancelledError
+                    metadata = getattr(chunk, "usage_metadata", None) or metadata
+                    if parser.feed(chunk.text or "") and not parser.fields["is_crash"]:
+                        logger.debug("[AI] %s early dismissal after %s chars", model, len(parser.text))
+                        usage["output_tokens"] = estimate_tokens(parser.text)
+                        return {**parser.verdict(), "_usage": usage}
+            finally:
+                # Stops the HTTP stream when returning early (winner found or cancelled)
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+            usage = {
+                "prompt_tokens": getattr(metadata, "prompt_token_count", None) or usage["prompt_tokens"],
+                "output_tokens": getattr(metadata, "candidates_token_count", None) or estimate_tokens(parser.text),
+            }
+            return {**self._parse_verdict(parser.text), "_usage": usage}
+
+        response = self.client.models.generate_content(  # type: ignore[union-attr]
+            model=model,
+            contents=prompt,
+            config=config,
+        )
+        metadata = getattr(response, "usage_metadata", None)
+        usage = {
+            "prompt_tokens": getattr(metadata, "prompt_token_count", None),
+            "output_tokens": getattr(metadata, "candidates_token_count", None),
+        }
+        logger.debug("[AI] %s usage: %s", model, usage)
+        if isinstance(response.parsed, schema):
+            return {**response.parsed.model_dump(), "_usage": usage}
+        return {**self._parse_verdict(response.text or "", schema), "_usage": usage}
+
+    def _generate_verdict(self, prompt: str, *, batch: bool = False) -> tuple[str, dict[str, Any]]:
+        """Get a verdict using hedged requests across the candidate models.
+
+        The first model is asked immediately. A further candidate is raced whenever
+        no verdict has arrived within ``gemini_hedge_delay_ms``, or as soon as an
+        in-flight attempt fails (e.g. 404 model not found), keeping at most
+        ``gemini_hedge_max_in_flight`` requests open. The first valid JSON verdict
+        wins; attempts that have not started yet are cancelled and late results
+        are discarded. The whole race is bounded by ``gemini_request_timeout_seconds``.
+
+        Args:
+            prompt: Full analysis prompt
+            batch: Whether the prompt is a multi-case batch
+
+        Returns:
+            Tuple of (winning model name, parsed verdict)
+
+        Raises:
+            TimeoutError: If no verdict arrived before the deadline
+            Exception: The last model error if every candidate failed (RuntimeError if none ran)
+
+        """
+        executor = _get_executor()
+        candidates = iter(self._candidate_models())
+        cancelled = threading.Event()
+        pending: dict[Future, str] = {}
+
+        def launch() -> bool:
+            model = next(candidates, None)
+            if model is None:
+                return False
+            pending[executor.submit(self._call_model, model, prompt, cancelled, batch)] = model
+            return True
+
+        try:
+            return self._race_attempts(pending, launch)
+        finally:
+            cancelled.set()
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _race_attempts(pending: dict[Future, str], launch: Callable[[], bool]) -> tuple[str, dict[str, Any]]:
+        """Start attempts with ``launch`` and wait for the first verdict, hedging as configured.
+
+        Args:
+            pending: In-flight attempts by model name (filled by ``launch``)
+            launch: Starts an attempt with the next candidate, returning False when none are left
+
+        Returns:
+            Tuple of (winning model name, parsed verdict)
+
+        """
+        hedge_delay = app_settings.gemini_hedge_delay_ms / 1000
+        max_in_flight = max(1, app_settings.gemini_hedge_max_in_flight) if hedge_delay > 0 else 1
+        deadline = time.monotonic() + app_settings.gemini_request_timeout_seconds
+        last_error: Exception | None = None
+
+        launch()
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                msg = f"No Gemini verdict within {app_settings.gemini_request_timeout_seconds}s"
+                raise TimeoutError(msg)
+
+            can_hedge = len(pending) < max_in_flight
+            done, _ = wait(
+                pending,
+                timeout=min(hedge_delay, remaining) if can_hedge else remaining,
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                if can_hedge and launch():
+                    logger.info(
+                        "[AI] No verdict after %.0f ms, hedging with %s",
+                        hedge_delay * 1000,
+                        list(pending.values()),
+                    )
+                continue
+
+            for future in done:
+                model = pending.pop(future)
+                try:
+                    return model, future.result()
+                except Exception as e:  # noqa: BLE001
+                    last_error = e
+                    logger.warning("[WARN] Model %s failed: %s: %s", model, type(e).__name__, e)
+
+            # Replace failed attempts straight away
+            while len(pending) < max_in_flight and launch():
+                pass
+        raise last_error or RuntimeError("All model attempts failed")
+
+    @staticmethod
+    def _parse_verdict(response_text: str, schema: type[BaseModel] = CrashVerdict) -> dict[str, Any]:
+        """Parse and validate a JSON verdict (or batch of verdicts).
+
+        Raises:
+            json.JSONDecodeError: If the text is not JSON
+            pydantic.ValidationError: If the verdict does not match the schema
+
+        """
+        return schema.model_validate(json.loads(response_text)).model_dump()
 
     def _default_response(self) -> dict[str, Any]:
         """Return default response when AI fails.
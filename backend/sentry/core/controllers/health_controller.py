@@ -3,10 +3,13 @@
 import logging
 from typing import Any
 
+from common.utils.metrics import get_counters
 from django.db import connection
 from django.db.utils import DatabaseError, OperationalError
 from django.http import HttpRequest
 
+from core.ai.gemini_service import gemini_circuit_breaker
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,3 +82,19 @@ def check_postgres_health(request: HttpRequest) -> dict[str, Any]:
             "error": "unknown_error",
         }
 
+
+
+def get_service_metrics(_request: HttpRequest) -> dict[str, Any]:
+    """Collect runtime metrics for the crash analysis pipeline.
+
+    Args:
+        request: The HTTP request object
+
+    Returns:
+        Dictionary of metrics: Gemini circuit breaker state and host-wide counters
+
+    """
+    return {
+        "gemini_circuit": gemini_circuit_breaker.snapshot(),
+        "counters": get_counters(),
+    }
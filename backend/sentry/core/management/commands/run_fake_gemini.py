@@ -0,0 +1,81 @@
+"""Management command to run the local Gemini stand-in server."""
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from core.ai.fake_gemini import DEFAULT_MODELS, FakeGeminiConfig, FakeGeminiServer
+
+
+class Command(BaseCommand):
+    """Serves fake Gemini verdicts for load, latency and failure-path testing."""
+
+    help = (
+        "Runs a local Gemini API stand-in returning schema-valid crash verdicts with configurable "
+        "latency, error rate, missing models and stream pacing. "
+        "Point the backend at it with GEMINI_BASE_URL=http://<host>:<port>"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--host", type=str, default="127.0.0.1", help="Interface to bind")
+        parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            default=None,
+            help=f"Served model name (repeatable, default: {', '.join(DEFAULT_MODELS)})",
+        )
+        parser.add_argument(
+            "--missing-model",
+            action="append",
+            dest="missing_models",
+            default=[],
+            help="Model name that answers 404 NOT_FOUND (repeatable)",
+        )
+        parser.add_argument("--latency-ms", type=float, default=800.0, help="Median response latency")
+        parser.add_argument("--latency-sigma", type=float, default=0.35, help="Log-normal latency spread")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests that fail (0-1)")
+        parser.add_argument(
+            "--error-status",
+            type=int,
+            choices=[429, 500, 503, 504],
+            default=503,
+            help="HTTP status of injected failures",
+        )
+        parser.add_argument("--stream-chunk-chars", type=int, default=24, help="Verdict characters per SSE chunk")
+        parser.add_argument("--stream-chunk-delay-ms", type=float, default=40.0, help="Pause between SSE chunks")
+        parser.add_argument("--crash-g", type=float, default=3.0, help="g_peak at or above which alerts are crashes")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of latency and error draws")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        config = FakeGeminiConfig(
+            models=options["models"] or list(DEFAULT_MODELS),  # type: ignore[arg-type]
+            missing_models=options["missing_models"],  # type: ignore[arg-type]
+            latency_ms=options["latency_ms"],  # type: ignore[arg-type]
+            latency_sigma=options["latency_sigma"],  # type: ignore[arg-type]
+            error_rate=options["error_rate"],  # type: ignore[arg-type]
+            error_status=options["error_status"],  # type: ignore[arg-type]
+            stream_chunk_chars=options["stream_chunk_chars"],  # type: ignore[arg-type]
+            stream_chunk_delay_ms=options["stream_chunk_delay_ms"],  # type: ignore[arg-type]
+            crash_g=options["crash_g"],  # type: ignore[arg-type]
+            seed=options["seed"],  # type: ignore[arg-type]
+        )
+        server = FakeGeminiServer(config, host=options["host"], port=options["port"])  # type: ignore[arg-type]
+        self.stdout.write(
+            self.style.SUCCESS(f"Fake Gemini listening on {server.base_url}")  # type: ignore[attr-defined]
+            + f" | models={', '.join(config.models)} | missing={', '.join(config.missing_models) or 'none'} | "
+            f"latency~{config.latency_ms:.0f}ms | error_rate={config.error_rate:.1%}",
+        )
+        self.stdout.write(f"Request counts: GET {server.base_url}/_fake/stats (reset: POST /_fake/reset)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            stats = server.stats()
+            server.stop()
+            self.stdout.write(
+                f"Served {stats['total']} requests ({stats['requests_per_second']:.1f}/s, "
+                f"max {stats['max_in_flight']} in flight): {stats['requests']}",
+            )
@@ -3,7 +3,7 @@
 from django.http import HttpRequest
 from ninja import Router
 
-from core.controllers.health_controller import check_postgres_health
+from core.controllers.health_controller import check_postgres_health, get_service_metrics
 
 health_router = Router(tags=["health"])
 
@@ -19,3 +19,9 @@ def postgres_health_endpoint(request: HttpRequest) -> dict:
     if result["status"] == "healthy":
         return 200, result  # pyright: ignore[reportReturnType]
     return 500, result  # pyright: ignore[reportReturnType]
+
+
+@health_router.get("/metrics/", response={200: dict})
+def metrics_endpoint(request: HttpRequest) -> dict:
+    """Runtime metrics endpoint (circuit breaker state, call statistics)."""
+    return get_service_metrics(request)
@@ -8,3 +8,7 @@ class DeviceConfig(AppConfig):
 
     default_auto_field: str = "django.db.models.BigAutoField"
     name = "device"
+
+    def ready(self) -> None:
+        """Connect signal handlers."""
+        from device import signals  # noqa: F401, PLC0415
@@ -1,284 +1,462 @@
 """Crash controller."""
 
 import logging
+import time
+import uuid
+from typing import TYPE_CHECKING
 
-from core.ai.gemini_service import GeminiService
+from core.ai.analysis_batcher import analysis_batcher
 from django.db import transaction
 from django.http import HttpRequest
 from ninja.errors import HttpError
 
-from device.models import CrashEvent
+from device.models import CrashAlertJob, CrashEvent
 from device.schemas.crash_schema import (
+    CrashAlertJobResponse,
     CrashAlertRequest,
     CrashAlertResponse,
     CrashEventSchema,
     CrashFeedbackRequest,
     CrashFeedbackResponse,
 )
+from device.services.analysis_ledger import record_analysis
+from device.services.crash_classifier import VERDICT_ESCALATE, CrashPrescreenService
 from device.services.crash_detector import CrashDetectorService
-from device.services.fcm_service import FCMService
-from device.utils.crash_utils import notify_loved_ones_with_gps
+from device.services.crash_features import extract_crash_features
+from device.services.crash_jobs import CrashAlertJobService
+from device.services.crash_rules import rule_based_verdict
+from device.services.notification_dispatcher import notification_dispatcher
+from device.services.verdict_cache import VerdictCache
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+    from django.contrib.auth.models import AnonymousUser
 
 logger = logging.getLogger("device")
 
 
-def process_crash_alert(
-    request: HttpRequest,
+def run_crash_alert_pipeline(
     data: CrashAlertRequest,
+    user: "AbstractBaseUser | AnonymousUser | None",
+    job: CrashAlertJob | None = None,
 ) -> CrashAlertResponse:
-    """Process crash alert from mobile app (Tier 1 trigger).
+    """Run the Tier 2 analysis pipeline for one crash alert.
 
-    Flow:
-    1. Receive threshold alert from mobile app
-    2. Retrieve recent sensor data context
-    3. Call Gemini AI for analysis
-    4. Create CrashEvent if confirmed
-    5. Send FCM push notification
+    Shared by the synchronous endpoint and the crash alert job worker.
 
     Args:
-        request: HTTP request object
         data: Crash alert request data
+        user: User the alert belongs to (if any)
+        job: The queued job being run; a retried job never creates a second CrashEvent
 
     Returns:
         Crash alert response with AI analysis
 
-    Raises:
-        HttpError: If processing fails
-
     """
-    try:
-        # Log incoming crash alert request
-        gps_info = (
-            f"GPS: lat={data.gps_data.latitude},"
-            f"lng={data.gps_data.longitude},"
-            f"accuracy={data.gps_data.accuracy}m,"
-            f"speed={data.gps_data.speed}m/s"
-            if data.gps_data and data.gps_data.latitude and data.gps_data.longitude
-            else "GPS: no data"
-        )
+    if job is not None and job.crash_event is not None:
+        # An earlier attempt got as far as committing the CrashEvent (and its notifications)
         logger.info(
-            "[IN] Crash alert received | device_id=%s | timestamp=%s | "
-            "threshold_severity=%s | trigger_type=%s | g_force=%.2fg | "
-            "sensor: ax=%.2f, ay=%.2f, az=%.2f | roll=%.1f deg, pitch=%.1f deg | "
-            "tilt_detected=%s | %s",
-            data.device_id,
-            data.timestamp,
-            data.threshold_result.severity,
-            data.threshold_result.trigger_type,
-            data.threshold_result.g_force,
-            data.sensor_reading.ax,
-            data.sensor_reading.ay,
-            data.sensor_reading.az,
-            data.sensor_reading.roll,
-            data.sensor_reading.pitch,
-            data.sensor_reading.tilt_detected,
-            gps_info,
-        )
-
-        # Initialize services
-        gemini_service = GeminiService()
-        crash_detector = CrashDetectorService()
-        fcm_service = FCMService()
-
-        # Fetch user's crash alert interval from UserSettings
-        user = getattr(request, "user", None)
-        crash_alert_interval = crash_detector.get_user_crash_alert_interval(user)
-
-        # Calculate dynamic lookback seconds based on interval
-        # Formula: min(30 + (interval - 10) * 3, 180)
-        # Example: 10s interval = 30s lookback, 30s interval = 90s lookback, 60s interval = 180s lookback
-        lookback_seconds = min(30 + (crash_alert_interval - 10) * 3, 180)
-        logger.info(
-            "[CONTEXT] Calculated lookback_seconds=%s based on interval=%s (device_id=%s)",
-            lookback_seconds,
-            crash_alert_interval,
-            data.device_id,
+            "[SKIP] Crash alert job already created CrashEvent %s (job_id=%s)",
+            job.crash_event.id,  # type: ignore[attr-defined]
+            job.id,
         )
+        return _crash_event_response(job.crash_event)
+    with analysis_batcher.track():
+        return _run_crash_alert_pipeline(data, user, job)
+
+
+def _crash_event_response(crash_event: CrashEvent) -> CrashAlertResponse:
+    """Return the response of a crash alert that already created its CrashEvent."""
+    return CrashAlertResponse(
+        is_crash=True,
+        confidence=crash_event.confidence_score,  # type: ignore[attr-defined]
+        severity=crash_event.severity,  # type: ignore[attr-defined]
+        crash_type=crash_event.crash_type,  # type: ignore[attr-defined]
+        reasoning=crash_event.ai_reasoning,  # type: ignore[attr-defined]
+        key_indicators=crash_event.key_indicators,  # type: ignore[attr-defined]
+        false_positive_risk=crash_event.false_positive_risk,  # type: ignore[attr-defined]
+        crash_event_id=crash_event.id,  # type: ignore[attr-defined]
+    )
+
+
+def _run_crash_alert_pipeline(
+    data: CrashAlertRequest,
+    user: "AbstractBaseUser | AnonymousUser | None",
+    job: CrashAlertJob | None = None,
+) -> CrashAlertResponse:
+    """Run the pipeline steps for one crash alert.
 
-        # Retrieve recent sensor data with dynamic lookback
-        recent_data = crash_detector.get_recent_sensor_data(
-            device_id=data.device_id,
-            lookback_seconds=lookback_seconds,
-        )
-        logger.info(
-            "[DATA] Retrieved %s sensor data points for context (device_id=%s, lookback_seconds=%s)",
-            len(recent_data),
-            data.device_id,
-            lookback_seconds,
-        )
+    Flow:
+    1. Retrieve recent sensor data context
+    2. Pre-screen with the local classifier; call Gemini AI only for ambiguous alerts
+    3. Create CrashEvent if confirmed
+    4. Send FCM push notification
 
-        # Retrieve recent crash events for AI context
-        # Number of events: max(1, interval // 20)
-        # Example: 10s interval = 1 event, 30s interval = 1 event, 60s interval = 3 events
-        num_crash_events = max(1, crash_alert_interval // 20)
-        crash_events = crash_detector.get_recent_crash_events(
-            device_id=data.device_id,
-            user=user,
-            lookback_seconds=lookback_seconds,
-            num_events=num_crash_events,
-        )
+    Args:
+        data: Crash alert request data
+        user: User the alert belongs to (if any)
+        job: The queued job being run (if any)
 
-        # Prepare current reading dict
-        current_reading = {
-            "ax": data.sensor_reading.ax,
-            "ay": data.sensor_reading.ay,
-            "az": data.sensor_reading.az,
-            "roll": data.sensor_reading.roll,
-            "pitch": data.sensor_reading.pitch,
-            "tilt_detected": data.sensor_reading.tilt_detected,
-        }
+    Returns:
+        Crash alert response with AI analysis
 
+    """
+    # Log incoming crash alert request
+    gps_info = (
+        f"GPS: lat={data.gps_data.latitude},"
+        f"lng={data.gps_data.longitude},"
+        f"accuracy={data.gps_data.accuracy}m,"
+        f"speed={data.gps_data.speed}m/s"
+        if data.gps_data and data.gps_data.latitude and data.gps_data.longitude
+        else "GPS: no data"
+    )
+    logger.info(
+        "[IN] Crash alert received | device_id=%s | timestamp=%s | "
+        "threshold_severity=%s | trigger_type=%s | g_force=%.2fg | "
+        "sensor: ax=%.2f, ay=%.2f, az=%.2f | roll=%.1f deg, pitch=%.1f deg | "
+        "tilt_detected=%s | %s",
+        data.device_id,
+        data.timestamp,
+        data.threshold_result.severity,
+        data.threshold_result.trigger_type,
+        data.threshold_result.g_force,
+        data.sensor_reading.ax,
+        data.sensor_reading.ay,
+        data.sensor_reading.az,
+        data.sensor_reading.roll,
+        data.sensor_reading.pitch,
+        data.sensor_reading.tilt_detected,
+        gps_info,
+    )
+
+    # Initialize services
+    crash_detector = CrashDetectorService()
+
+    # Fetch user's crash alert interval from UserSettings
+    crash_alert_interval = crash_detector.get_user_crash_alert_interval(user)
+
+    # Calculate dynamic lookback seconds based on interval
+    # Formula: min(30 + (interval - 10) * 3, 180)
+    # Example: 10s interval = 30s lookback, 30s interval = 90s lookback, 60s interval = 180s lookback
+    lookback_seconds = min(30 + (crash_alert_interval - 10) * 3, 180)
+    logger.info(
+        "[CONTEXT] Calculated lookback_seconds=%s based on interval=%s (device_id=%s)",
+        lookback_seconds,
+        crash_alert_interval,
+        data.device_id,
+    )
+
+    # Retrieve recent sensor data with dynamic lookback
+    recent_window = crash_detector.get_recent_sensor_window(
+        device_id=data.device_id,
+        lookback_seconds=lookback_seconds,
+    )
+    logger.info(
+        "[DATA] Retrieved %s sensor data points for context (device_id=%s, lookback_seconds=%s)",
+        len(recent_window),
+        data.device_id,
+        lookback_seconds,
+    )
+
+    # Retrieve recent crash events for AI context
+    # Number of events: max(1, interval // 20)
+    # Example: 10s interval = 1 event, 30s interval = 1 event, 60s interval = 3 events
+    num_crash_events = max(1, crash_alert_interval // 20)
+    crash_events = crash_detector.get_recent_crash_events(
+        device_id=data.device_id,
+        user=user,
+        lookback_seconds=lookback_seconds,
+        num_events=num_crash_events,
+    )
+
+    # Prepare current reading dict
+    current_reading = {
+        "ax": data.sensor_reading.ax,
+        "ay": data.sensor_reading.ay,
+        "az": data.sensor_reading.az,
+        "roll": data.sensor_reading.roll,
+        "pitch": data.sensor_reading.pitch,
+        "tilt_detected": data.sensor_reading.tilt_detected,
+    }
+
+    # Summarise the window into features for the prompt and the CrashEvent
+    features = extract_crash_features(recent_window, current_reading).to_dict()
+
+    # Tier 1.5: confidently clear or confirm locally, escalate the rest to Gemini
+    analysis_started = time.monotonic()
+    analysis_stats: dict = {}  # Filled by GeminiService when Gemini is consulted
+    decision = CrashPrescreenService().prescreen(features)
+    verdict_cache = VerdictCache()
+    if decision is not None and decision.verdict != VERDICT_ESCALATE:
+        ai_analysis = decision.to_analysis(severity=data.threshold_result.severity)
+    elif (cached := verdict_cache.lookup(current_reading, features)) is not None:
+        # Near-identical alert analysed recently (or labelled by a user)
+        ai_analysis = cached
+    else:
         # Call Gemini AI for analysis with crash event history
         logger.info(
             "[AI] Calling Gemini AI for crash analysis (device_id=%s, crash_events=%s)",
             data.device_id,
             len(crash_events),
         )
-        ai_analysis = gemini_service.analyze_crash_data(
-            sensor_data=recent_data,
+        started = time.monotonic()
+        # Concurrent alerts in this process (job worker threads) share one request
+        ai_analysis = analysis_batcher.analyze(
+            sensor_window=recent_window,
             current_reading=current_reading,
             context_seconds=lookback_seconds,
             crash_events=crash_events,
+            features=features,
+            # Used when Gemini is unavailable (circuit open, errors) instead of "not a crash"
+            fallback=rule_based_verdict(features, data.threshold_result.severity),
+            stats=analysis_stats,
         )
+        verdict_cache.store(current_reading, features, ai_analysis, (time.monotonic() - started) * 1000)
+    analysis_latency_ms = (time.monotonic() - analysis_started) * 1000
+    logger.info(
+        "[OK] AI analysis complete | device_id=%s | is_crash=%s | confidence=%.2f | "
+        "severity=%s | crash_type=%s | false_positive_risk=%.2f | reasoning=%s...",
+        data.device_id,
+        ai_analysis["is_crash"],
+        ai_analysis["confidence"],
+        ai_analysis["severity"],
+        ai_analysis["crash_type"],
+        ai_analysis["false_positive_risk"],
+        ai_analysis["reasoning"][:100],
+    )
+
+    # Create CrashEvent if confirmed
+    crash_event = None
+    if ai_analysis["is_crash"]:
         logger.info(
-            "[OK] AI analysis complete | device_id=%s | is_crash=%s | confidence=%.2f | "
-            "severity=%s | crash_type=%s | false_positive_risk=%.2f | reasoning=%s...",
+            "[CRASH] Crash confirmed by AI - creating CrashEvent (device_id=%s, severity=%s, confidence=%.2f)",
             data.device_id,
-            ai_analysis["is_crash"],
-            ai_analysis["confidence"],
             ai_analysis["severity"],
-            ai_analysis["crash_type"],
-            ai_analysis["false_positive_risk"],
-            ai_analysis["reasoning"][:100],
+            ai_analysis["confidence"],
         )
-
-        # Create CrashEvent if confirmed
-        crash_event = None
-        if ai_analysis["is_crash"]:
-            logger.info(
-                "[CRASH] Crash confirmed by AI - creating CrashEvent (device_id=%s, severity=%s, confidence=%.2f)",
-                data.device_id,
-                ai_analysis["severity"],
-                ai_analysis["confidence"],
-            )
-            with transaction.atomic():  # type: ignore[call-overload]
-                # Extract GPS data if available
-                gps_data = crash_detector.extract_gps_data(data.gps_data)
-                if gps_data["latitude"] and gps_data["longitude"]:
-                    logger.info(
-                        "[GPS] GPS location available: (%s, %s) accuracy=%sm "
-                        "speed=%.2fm/s speed_change=%.2fm/s² (device_id=%s)",
-                        gps_data["latitude"],
-                        gps_data["longitude"],
-                        gps_data["accuracy"],
-                        gps_data["speed"],
-                        gps_data["speed_change"],
-                        data.device_id,
-                    )
-                else:
-                    logger.warning("[WARN] No GPS location available at crash time (device_id=%s)", data.device_id)
-
-                crash_event = CrashEvent.objects.create(  # type: ignore[attr-defined]
-                    device_id=data.device_id,
-                    user=request.user if hasattr(request, "user") and request.user.is_authenticated else None,  # type: ignore[attr-defined]
-                    crash_timestamp=data.timestamp,
-                    is_confirmed_crash=True,
-                    confidence_score=ai_analysis["confidence"],
-                    severity=ai_analysis["severity"],
-                    crash_type=ai_analysis["crash_type"],
-                    ai_reasoning=ai_analysis["reasoning"],
-                    key_indicators=ai_analysis["key_indicators"],
-                    false_positive_risk=ai_analysis["false_positive_risk"],
-                    max_g_force=data.threshold_result.g_force,
-                    impact_acceleration={
-                        "ax": data.sensor_reading.ax,
-                        "ay": data.sensor_reading.ay,
-                        "az": data.sensor_reading.az,
-                    },
-                    final_tilt={
-                        "roll": data.sensor_reading.roll,
-                        "pitch": data.sensor_reading.pitch,
-                    },
-                    # GPS and speed fields
-                    crash_latitude=gps_data["latitude"],
-                    crash_longitude=gps_data["longitude"],
-                    crash_altitude=gps_data["altitude"],
-                    gps_accuracy_at_crash=gps_data["accuracy"],
-                    speed_at_crash=gps_data["speed"],
-                    speed_change_at_crash=gps_data["speed_change"],
-                    max_speed_before_crash=None,  # Will be calculated from recent sensor data if available
-                )
+        with transaction.atomic():  # type: ignore[call-overload]
+            # A retried job reuses the event (and notifications) of the attempt that created it
+            job_service = CrashAlertJobService()
+            crash_event = job_service.locked_crash_event(job) if job is not None else None
+            if crash_event is not None:
                 logger.info(
-                    "[SAVE] CrashEvent created successfully | crash_event_id=%s | device_id=%s | "
-                    "severity=%s | confidence=%.2f",  # type: ignore[attr-defined]
+                    "[SKIP] Crash alert job already created CrashEvent %s (job_id=%s)",
                     crash_event.id,  # type: ignore[attr-defined]
-                    data.device_id,
-                    ai_analysis["severity"],
-                    ai_analysis["confidence"],
+                    job.id,  # type: ignore[union-attr]
                 )
-
-                # Send FCM push notification
-                if ai_analysis["severity"] in ["high", "medium"]:
-                    logger.info(
-                        "[FCM] Sending FCM push notification (device_id=%s, severity=%s, crash_event_id=%s)",  # type: ignore[attr-defined]
-                        data.device_id,
-                        ai_analysis["severity"],
-                        crash_event.id,  # type: ignore[attr-defined]
-                    )
-                    notification_sent = fcm_service.send_crash_notification(
-                        device_id=data.device_id,
-                        crash_event=crash_event,
-                        ai_analysis=ai_analysis,
-                    )
-                    if notification_sent:
-                        logger.info("[OK] FCM notification sent successfully (device_id=%s)", data.device_id)
-                    else:
-                        logger.warning("[WARN] FCM notification failed to send (device_id=%s)", data.device_id)
-
-                    # Send GPS location to loved ones
-                    logger.info(
-                        "[LOVED_ONES] Notifying loved ones with GPS location (device_id=%s, crash_event_id=%s)",  # type: ignore[attr-defined]
-                        data.device_id,
-                        crash_event.id,  # type: ignore[attr-defined]
-                    )
-                    notify_loved_ones_with_gps(
-                        device_id=data.device_id,
-                        crash_event=crash_event,
-                    )
-        else:
-            logger.info(
-                "[OK] False positive detected by AI - no crash event created "
-                "(device_id=%s, confidence=%.2f, false_positive_risk=%.2f)",
-                data.device_id,
-                ai_analysis["confidence"],
-                ai_analysis["false_positive_risk"],
-            )
-
+            else:
+                crash_event = _create_crash_event(data, user, ai_analysis, features, crash_detector)
+                if job is not None:
+                    job_service.attach_crash_event(job, crash_event)
+    else:
         logger.info(
-            "[OUT] Crash alert processing complete | device_id=%s | is_crash=%s | "
-            "crash_event_created=%s | crash_event_id=%s",  # type: ignore[attr-defined]
+            "[OK] False positive detected by AI - no crash event created "
+            "(device_id=%s, confidence=%.2f, false_positive_risk=%.2f)",
             data.device_id,
-            ai_analysis["is_crash"],
-            crash_event is not None,
-            crash_event.id if crash_event else None,  # type: ignore[attr-defined]
+            ai_analysis["confidence"],
+            ai_analysis["false_positive_risk"],
         )
 
-        return CrashAlertResponse(
-            is_crash=ai_analysis["is_crash"],
-            confidence=ai_analysis["confidence"],
-            severity=ai_analysis["severity"],
-            crash_type=ai_analysis["crash_type"],
-            reasoning=ai_analysis["reasoning"],
-            key_indicators=ai_analysis["key_indicators"],
-            false_positive_risk=ai_analysis["false_positive_risk"],
-            crash_event_id=crash_event.id if crash_event else None,  # type: ignore[attr-defined]
+    # Every verdict (negatives included) goes to the ledger; queued, not written inline
+    record_analysis(
+        device_id=data.device_id,
+        features=features,
+        analysis=ai_analysis,
+        latency_ms=analysis_latency_ms,
+        stats=analysis_stats,
+        crash_event_id=crash_event.id if crash_event else None,  # type: ignore[attr-defined]
+    )
+
+    logger.info(
+        "[OUT] Crash alert processing complete | device_id=%s | is_crash=%s | "
+        "crash_event_created=%s | crash_event_id=%s",  # type: ignore[attr-defined]
+        data.device_id,
+        ai_analysis["is_crash"],
+        crash_event is not None,
+        crash_event.id if crash_event else None,  # type: ignore[attr-defined]
+    )
+
+    return CrashAlertResponse(
+        is_crash=ai_analysis["is_crash"],
+        confidence=ai_analysis["confidence"],
+        severity=ai_analysis["severity"],
+        crash_type=ai_analysis["crash_type"],
+        reasoning=ai_analysis["reasoning"],
+        key_indicators=ai_analysis["key_indicators"],
+        false_positive_risk=ai_analysis["false_positive_risk"],
+        crash_event_id=crash_event.id if crash_event else None,  # type: ignore[attr-defined]
+    )
+
+
+def _create_crash_event(
+    data: CrashAlertRequest,
+    user: "AbstractBaseUser | AnonymousUser | None",
+    ai_analysis: dict,
+    features: dict,
+    crash_detector: CrashDetectorService,
+) -> CrashEvent:
+    """Create a confirmed CrashEvent and queue its notifications (inside the caller's transaction)."""
+    # Extract GPS data if available
+    gps_data = crash_detector.extract_gps_data(data.gps_data)
+    if gps_data["latitude"] and gps_data["longitude"]:
+        logger.info(
+            "[GPS] GPS location available: (%s, %s) accuracy=%sm speed=%.2fm/s speed_change=%.2fm/s² (device_id=%s)",
+            gps_data["latitude"],
+            gps_data["longitude"],
+            gps_data["accuracy"],
+            gps_data["speed"],
+            gps_data["speed_change"],
+            data.device_id,
         )
+    else:
+        logger.warning("[WARN] No GPS location available at crash time (device_id=%s)", data.device_id)
+
+    crash_event = CrashEvent.objects.create(  # type: ignore[attr-defined]
+        device_id=data.device_id,
+        user=user if user is not None and user.is_authenticated else None,
+        crash_timestamp=data.timestamp,
+        is_confirmed_crash=True,
+        confidence_score=ai_analysis["confidence"],
+        severity=ai_analysis["severity"],
+        crash_type=ai_analysis["crash_type"],
+        ai_reasoning=ai_analysis["reasoning"],
+        key_indicators=ai_analysis["key_indicators"],
+        false_positive_risk=ai_analysis["false_positive_risk"],
+        max_g_force=data.threshold_result.g_force,
+        impact_acceleration={
+            "ax": data.sensor_reading.ax,
+            "ay": data.sensor_reading.ay,
+            "az": data.sensor_reading.az,
+        },
+        final_tilt={
+            "roll": data.sensor_reading.roll,
+            "pitch": data.sensor_reading.pitch,
+        },
+        crash_features=features,
+        # GPS and speed fields
+        crash_latitude=gps_data["latitude"],
+        crash_longitude=gps_data["longitude"],
+        crash_altitude=gps_data["altitude"],
+        gps_accuracy_at_crash=gps_data["accuracy"],
+        speed_at_crash=gps_data["speed"],
+        speed_change_at_crash=gps_data["speed_change"],
+        max_speed_before_crash=None,  # Will be calculated from recent sensor data if available
+    )
+    logger.info(
+        "[SAVE] CrashEvent created successfully | crash_event_id=%s | device_id=%s | severity=%s | confidence=%.2f",
+        crash_event.id,  # type: ignore[attr-defined]
+        data.device_id,
+        ai_analysis["severity"],
+        ai_analysis["confidence"],
+    )
+
+    # Owner and loved-one pushes are written to the outbox with the CrashEvent and go
+    # out concurrently once it commits; failed pushes are retried by the outbox worker
+    if ai_analysis["severity"] in ["high", "medium"]:
+        logger.info(
+            "[FCM] Queueing crash notifications for after commit (device_id=%s, severity=%s, crash_event_id=%s)",
+            data.device_id,
+            ai_analysis["severity"],
+            crash_event.id,  # type: ignore[attr-defined]
+        )
+        notification_dispatcher.dispatch_crash_alert(
+            device_id=data.device_id,
+            crash_event=crash_event,
+            ai_analysis=ai_analysis,
+        )
+    return crash_event
 
+
+def process_crash_alert(
+    request: HttpRequest,
+    data: CrashAlertRequest,
+) -> CrashAlertResponse:
+    """Process crash alert from mobile app (Tier 1 trigger) synchronously.
+
+    Args:
+        request: HTTP request object
+        data: Crash alert request data
+
+    Returns:
+        Crash alert response with AI analysis
+
+    Raises:
+        HttpError: If processing fails
+
+    """
+    try:
+        return run_crash_alert_pipeline(data, getattr(request, "user", None))
     except Exception:
         logger.exception("Error processing crash alert")
         raise HttpError(status_code=500, message="Failed to process crash alert") from None
 
 
+def serialize_crash_alert_job(job: CrashAlertJob) -> CrashAlertJobResponse:
+    """Convert a crash alert job to its API schema."""
+    return CrashAlertJobResponse(
+        job_id=str(job.id),
+        status=job.status,
+        attempts=job.attempts,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+        result=CrashAlertResponse(**job.result) if job.result else None,
+        error=job.error or None,
+    )
+
+
+def enqueue_crash_alert(
+    request: HttpRequest,
+    data: CrashAlertRequest,
+) -> CrashAlertJobResponse:
+    """Queue a crash alert for asynchronous Tier 2 analysis.
+
+    The alert is validated by the request schema and stored; the
+    ``process_crash_jobs`` worker runs the pipeline and records the result.
+
+    Args:
+        request: HTTP request object
+        data: Crash alert request data
+
+    Returns:
+        The queued job
+
+    Raises:
+        HttpError: If the job could not be queued
+
+    """
+    try:
+        job = CrashAlertJobService().enqueue(data, getattr(request, "user", None))
+    except Exception:
+        logger.exception("Error queueing crash alert")
+        raise HttpError(status_code=500, message="Failed to queue crash alert") from None
+    return serialize_crash_alert_job(job)
+
+
+def get_crash_alert_job(
+    _request: HttpRequest,
+    job_id: uuid.UUID,
+) -> CrashAlertJobResponse:
+    """Get the status and result of an asynchronous crash alert job.
+
+    Args:
+        request: HTTP request object
+        job_id: Job ID returned when the alert was queued
+
+    Returns:
+        Job status, with the analysis result once it has succeeded
+
+    Raises:
+        HttpError: If the job does not exist
+
+    """
+    job = CrashAlertJobService().get(job_id)
+    if job is None:
+        logger.warning("[WARN] Crash alert job not found (job_id=%s)", job_id)
+        raise HttpError(status_code=404, message="Crash alert job not found")
+    return serialize_crash_alert_job(job)
+
+
 def submit_crash_feedback(
     _request: HttpRequest,
     event_id: int,
@@ -322,6 +500,7 @@ def submit_crash_feedback(
         if data.user_comments:
             crash_event.user_comments = data.user_comments  # type: ignore[attr-defined]
         crash_event.save()  # type: ignore[attr-defined]
+        VerdictCache().invalidate_labelled()
 
         logger.info(
             "[OK] User feedback submitted (event_id=%s, feedback=%s)",
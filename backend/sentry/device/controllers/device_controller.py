@@ -5,9 +5,18 @@ import logging
 from django.http import HttpRequest
 from django.utils import timezone
 from ninja import Router
+from ninja.errors import HttpError
+from sentry.settings.config import settings as app_settings
 
 from device.models import SensorData
-from device.schemas import DeviceDataRequest, DeviceDataResponse
+from device.schemas import (
+    DeviceDataBatchRequest,
+    DeviceDataBatchResponse,
+    DeviceDataRequest,
+    DeviceDataResponse,
+)
+from device.services.sensor_ingest import SensorIngestService
+from device.utils.sensor_frame import FRAME_CONTENT_TYPE, FrameDecodeError, decode_frame
 
 device_router = Router(tags=["device"])
 
@@ -23,20 +32,26 @@ def receive_device_data(
     URL (once wired into v1): /api/v1/device/data
     """
     try:
-        # Save sensor data to database
-        SensorData.objects.create(  # type: ignore[attr-defined]
-            device_id=payload.device_id or "unknown",
-            ax=payload.ax,
-            ay=payload.ay,
-            az=payload.az,
-            roll=payload.roll,
-            pitch=payload.pitch,
-            tilt_detected=payload.tilt_detected,
-            timestamp=timezone.now(),
+        # Save sensor data to database (or queue it when write-behind is enabled)
+        ingest_service = SensorIngestService()
+        _, queued = ingest_service.ingest(
+            [
+                SensorData(
+                    device_id=payload.device_id or "unknown",
+                    ax=payload.ax,
+                    ay=payload.ay,
+                    az=payload.az,
+                    roll=payload.roll,
+                    pitch=payload.pitch,
+                    tilt_detected=payload.tilt_detected,
+                    timestamp=timezone.now(),
+                ),
+            ],
         )
 
         logger.info(
-            "Device data saved: %s, ax=%s, ay=%s, az=%s, roll=%s, pitch=%s, tilt_detected=%s",
+            "Device data %s: %s, ax=%s, ay=%s, az=%s, roll=%s, pitch=%s, tilt_detected=%s",
+            "queued" if queued else "saved",
             payload.device_id,
             payload.ax,
             payload.ay,
@@ -56,3 +71,118 @@ def receive_device_data(
             success=False,
             message="Failed to save data",
         )
+
+
+def receive_device_data_batch(
+    request: HttpRequest,  # noqa: ARG001
+    payload: DeviceDataBatchRequest,
+) -> DeviceDataBatchResponse:
+    """Endpoint the embedded device can POST batches of MPU6050 readings to.
+
+    All readings are written with a single bulk insert and acknowledged together.
+
+    URL: /api/v1/device/data/batch
+
+    Raises:
+        HttpError: If the batch exceeds the configured maximum size
+
+    """
+    max_batch_size = app_settings.device_ingest_max_batch_size
+    if len(payload.readings) > max_batch_size:
+        raise HttpError(
+            status_code=413,
+            message=f"Batch too large: {len(payload.readings)} readings (max {max_batch_size})",
+        )
+
+    try:
+        ingest_service = SensorIngestService()
+        rows = ingest_service.build_rows(payload.device_id, payload.readings, sent_at=payload.sent_at)
+        accepted, queued = ingest_service.ingest(rows)
+
+        logger.info(
+            "Device data batch %s: %s, batch_seq=%s, readings=%s, first=%s, last=%s",
+            "queued" if queued else "saved",
+            payload.device_id,
+            payload.batch_seq,
+            accepted,
+            rows[0].timestamp.isoformat(),  # type: ignore[attr-defined]
+            rows[-1].timestamp.isoformat(),  # type: ignore[attr-defined]
+        )
+
+        return DeviceDataBatchResponse(
+            success=True,
+            message="Batch queued" if queued else "Batch received",
+            accepted=accepted,
+            batch_seq=payload.batch_seq,
+        )
+    except Exception:
+        logger.exception("Error saving device data batch")
+        return DeviceDataBatchResponse(
+            success=False,
+            message="Failed to save batch",
+            accepted=0,
+            batch_seq=payload.batch_seq,
+        )
+
+
+def receive_device_frame(request: HttpRequest) -> DeviceDataBatchResponse:
+    """Endpoint the embedded device can POST binary sensor frames to.
+
+    The body is a struct-packed frame (see ``device.utils.sensor_frame``), optionally
+    gzip/deflate compressed as signalled by Content-Encoding.
+
+    URL: /api/v1/device/data/frame
+
+    Raises:
+        HttpError: If the content type is wrong, the frame is malformed or too large
+
+    """
+    content_type = request.content_type or ""
+    if content_type != FRAME_CONTENT_TYPE:
+        raise HttpError(
+            status_code=415,
+            message=f"Unsupported content type: {content_type or 'none'} (expected {FRAME_CONTENT_TYPE})",
+        )
+
+    try:
+        frame = decode_frame(request.body, request.headers.get("Content-Encoding"))
+    except FrameDecodeError as e:
+        logger.warning("Rejected malformed sensor frame: %s", e)
+        raise HttpError(status_code=400, message=f"Malformed sensor frame: {e}") from None
+
+    max_batch_size = app_settings.device_ingest_max_batch_size
+    if len(frame.samples) > max_batch_size:
+        raise HttpError(
+            status_code=413,
+            message=f"Batch too large: {len(frame.samples)} readings (max {max_batch_size})",
+        )
+    if not frame.samples:
+        return DeviceDataBatchResponse(success=True, message="Empty frame", accepted=0)
+
+    try:
+        ingest_service = SensorIngestService()
+        rows = ingest_service.build_rows_from_values(frame.device_id, frame.samples, sent_at=frame.sent_at)
+        accepted, queued = ingest_service.ingest(rows)
+
+        logger.info(
+            "Device data frame %s: %s, readings=%s, bytes=%s, first=%s, last=%s",
+            "queued" if queued else "saved",
+            frame.device_id,
+            accepted,
+            len(request.body),
+            rows[0].timestamp.isoformat(),  # type: ignore[attr-defined]
+            rows[-1].timestamp.isoformat(),  # type: ignore[attr-defined]
+        )
+
+        return DeviceDataBatchResponse(
+            success=True,
+            message="Frame queued" if queued else "Frame received",
+            accepted=accepted,
+        )
+    except Exception:
+        logger.exception("Error saving device data frame")
+        return DeviceDataBatchResponse(
+            success=False,
+            message="Failed to save frame",
+            accepted=0,
+        )
@@ -0,0 +1,295 @@
+"""Management command to benchmark the compact crash prompt against the legacy verbose prompt."""
+
+import math
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+try:
+    from google import genai
+except ImportError:
+    genai = None  # type: ignore[assignment]
+
+from core.ai.crash_prompt import SYSTEM_INSTRUCTION, build_crash_prompt, estimate_tokens, token_budget_for
+from django.core.management.base import BaseCommand, CommandParser
+from sentry.settings.config import settings as app_settings
+
+from device.services.crash_features import extract_crash_features
+from device.services.sensor_window import SensorWindow
+
+
+def _legacy_format(
+    sensor_window: "SensorWindow",
+    current_reading: dict[str, Any],
+    *,
+    include_metrics: bool = True,
+    crash_events: list[dict[str, Any]] | None = None,
+    features: dict[str, Any] | None = None,
+) -> str:
+    """Format sensor data the way the pre-budget prompt did (verbose lines per reading).
+
+    Args:
+        sensor_window: Recent sensor readings (columnar window, oldest first)
+        current_reading: Current sensor reading that triggered alert
+        include_metrics: Whether to include calculated metrics
+        crash_events: Optional list of recent crash events for context
+        features: Optional window features; when given they replace the raw readings
+
+    Returns:
+        Formatted string for AI prompt
+
+    """
+    lines = ["=== SENSOR DATA CONTEXT ==="]
+
+    # Add recent sensor data, summarised as features when available
+    if features:
+        lines.append(f"\nWindow features ({features.get('sample_count', len(sensor_window))} readings):")
+        lines.append(
+            f"  - Window span: {features['window_seconds']:.1f}s | "
+            f"G-force peak: {features['g_peak']:.2f}g, {features['time_of_peak_s']:.1f}s before alert | "
+            f"mean: {features['g_mean']:.2f}g",
+        )
+        lines.append(
+            f"  - Peak jerk: {features['jerk_peak']:.1f}g/s | "
+            f"Time above impact threshold: {features['impact_duration_s']:.2f}s",
+        )
+        lines.append(
+            f"  - After peak: G std={features['post_impact_g_std']:.2f}g, "
+            f"still {features['post_impact_still_fraction'] * 100:.0f}% of readings",
+        )
+        lines.append(
+            f"  - Roll range={features['roll_range']:.1f}° (net {features['roll_change']:+.1f}°), "
+            f"pitch range={features['pitch_range']:.1f}° (net {features['pitch_change']:+.1f}°)",
+        )
+        lines.append(
+            f"  - Tilt detected in {features['tilt_fraction'] * 100:.0f}% of readings, "
+            f"continuously for the last {features['tilt_persistence_s']:.1f}s",
+        )
+    elif len(sensor_window):
+        lines.append(f"\nRecent sensor readings ({len(sensor_window)} readings):")
+        last = sensor_window.tail(10)  # Last 10 readings
+        lines.extend(
+            f"  - Time: {last.isoformat(i)}, "
+            f"Accel: ({last.ax[i]:.2f}, {last.ay[i]:.2f}, {last.az[i]:.2f}), "
+            f"Tilt: roll={last.roll[i]:.1f}°, pitch={last.pitch[i]:.1f}°"
+            for i in range(len(last))
+        )
+
+    # Add crash event history if available
+    if crash_events:
+        lines.append("\n=== RECENT CRASH EVENT HISTORY ===")
+        for i, event in enumerate(crash_events, 1):
+            status = "CONFIRMED CRASH" if event.get("is_confirmed_crash") else "FALSE POSITIVE"
+            lines.append(
+                f"  Event {i}: {status} | "
+                f"Time: {event.get('crash_timestamp', 'N/A')} | "
+                f"Severity: {event.get('severity', 'unknown')} | "
+                f"Confidence: {event.get('confidence_score', 0):.2f} | "
+                f"Type: {event.get('crash_type', 'unknown')} | "
+                f"Max G-force: {event.get('max_g_force', 0):.2f}g",
+            )
+        lines.append(
+            "\nNote: Consider recent crash patterns when analyzing. "
+            "Multiple false positives may indicate a pattern (e.g., aggressive riding, sensor issues). "
+            "Recent confirmed crashes may indicate follow-up impacts or related incidents.",
+        )
+
+    # Add current reading (the one that triggered alert)
+    lines.append("\n=== CURRENT READING (ALERT TRIGGER) ===")
+    lines.append(
+        f"Acceleration: ({current_reading.get('ax', 0):.2f}, "
+        f"{current_reading.get('ay', 0):.2f}, {current_reading.get('az', 0):.2f})",
+    )
+    lines.append(
+        f"Tilt: roll={current_reading.get('roll', 0):.1f}°, pitch={current_reading.get('pitch', 0):.1f}°",
+    )
+    lines.append(f"Tilt detected: {current_reading.get('tilt_detected', False)}")
+
+    if include_metrics:
+        # Calculate G-force for current reading
+        ax = current_reading.get("ax", 0)
+        ay = current_reading.get("ay", 0)
+        az = current_reading.get("az", 0)
+        g_force = (ax**2 + ay**2 + az**2) ** 0.5 / 9.81
+        lines.append(f"Calculated G-force: {g_force:.2f}g")
+
+    return "\n".join(lines)
+
+
+def _legacy_prompt(
+    sensor_window: SensorWindow,
+    current_reading: dict[str, Any],
+    crash_events: list[dict[str, Any]] | None,
+    features: dict[str, Any] | None,
+) -> str:
+    """Build the full prompt (instructions inline) exactly as before the compact builder."""
+    # Format sensor data with crash event history
+    formatted_data = _legacy_format(
+        sensor_window=sensor_window,
+        current_reading=current_reading,
+        include_metrics=True,
+        crash_events=crash_events,
+        features=features,
+    )
+
+    # Create prompt with crash event history context
+    crash_history_note = ""
+    if crash_events:
+        confirmed_count = sum(1 for e in crash_events if e.get("is_confirmed_crash"))
+        false_positive_count = len(crash_events) - confirmed_count
+        crash_history_note = (
+            "\n"
+            "\n"
+            "CRASH EVENT HISTORY CONTEXT:\n"
+            f"- Recent events in this time window: {len(crash_events)}\n"
+            f"- Confirmed crashes: {confirmed_count}\n"
+            f"- False positives: {false_positive_count}\n"
+            "\n"
+            "IMPORTANT: Consider this history when analyzing:\n"
+            "- Multiple false positives may indicate a pattern (aggressive riding, sensor issues, "
+            "threshold too sensitive)\n"
+            "- Recent confirmed crashes may indicate follow-up impacts or related incidents\n"
+            "- Use this context to improve accuracy and reduce false positives"
+        )
+
+    # Create prompt (the trailing space after "system." is part of the original prompt)
+    return (
+        "You are analyzing sensor data from a motorcycle helmet crash detection system. \n"
+        "A threshold alert was triggered (G-force or tilt exceeded limits).\n"
+        "\n"
+        f"{formatted_data}{crash_history_note}\n"
+        "\n"
+        "Analyze this data and determine if this represents an actual crash event or a false positive "
+        "(e.g., sudden braking, helmet removal, normal riding).\n"
+        "\n"
+        "Respond with a JSON object containing:\n"
+        "{\n"
+        '    "is_crash": boolean,\n'
+        '    "confidence": float (0.0 to 1.0),\n'
+        '    "severity": "low" | "medium" | "high",\n'
+        '    "crash_type": string (e.g., "frontal_impact", "side_impact", "fall", "false_positive"),\n'
+        '    "reasoning": string (brief explanation),\n'
+        '    "key_indicators": array of strings (e.g., ["high_g_force", "sudden_tilt", "sustained_acceleration"]),\n'
+        '    "false_positive_risk": float (0.0 to 1.0)\n'
+        "}\n"
+        "\n"
+        "Important considerations:\n"
+        "- High G-force alone might be sudden braking (false positive)\n"
+        "- Sustained tilt might indicate actual crash or helmet removal\n"
+        "- Look at the pattern over time, not just the current reading\n"
+        "- Consider motorcycle riding context (acceleration, braking, cornering)\n"
+        "- Use crash event history to identify patterns and improve accuracy\n"
+        "\n"
+        "Respond with ONLY the JSON object, no additional text."
+    )
+
+
+def _synthetic_alert(lookback_seconds: int, rate_hz: int) -> tuple[SensorWindow, dict[str, Any], list[dict[str, Any]]]:
+    """Generate a window ending in an impact and tumble, plus a short crash history."""
+    rng = random.Random(7)  # noqa: S311
+    count = lookback_seconds * rate_hz
+    end_us = int(time.time() * 1_000_000)
+    rows = []
+    for i in range(count):
+        after = i > count * 0.8
+        spike = abs(i - int(count * 0.8)) < rate_hz // 10
+        rows.append(
+            (
+                end_us - (count - i) * 1_000_000 // rate_hz,
+                rng.gauss(0.0, 1.5) + (40.0 if spike else 0.0),
+                rng.gauss(0.0, 1.5),
+                rng.gauss(9.81, 1.0) * (0.2 if after else 1.0),
+                (80.0 if after else 10 * math.sin(i / 50)) + rng.gauss(0, 1),
+                (20.0 if after else 5 * math.cos(i / 70)) + rng.gauss(0, 1),
+                after,
+            ),
+        )
+    window = SensorWindow.from_rows(rows, count)
+    ax, ay, az, roll, pitch, tilt = rows[-1][1:]
+    current = {"ax": ax, "ay": ay, "az": az, "roll": roll, "pitch": pitch, "tilt_detected": tilt}
+    history = [
+        {
+            "is_confirmed_crash": False,
+            "confidence_score": 0.72,
+            "severity": "low",
+            "crash_type": "false_positive",
+            "max_g_force": 3.1,
+            "crash_timestamp": datetime.now(tz=UTC) - timedelta(minutes=5),
+        },
+    ]
+    return window, current, history
+
+
+class Command(BaseCommand):
+    """Compares prompt size (and optionally live model latency) of the legacy and compact prompts."""
+
+    help = (
+        "Benchmarks crash analysis prompt size for the legacy verbose prompt vs the compact "
+        "token-budgeted prompt; with --count-tokens/--live it also asks Gemini for exact token "
+        "counts and end-to-end latency"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--lookbacks", type=str, default="30,90,180", help="Comma-separated lookbacks (s)")
+        parser.add_argument("--rate-hz", type=int, default=50, help="Synthetic sample rate")
+        parser.add_argument("--count-tokens", action="store_true", help="Use the API token counter")
+        parser.add_argument("--live", type=int, default=0, help="Model calls per prompt to time (uses quota)")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        client = None
+        if options["count_tokens"] or options["live"]:
+            if genai is None or not app_settings.gemini_api_key:
+                self.stderr.write("google-genai and GEMINI_API_KEY are required for --count-tokens/--live")
+                return
+            client = genai.Client(api_key=app_settings.gemini_api_key)
+        model = app_settings.gemini_model
+
+        for lookback in (int(value) for value in options["lookbacks"].split(",")):  # type: ignore[union-attr]
+            window, current, history = _synthetic_alert(lookback, options["rate_hz"])  # type: ignore[arg-type]
+            features = extract_crash_features(window, current).to_dict()
+            legacy = _legacy_prompt(window, current, history, features)
+            compact = build_crash_prompt(window, current, lookback, history, features)
+            compact_total = SYSTEM_INSTRUCTION + "\n" + compact
+
+            self.stdout.write(
+                f"\nlookback={lookback}s ({len(window)} readings, budget {token_budget_for(lookback)} tokens)",
+            )
+            self.stdout.write(
+                f"  legacy : {len(legacy):6d} chars, ~{estimate_tokens(legacy):5d} tokens, "
+                f"{0 if features else min(10, len(window))} readings (instructions inline)",
+            )
+            self.stdout.write(
+                f"  compact: {len(compact):6d} chars, ~{estimate_tokens(compact):5d} tokens "
+                f"{max(0, compact.count(chr(10)) - len(history) - 3)} readings "
+                f"(+~{estimate_tokens(SYSTEM_INSTRUCTION)} tokens system instruction)",
+            )
+
+            if client is not None and options["count_tokens"]:
+                legacy_tokens = client.models.count_tokens(model=model, contents=legacy).total_tokens
+                compact_tokens = client.models.count_tokens(model=model, contents=compact_total).total_tokens
+                self.stdout.write(f"  exact tokens: legacy={legacy_tokens}, compact+system={compact_tokens}")
+
+            if client is not None and options["live"]:
+                for name, kwargs in (
+                    ("legacy", {"contents": legacy}),
+                    (
+                        "compact",
+                        {
+                            "contents": compact,
+                            "config": genai.types.GenerateContentConfig(system_instruction=SYSTEM_INSTRUCTION),
+                        },
+                    ),
+                ):
+                    latencies = []
+                    for _ in range(options["live"]):  # type: ignore[call-overload]
+                        started = time.perf_counter()
+                        client.models.generate_content(model=model, **kwargs)
+                        latencies.append((time.perf_counter() - started) * 1000)
+                    self.stdout.write(
+                        f"  {name} latency: median {statistics.median(latencies):.0f} ms, "
+                        f"max {max(latencies):.0f} ms over {len(latencies)} calls",
+                    )
@@ -0,0 +1,81 @@
+"""Management command to benchmark per-push latency of fresh vs pooled Expo clients."""
+
+import statistics
+import time
+from collections.abc import Callable
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from sentry.settings.config import settings as app_settings
+
+from device.services.fcm_service import EXPO_HEADERS, get_expo_client, httpx
+
+
+class Command(BaseCommand):
+    """Compares a new httpx.Client per push with the process-wide pooled client."""
+
+    help = (
+        "Sends test pushes to the Expo API (or --url) with a fresh client per push and with the pooled "
+        "keep-alive client, and reports per-push latency. The default token is not registered, so Expo "
+        "answers with an error ticket and nothing is delivered"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--url", type=str, default=None, help="Push endpoint (defaults to settings)")
+        parser.add_argument("--count", type=int, default=20, help="Pushes per client mode")
+        parser.add_argument(
+            "--token",
+            type=str,
+            default="ExponentPushToken[sentry-benchmark]",
+            help="Push token to target (use an unregistered token to avoid delivering notifications)",
+        )
+
+    def _time_pushes(self, send: Callable[[], "httpx.Response"], count: int) -> tuple[list[float], str]:
+        """Return per-push wall times in ms and the HTTP version of the last response."""
+        timings = []
+        version = "?"
+        for _ in range(count):
+            start = time.perf_counter()
+            response = send()
+            timings.append((time.perf_counter() - start) * 1000)
+            version = response.http_version
+        return timings, version
+
+    def _report(self, label: str, timings: list[float], version: str) -> None:
+        ordered = sorted(timings)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        self.stdout.write(
+            f"{label:<28} {version:<9} mean={statistics.fmean(timings):7.1f}ms "
+            f"p50={statistics.median(timings):7.1f}ms p95={p95:7.1f}ms max={ordered[-1]:7.1f}ms",
+        )
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        client = get_expo_client()
+        if client is None:
+            msg = "httpx package not available"
+            raise CommandError(msg)
+        url: str = options["url"] or app_settings.expo_push_api_url  # type: ignore[assignment]
+        count: int = options["count"]  # type: ignore[assignment]
+        message = {"to": options["token"], "title": "Sentry benchmark", "body": "Latency benchmark", "priority": "high"}
+
+        def fresh() -> "httpx.Response":
+            # The previous behaviour: new connection, TCP and TLS handshake per push
+            with httpx.Client(timeout=10.0) as one_off:
+                return one_off.post(url, json=message, headers=EXPO_HEADERS)
+
+        def pooled() -> "httpx.Response":
+            return client.post(url, json=message)
+
+        self.stdout.write(f"Sending {count} pushes per mode to {url}")
+        fresh_timings, fresh_version = self._time_pushes(fresh, count)
+        cold_timings, pooled_version = self._time_pushes(pooled, 1)
+        warm_timings, pooled_version = self._time_pushes(pooled, count)
+
+        self._report("fresh client per push", fresh_timings, fresh_version)
+        self._report("pooled client (cold, 1st)", cold_timings, pooled_version)
+        self._report("pooled client (warm)", warm_timings, pooled_version)
+        saved = statistics.median(fresh_timings) - statistics.median(warm_timings)
+        self.stdout.write(
+            self.style.SUCCESS(f"Warm pooled pushes save {saved:.1f}ms per push at the median"),  # type: ignore[attr-defined]
+        )
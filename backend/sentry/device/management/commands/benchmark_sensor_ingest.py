@@ -0,0 +1,102 @@
+"""Management command to benchmark JSON vs binary frame sensor ingest decoding."""
+
+import json
+import math
+import random
+import time
+import zlib
+from collections.abc import Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from device.schemas import DeviceDataBatchRequest, DeviceDataRequest
+from device.services.sensor_ingest import SensorIngestService
+from device.utils.sensor_frame import decode_frame, encode_frame
+
+
+def _synthetic_readings(count: int, interval_ms: int) -> list[dict]:
+    """Generate plausible MPU6050 readings at a fixed sample interval."""
+    rng = random.Random(42)  # noqa: S311
+    start = int(time.time() * 1000) - count * interval_ms
+    return [
+        {
+            "ax": rng.gauss(0.0, 1.5),
+            "ay": rng.gauss(0.0, 1.5),
+            "az": rng.gauss(9.81, 1.0),
+            "roll": 10 * math.sin(i / 50),
+            "pitch": 5 * math.cos(i / 70),
+            "tilt_detected": rng.random() < 0.01,  # noqa: PLR2004
+            "timestamp": start + i * interval_ms,
+        }
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    """Benchmarks payload size and server-side decode time of the ingest formats."""
+
+    help = "Benchmarks payload size and decode time of JSON vs binary frame sensor uploads (no DB writes)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--samples", type=int, default=500, help="Readings per upload")
+        parser.add_argument("--interval-ms", type=int, default=20, help="Sample interval in ms")
+        parser.add_argument("--iterations", type=int, default=200, help="Decode iterations per format")
+
+    def _time(self, func: Callable[[], object], iterations: int) -> float:
+        """Return mean wall time of ``func`` in microseconds."""
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) / iterations * 1_000_000
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        samples: int = options["samples"]  # type: ignore[assignment]
+        iterations: int = options["iterations"]  # type: ignore[assignment]
+        device_id = "SENTRY-ESP32-0001"
+        readings = _synthetic_readings(samples, options["interval_ms"])  # type: ignore[arg-type]
+        ingest_service = SensorIngestService()
+
+        single_bodies = [json.dumps({**reading, "device_id": device_id}).encode() for reading in readings]
+        batch_body = json.dumps({"device_id": device_id, "readings": readings}).encode()
+        frame_body = encode_frame(device_id, readings)
+        frame_deflate = encode_frame(device_id, readings, content_encoding="deflate")
+
+        def parse_single() -> None:
+            for body in single_bodies:
+                payload = DeviceDataRequest.model_validate_json(body)
+                ingest_service.build_rows_from_values(
+                    payload.device_id,
+                    [(0, payload.ax, payload.ay, payload.az, payload.roll, payload.pitch, payload.tilt_detected)],
+                )
+
+        def parse_batch() -> None:
+            payload = DeviceDataBatchRequest.model_validate_json(batch_body)
+            ingest_service.build_rows(payload.device_id, payload.readings)
+
+        def parse_frame() -> None:
+            frame = decode_frame(frame_body)
+            ingest_service.build_rows_from_values(frame.device_id, frame.samples)
+
+        def parse_frame_deflate() -> None:
+            frame = decode_frame(frame_deflate, "deflate")
+            ingest_service.build_rows_from_values(frame.device_id, frame.samples)
+
+        rows = [
+            ("JSON, one reading per POST", sum(map(len, single_bodies)), samples, parse_single),
+            ("JSON batch", len(batch_body), 1, parse_batch),
+            ("JSON batch (gzip)", len(zlib.compress(batch_body, wbits=31)), 1, parse_batch),
+            ("Binary frame", len(frame_body), 1, parse_frame),
+            ("Binary frame (deflate)", len(frame_deflate), 1, parse_frame_deflate),
+        ]
+
+        self.stdout.write(f"{samples} readings per upload, {iterations} iterations\n")
+        self.stdout.write(
+            f"{'format':<28}{'bytes':>10}{'B/sample':>10}{'requests':>10}{'decode us':>12}{'us/sample':>11}",
+        )
+        for name, size, requests, func in rows:
+            micros = self._time(func, max(1, iterations // (10 if requests > 1 else 1)))
+            self.stdout.write(
+                f"{name:<28}{size:>10}{size / samples:>10.1f}{requests:>10}{micros:>12.0f}{micros / samples:>11.2f}",
+            )
@@ -0,0 +1,104 @@
+"""Management command to evaluate crash analysers against user-labelled crash events."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from sentry.settings.config import settings as app_settings
+
+from device.services.crash_evaluation import (
+    ANALYSERS,
+    case_report,
+    load_analyser,
+    load_evaluation_cases,
+    run_analyser,
+    summarize_results,
+)
+
+
+def _fmt(value: float | None, spec: str = ".3f") -> str:
+    return "n/a" if value is None else format(value, spec)
+
+
+class Command(BaseCommand):
+    """Replays labelled CrashEvents through crash analysers and reports accuracy and cost."""
+
+    help = (
+        "Replays CrashEvents with user feedback through one or more analysers "
+        f"({', '.join(ANALYSERS)} or a dotted class path) and reports precision/recall, "
+        "false-positive rate, latency percentiles and tokens per alert"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--analyser",
+            action="append",
+            dest="analysers",
+            default=None,
+            help="Analyser to evaluate (repeatable, default: rules and classifier)",
+        )
+        parser.add_argument("--parallel", type=int, default=4, help="Maximum analyser calls in flight")
+        parser.add_argument("--limit", type=int, default=None, help="Evaluate only the newest N labelled events")
+        parser.add_argument(
+            "--lookback",
+            type=int,
+            default=app_settings.gemini_analysis_lookback_seconds,
+            help="Seconds of sensor data to rebuild before each crash",
+        )
+        parser.add_argument("--output", type=str, default=None, help="Write a JSON report to this path")
+        parser.add_argument("--include-cases", action="store_true", help="Add per-event verdicts to the report")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        names = options["analysers"] or ["rules", "classifier"]
+        try:
+            analysers = [load_analyser(name) for name in names]  # type: ignore[union-attr]
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        cases = list(load_evaluation_cases(options["lookback"], options["limit"]))  # type: ignore[arg-type]
+        if not cases:
+            msg = "No CrashEvents with user feedback to evaluate"
+            raise CommandError(msg)
+        positives = sum(case.is_crash for case in cases)
+        self.stdout.write(
+            f"Evaluating {len(cases)} labelled events ({positives} crashes, {len(cases) - positives} false alarms)",
+        )
+
+        report = {
+            "generated_at": datetime.now(tz=UTC).isoformat(),
+            "config": {
+                "lookback_seconds": options["lookback"],
+                "parallel": options["parallel"],
+                "limit": options["limit"],
+                "gemini_model": app_settings.gemini_model,
+                "gemini_response_mode": app_settings.gemini_response_mode,
+                "prompt_token_max": app_settings.gemini_prompt_token_max,
+            },
+            "dataset": {"events": len(cases), "crashes": positives, "false_alarms": len(cases) - positives},
+            "analysers": {},
+        }
+        for analyser in analysers:
+            results = run_analyser(analyser, cases, parallel=options["parallel"])  # type: ignore[arg-type]
+            summary = summarize_results(cases, results)
+            if options["include_cases"]:
+                summary["cases"] = [case_report(case, result) for case, result in zip(cases, results, strict=True)]
+            report["analysers"][analyser.name] = summary  # type: ignore[index]
+
+            latency = summary["latency_ms"]
+            self.stdout.write(
+                f"{analyser.name}: precision={_fmt(summary['precision'])} recall={_fmt(summary['recall'])} "
+                f"fpr={_fmt(summary['false_positive_rate'])} | latency p50={_fmt(latency['p50'], '.1f')}ms "
+                f"p95={_fmt(latency['p95'], '.1f')}ms p99={_fmt(latency['p99'], '.1f')}ms | "
+                f"tokens/alert={_fmt(summary['tokens']['prompt_per_alert'], '.0f')} in, "
+                f"{_fmt(summary['tokens']['output_per_alert'], '.0f')} out | "
+                f"errors={sum(summary['errors'].values())}",
+            )
+
+        if options["output"]:
+            path = Path(options["output"])  # type: ignore[arg-type]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, indent=2, default=str))
+            self.stdout.write(self.style.SUCCESS(f"Wrote evaluation report to {path}"))  # type: ignore[attr-defined]
@@ -0,0 +1,46 @@
+"""Management command to pre-create and expire SensorData partitions."""
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from device.services.sensor_partitions import SensorPartitionService
+
+
+class Command(BaseCommand):
+    """Pre-creates upcoming sensor data partitions and detaches or drops expired ones."""
+
+    help = "Pre-creates upcoming sensor data partitions and detaches or drops expired ones (run from cron)"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--premake", type=int, default=None, help="Future partitions to keep ready")
+        parser.add_argument("--retention-days", type=int, default=None, help="Days of raw data to keep")
+        parser.add_argument("--drop", action="store_true", help="Drop expired partitions instead of detaching")
+        parser.add_argument("--skip-expire", action="store_true", help="Only create partitions")
+        parser.add_argument("--list", action="store_true", help="List partitions and exit")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        service = SensorPartitionService()
+        if not service.is_supported():
+            message = "Sensor data table is not partitioned (requires PostgreSQL and migration device.0005)"
+            raise CommandError(message)
+
+        if options["list"]:
+            for partition in service.list_partitions():
+                bounds = "DEFAULT" if partition.is_default else f"[{partition.lower}, {partition.upper})"
+                self.stdout.write(f"{partition.name}  {bounds}")
+            return
+
+        created = service.ensure_partitions(premake=options["premake"])  # type: ignore[arg-type]
+        for name in created:
+            self.stdout.write(self.style.SUCCESS(f"Created {name}"))  # type: ignore[attr-defined]
+
+        if not options["skip_expire"]:
+            expired = service.expire_partitions(
+                retention_days=options["retention_days"],  # type: ignore[arg-type]
+                drop=bool(options["drop"]),
+            )
+            for name in expired:
+                self.stdout.write(self.style.WARNING(f"Expired {name}"))  # type: ignore[attr-defined]
+
+        self.stdout.write(f"{len(created)} partitions created")
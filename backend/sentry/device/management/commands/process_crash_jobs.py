@@ -0,0 +1,107 @@
+"""Management command to run the asynchronous crash alert worker."""
+
+import logging
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import FrameType
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections, connection
+
+from device.controllers.crash_controller import run_crash_alert_pipeline
+from device.models import CrashAlertJob
+from device.schemas.crash_schema import CrashAlertRequest
+from device.services.crash_jobs import CrashAlertJobService
+from device.services.notification_dispatcher import notification_dispatcher
+
+logger = logging.getLogger("device")
+
+
+class Command(BaseCommand):
+    """Claims queued crash alert jobs and runs the Tier 2 analysis pipeline on them."""
+
+    help = (
+        "Runs queued crash alerts (POST /crash/alert/async) through the analysis pipeline. "
+        "Safe to run several copies; jobs are claimed with SELECT FOR UPDATE SKIP LOCKED"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--poll-interval", type=float, default=0.5, help="Seconds to sleep when idle")
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=0,
+            help="Exit after claiming this many jobs (0 = run forever)",
+        )
+        parser.add_argument("--once", action="store_true", help="Drain the queue once and exit")
+        parser.add_argument("--concurrency", type=int, default=4, help="Jobs processed in parallel (threads)")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        service = CrashAlertJobService()
+        concurrency: int = max(1, options["concurrency"])  # type: ignore[call-overload]
+        max_jobs: int = options["max_jobs"]  # type: ignore[assignment]
+        claimed = 0
+        self.stdout.write(  # type: ignore[attr-defined]
+            self.style.SUCCESS(f"Crash alert job worker started (concurrency={concurrency})"),  # type: ignore[attr-defined]
+        )
+
+        # Jobs run on worker threads so alerts arriving together are analysed
+        # together (see AnalysisBatcher)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="crash-job") as pool:
+            in_flight: set[Future] = set()
+            while not self._stopping and not (max_jobs and claimed >= max_jobs):
+                in_flight = {future for future in in_flight if not future.done()}
+                if len(in_flight) >= concurrency:
+                    wait(in_flight, return_when=FIRST_COMPLETED)
+                    continue
+
+                close_old_connections()
+                job = service.claim_next()
+                if job is None:
+                    if service.fail_abandoned():
+                        logger.warning("[WARN] Marked abandoned crash alert jobs as failed")
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])  # type: ignore[arg-type]
+                    continue
+
+                in_flight.add(pool.submit(self._run_job, service, job))
+                claimed += 1
+            wait(in_flight)
+        # Let after-commit crash notifications of the last jobs go out before exiting
+        notification_dispatcher.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"Crash alert job worker stopped after {claimed} jobs"))  # type: ignore[attr-defined]
+
+    def _run_job(self, service: CrashAlertJobService, job: CrashAlertJob) -> None:
+        """Run one job through the pipeline and record its outcome (worker thread)."""
+        started = time.monotonic()
+        try:
+            data = CrashAlertRequest.model_validate(job.payload)
+            response = run_crash_alert_pipeline(data, job.user, job=job)
+        except Exception as exc:
+            logger.exception("[ERROR] Crash alert job failed (job_id=%s, attempt=%s)", job.id, job.attempts)
+            service.fail(job, f"{type(exc).__name__}: {exc}")
+        else:
+            service.complete(job, response.model_dump(mode="json"))
+            logger.info(
+                "[OK] Crash alert job done (job_id=%s, device_id=%s, is_crash=%s, %.0f ms)",
+                job.id,
+                job.device_id,
+                response.is_crash,
+                (time.monotonic() - started) * 1000,
+            )
+        finally:
+            connection.close()
+
+    def _request_stop(self, signum: int, _frame: FrameType | None) -> None:
+        """Finish the current job, then exit."""
+        logger.info("Crash alert job worker received signal %s, stopping", signum)
+        self._stopping = True
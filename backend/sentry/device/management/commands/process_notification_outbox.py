@@ -0,0 +1,80 @@
+"""Management command to run the crash notification outbox worker."""
+
+import logging
+import signal
+import time
+from types import FrameType
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import close_old_connections
+from sentry.settings.config import settings as app_settings
+
+from device.services.notification_outbox import NotificationOutboxService
+
+logger = logging.getLogger("device")
+
+
+class Command(BaseCommand):
+    """Sends due crash alert pushes from the notification outbox, retrying failures."""
+
+    help = (
+        "Sends pending crash alert pushes from the notification outbox in batches and retries failed ones "
+        "with jittered exponential backoff. Safe to run several copies; pushes are claimed with "
+        "SELECT FOR UPDATE SKIP LOCKED"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Seconds to sleep when idle")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=app_settings.notification_outbox_batch_size,
+            help="Pushes claimed and sent per batch",
+        )
+        parser.add_argument("--once", action="store_true", help="Send everything currently due and exit")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        service = NotificationOutboxService()
+        batch_size: int = max(1, options["batch_size"])  # type: ignore[call-overload]
+        timeout = app_settings.notification_send_timeout_seconds
+        claimed = sent = 0
+        self.stdout.write(  # type: ignore[attr-defined]
+            self.style.SUCCESS(f"Notification outbox worker started (batch_size={batch_size})"),  # type: ignore[attr-defined]
+        )
+
+        while not self._stopping:
+            close_old_connections()
+            rows = service.claim(batch_size)
+            if not rows:
+                if service.fail_abandoned():
+                    logger.warning("[WARN] Marked abandoned crash alert pushes as failed")
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])  # type: ignore[arg-type]
+                continue
+
+            started = time.monotonic()
+            accepted = service.deliver(rows, timeout=timeout)
+            claimed += len(rows)
+            sent += accepted
+            logger.info(
+                "[NOTIFY] Outbox batch done (sent=%s/%s, %.0f ms)",
+                accepted,
+                len(rows),
+                (time.monotonic() - started) * 1000,
+            )
+
+        self.stdout.write(  # type: ignore[attr-defined]
+            self.style.SUCCESS(f"Notification outbox worker stopped after sending {sent}/{claimed} pushes"),  # type: ignore[attr-defined]
+        )
+
+    def _request_stop(self, signum: int, _frame: FrameType | None) -> None:
+        """Finish the current batch, then exit."""
+        logger.info("Notification outbox worker received signal %s, stopping", signum)
+        self._stopping = True
@@ -0,0 +1,38 @@
+"""Management command to roll up raw sensor data and apply retention."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from device.services.sensor_rollup import SensorRollupService
+
+
+class Command(BaseCommand):
+    """Aggregates raw sensor readings into per-second/per-minute rollups and prunes old rows."""
+
+    help = (
+        "Aggregates raw sensor readings into per-second and per-minute rollups (resumable) "
+        "and optionally prunes raw rows beyond the retention horizon"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--chunk-minutes", type=int, default=10, help="Raw time range per transaction")
+        parser.add_argument("--prune", action="store_true", help="Delete data beyond retention horizons")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        service = SensorRollupService()
+
+        seconds = service.rollup_seconds(chunk=timedelta(minutes=options["chunk_minutes"]))  # type: ignore[arg-type]
+        minutes = service.rollup_minutes()
+        self.stdout.write(
+            self.style.SUCCESS(  # type: ignore[attr-defined]
+                f"Wrote {seconds} per-second and {minutes} per-minute buckets "
+                f"(watermarks: second={service.get_watermark('second')}, minute={service.get_watermark('minute')})",
+            ),
+        )
+
+        if options["prune"]:
+            raw_deleted, seconds_deleted = service.prune()
+            self.stdout.write(f"Pruned {raw_deleted} raw readings and {seconds_deleted} per-second rollups")
@@ -0,0 +1,108 @@
+"""Management command to train the local crash pre-screening classifier."""
+
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from device.models import CrashEvent
+from device.services.crash_classifier import (
+    CrashClassifier,
+    choose_thresholds,
+    default_model_path,
+    fit_logistic_regression,
+)
+from device.services.crash_features import FEATURE_NAMES
+
+
+class Command(BaseCommand):
+    """Trains the Tier 1.5 classifier from CrashEvent user feedback."""
+
+    help = (
+        "Trains the local crash pre-screening classifier on CrashEvents with user feedback, "
+        "picks clear/confirm thresholds from out-of-fold predictions and writes the model file"
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument("--output", type=str, default=None, help="Model file path (defaults to settings)")
+        parser.add_argument("--min-samples", type=int, default=30, help="Minimum labelled events required")
+        parser.add_argument("--precision", type=float, default=0.97, help="Required precision of local verdicts")
+        parser.add_argument("--folds", type=int, default=5, help="Cross-validation folds for threshold selection")
+        parser.add_argument("--l2", type=float, default=1.0, help="L2 regularisation strength")
+        parser.add_argument("--dry-run", action="store_true", help="Report metrics without writing the model")
+
+    def handle(self, *_args: tuple, **options: dict) -> None:
+        """Handle the command execution."""
+        events = (
+            CrashEvent.objects.exclude(user_feedback="")  # type: ignore[attr-defined]
+            .exclude(crash_features={})
+            .values_list("crash_features", "user_feedback")
+        )
+        vectors, labels = [], []
+        for features, feedback in events:
+            if all(name in features for name in FEATURE_NAMES):
+                vectors.append([features[name] for name in FEATURE_NAMES])
+                labels.append(1.0 if feedback == "true_positive" else 0.0)
+
+        if len(labels) < options["min_samples"]:  # type: ignore[operator]
+            msg = f"Only {len(labels)} labelled events with features (need {options['min_samples']})"
+            raise CommandError(msg)
+        x = np.asarray(vectors, dtype=np.float64)
+        y = np.asarray(labels)
+        if y.min() == y.max():
+            msg = "Training data contains a single class; need both true and false positives"
+            raise CommandError(msg)
+
+        # Out-of-fold probabilities so thresholds are not picked on memorised samples
+        folds = np.arange(len(y)) % options["folds"]  # type: ignore[operator]
+        np.random.default_rng(0).shuffle(folds)
+        oof = np.empty(len(y))
+        for fold in range(options["folds"]):  # type: ignore[call-overload]
+            test = folds == fold
+            mean, scale, weights, bias = fit_logistic_regression(x[~test], y[~test], l2=options["l2"])  # type: ignore[arg-type]
+            oof[test] = 1.0 / (1.0 + np.exp(-(((x[test] - mean) / scale) @ weights + bias)))
+
+        clear_threshold, confirm_threshold = choose_thresholds(oof, y, options["precision"])  # type: ignore[arg-type]
+        confirmed = oof >= confirm_threshold
+        cleared = oof <= clear_threshold
+        decided = confirmed | cleared
+        metrics = {
+            "samples": len(y),
+            "positives": int(y.sum()),
+            "oof_accuracy": float(((oof >= 0.5) == y).mean()),  # noqa: PLR2004
+            "short_circuit_share": float(decided.mean()),
+            "confirmed_share": float(confirmed.mean()),
+            "cleared_share": float(cleared.mean()),
+            "short_circuit_accuracy": float((y[decided] == confirmed[decided]).mean()) if decided.any() else None,
+        }
+
+        mean, scale, weights, bias = fit_logistic_regression(x, y, l2=options["l2"])  # type: ignore[arg-type]
+        model = CrashClassifier(
+            feature_names=list(FEATURE_NAMES),
+            mean=mean.tolist(),
+            scale=scale.tolist(),
+            weights=weights.tolist(),
+            bias=bias,
+            clear_threshold=clear_threshold,
+            confirm_threshold=confirm_threshold,
+            trained_on=len(y),
+            metrics=metrics,
+        )
+
+        self.stdout.write(
+            f"Trained on {metrics['samples']} events ({metrics['positives']} crashes) | "
+            f"out-of-fold accuracy={metrics['oof_accuracy']:.3f}",
+        )
+        self.stdout.write(
+            f"Thresholds: clear<={clear_threshold:.3f}, confirm>={confirm_threshold:.3f} | "
+            f"short-circuit share={metrics['short_circuit_share']:.1%} "
+            f"(confirmed {metrics['confirmed_share']:.1%}, cleared {metrics['cleared_share']:.1%}), "
+            f"accuracy on short-circuited alerts={metrics['short_circuit_accuracy']}",
+        )
+
+        if options["dry_run"]:
+            return
+        path = Path(options["output"]) if options["output"] else default_model_path()  # type: ignore[arg-type]
+        model.save(path)
+        self.stdout.write(self.style.SUCCESS(f"Wrote crash classifier to {path}"))  # type: ignore[attr-defined]
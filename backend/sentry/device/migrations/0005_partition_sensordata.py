@@ -0,0 +1,106 @@
+# Converts device_sensordata into a PostgreSQL range-partitioned table on "timestamp".
+#
+# The existing table is kept, its primary key widened to the parent's (id, "timestamp"),
+# and attached as the partition covering everything before tomorrow (UTC); new days are
+# pre-created here and afterwards by the manage_sensor_partitions command, which
+# start-prod.sh re-runs periodically. A DEFAULT partition catches rows outside any
+# pre-created range so inserts never fail. Model state is unchanged, so this is a
+# plain RunPython that does nothing on non-PostgreSQL databases. Reversing it leaves the
+# partitioned table in place, which is schema-compatible with the model.
+
+from datetime import UTC, datetime, timedelta
+
+from django.db import migrations
+
+PREMAKE_DAYS = 3
+
+
+def partition_sensor_data(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+
+    user_table = apps.get_model("core", "User")._meta.db_table
+    today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    cutover = today + timedelta(days=1)
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM device_sensordata")
+        max_id = cursor.fetchone()[0]
+
+        # Move the existing table out of the way, freeing its names
+        cursor.execute("ALTER TABLE device_sensordata RENAME TO device_sensordata_legacy")
+        # A partition's primary key must match the parent's (id, "timestamp"); attaching
+        # a table that still has PRIMARY KEY (id) fails with "multiple primary keys"
+        cursor.execute("ALTER TABLE device_sensordata_legacy DROP CONSTRAINT device_sensordata_pkey")
+        cursor.execute(
+            "ALTER TABLE device_sensordata_legacy ADD CONSTRAINT device_sensordata_legacy_pkey "
+            'PRIMARY KEY (id, "timestamp")'
+        )
+        cursor.execute("ALTER INDEX device_sens_device__3e8b68_idx RENAME TO device_sensordata_legacy_device_ts_idx")
+        cursor.execute("ALTER TABLE device_sensordata_legacy ALTER COLUMN id DROP IDENTITY IF EXISTS")
+        cursor.execute("ALTER TABLE device_sensordata_legacy ALTER COLUMN id DROP DEFAULT")
+
+        # Partitioned tables cannot carry an identity column on older PostgreSQL; use a plain sequence
+        cursor.execute("CREATE SEQUENCE IF NOT EXISTS device_sensordata_id_seq AS bigint")
+        cursor.execute("ALTER SEQUENCE device_sensordata_id_seq OWNED BY NONE")
+        cursor.execute("SELECT setval('device_sensordata_id_seq', %s, false)", [max_id + 1])
+
+        # The partition key must be part of the primary key
+        cursor.execute(
+            """
+            CREATE TABLE device_sensordata (
+                id bigint NOT NULL DEFAULT nextval('device_sensordata_id_seq'),
+                device_id varchar(255) NOT NULL,
+                ax double precision NOT NULL,
+                ay double precision NOT NULL,
+                az double precision NOT NULL,
+                roll double precision NOT NULL,
+                pitch double precision NOT NULL,
+                tilt_detected boolean NOT NULL,
+                "timestamp" timestamp with time zone NOT NULL,
+                user_id bigint NULL,
+                CONSTRAINT device_sensordata_pkey PRIMARY KEY (id, "timestamp")
+            ) PARTITION BY RANGE ("timestamp")
+            """
+        )
+        cursor.execute("ALTER SEQUENCE device_sensordata_id_seq OWNED BY device_sensordata.id")
+        cursor.execute(
+            f"""
+            ALTER TABLE device_sensordata
+            ADD CONSTRAINT device_sensordata_user_id_fk_{user_table}_id
+            FOREIGN KEY (user_id) REFERENCES {user_table} (id) DEFERRABLE INITIALLY DEFERRED
+            """
+        )
+        # Same name as the model's Meta index so Django's state stays in sync
+        cursor.execute('CREATE INDEX device_sens_device__3e8b68_idx ON device_sensordata (device_id, "timestamp" DESC)')
+        cursor.execute("CREATE INDEX device_sensordata_user_id_idx ON device_sensordata (user_id)")
+
+        cursor.execute(
+            "ALTER TABLE device_sensordata ATTACH PARTITION device_sensordata_legacy "
+            "FOR VALUES FROM (MINVALUE) TO (%s)",
+            [cutover],
+        )
+        cursor.execute("CREATE TABLE device_sensordata_default PARTITION OF device_sensordata DEFAULT")
+
+        for day in range(PREMAKE_DAYS):
+            start = cutover + timedelta(days=day)
+            cursor.execute(
+                f"CREATE TABLE device_sensordata_p{start:%Y%m%d} PARTITION OF device_sensordata "
+                "FOR VALUES FROM (%s) TO (%s)",
+                [start, start + timedelta(days=1)],
+            )
+
+
+class Migration(migrations.Migration):
+
+    atomic = True
+
+    dependencies = [
+        ('core', '0005_usersettings'),
+        ('device', '0004_alter_sensordata_timestamp'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_sensor_data, reverse_code=migrations.RunPython.noop, elidable=False),
+    ]
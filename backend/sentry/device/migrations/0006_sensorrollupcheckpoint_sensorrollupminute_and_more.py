@@ -0,0 +1,88 @@
+# Generated by Django 6.0 on 2026-10-17 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('device', '0005_partition_sensordata'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SensorRollupCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resolution', models.CharField(choices=[('second', 'Second'), ('minute', 'Minute')], max_length=20, unique=True)),
+                ('watermark', models.DateTimeField()),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Sensor Rollup Checkpoint',
+                'verbose_name_plural': 'Sensor Rollup Checkpoints',
+            },
+        ),
+        migrations.CreateModel(
+            name='SensorRollupMinute',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('device_id', models.CharField(max_length=255)),
+                ('bucket_start', models.DateTimeField()),
+                ('sample_count', models.IntegerField()),
+                ('ax_min', models.FloatField()),
+                ('ax_max', models.FloatField()),
+                ('ax_mean', models.FloatField()),
+                ('ay_min', models.FloatField()),
+                ('ay_max', models.FloatField()),
+                ('ay_mean', models.FloatField()),
+                ('az_min', models.FloatField()),
+                ('az_max', models.FloatField()),
+                ('az_mean', models.FloatField()),
+                ('g_peak', models.FloatField()),
+                ('roll_min', models.FloatField()),
+                ('roll_max', models.FloatField()),
+                ('pitch_min', models.FloatField()),
+                ('pitch_max', models.FloatField()),
+                ('tilt_count', models.IntegerField()),
+            ],
+            options={
+                'verbose_name': 'Sensor Rollup (minute)',
+                'verbose_name_plural': 'Sensor Rollups (minute)',
+                'ordering': ['-bucket_start'],
+                'indexes': [models.Index(fields=['bucket_start'], name='device_rollup_minute_bkt_idx')],
+                'constraints': [models.UniqueConstraint(fields=('device_id', 'bucket_start'), name='unique_rollup_minute_bucket')],
+            },
+        ),
+        migrations.CreateModel(
+            name='SensorRollupSecond',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('device_id', models.CharField(max_length=255)),
+                ('bucket_start', models.DateTimeField()),
+                ('sample_count', models.IntegerField()),
+                ('ax_min', models.FloatField()),
+                ('ax_max', models.FloatField()),
+                ('ax_mean', models.FloatField()),
+                ('ay_min', models.FloatField()),
+                ('ay_max', models.FloatField()),
+                ('ay_mean', models.FloatField()),
+                ('az_min', models.FloatField()),
+                ('az_max', models.FloatField()),
+                ('az_mean', models.FloatField()),
+                ('g_peak', models.FloatField()),
+                ('roll_min', models.FloatField()),
+                ('roll_max', models.FloatField()),
+                ('pitch_min', models.FloatField()),
+                ('pitch_max', models.FloatField()),
+                ('tilt_count', models.IntegerField()),
+            ],
+            options={
+                'verbose_name': 'Sensor Rollup (second)',
+                'verbose_name_plural': 'Sensor Rollups (second)',
+                'ordering': ['-bucket_start'],
+                'indexes': [models.Index(fields=['bucket_start'], name='device_rollup_second_bkt_idx')],
+                'constraints': [models.UniqueConstraint(fields=('device_id', 'bucket_start'), name='unique_rollup_second_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-17 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('device', '0006_sensorrollupcheckpoint_sensorrollupminute_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crashevent',
+            name='crash_features',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
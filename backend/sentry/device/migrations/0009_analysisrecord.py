@@ -0,0 +1,42 @@
+# Generated by Django 6.0 on 2026-10-17 16:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('device', '0008_crashalertjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalysisRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('device_id', models.CharField(max_length=255)),
+                ('crash_event_id', models.BigIntegerField(blank=True, null=True)),
+                ('source', models.CharField(max_length=40)),
+                ('outcome', models.CharField(blank=True, max_length=20)),
+                ('model', models.CharField(blank=True, max_length=64)),
+                ('is_crash', models.BooleanField()),
+                ('severity', models.CharField(max_length=10)),
+                ('confidence', models.FloatField()),
+                ('false_positive_risk', models.FloatField()),
+                ('crash_type', models.CharField(blank=True, max_length=64)),
+                ('features', models.JSONField(default=list)),
+                ('prompt_chars', models.PositiveIntegerField(blank=True, null=True)),
+                ('prompt_tokens', models.PositiveIntegerField(blank=True, null=True)),
+                ('output_tokens', models.PositiveIntegerField(blank=True, null=True)),
+                ('batch_size', models.PositiveSmallIntegerField(default=1)),
+                ('latency_ms', models.FloatField()),
+            ],
+            options={
+                'verbose_name': 'Analysis Record',
+                'verbose_name_plural': 'Analysis Records',
+                'indexes': [models.Index(fields=['created_at'], name='device_analysis_created_idx'), models.Index(fields=['device_id', 'created_at'], name='device_analysis_device_idx')],
+            },
+        ),
+    ]
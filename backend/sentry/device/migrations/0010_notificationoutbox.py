@@ -0,0 +1,60 @@
+# Generated by Django 6.0 on 2026-10-17 18:40
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("device", "0009_analysisrecord"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationOutbox",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("device_id", models.CharField(max_length=255)),
+                (
+                    "recipient_role",
+                    models.CharField(choices=[("owner", "Owner"), ("loved_one", "Loved one")], max_length=20),
+                ),
+                ("token", models.CharField(max_length=500)),
+                ("message", models.JSONField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sending", "Sending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("next_attempt_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("locked_until", models.DateTimeField(blank=True, null=True)),
+                ("last_error", models.CharField(blank=True, max_length=255)),
+                ("ticket_id", models.CharField(blank=True, max_length=100)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "crash_event",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="notifications",
+                        to="device.crashevent",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Notification Outbox Entry",
+                "verbose_name_plural": "Notification Outbox",
+                "indexes": [models.Index(fields=["status", "next_attempt_at"], name="device_outbox_due_idx")],
+            },
+        ),
+    ]
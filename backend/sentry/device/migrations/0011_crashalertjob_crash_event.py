@@ -0,0 +1,19 @@
+# Generated by Django 6.0 on 2026-10-17 19:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('device', '0010_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crashalertjob',
+            name='crash_event',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='device.crashevent'),
+        ),
+    ]
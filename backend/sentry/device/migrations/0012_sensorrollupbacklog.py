@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-17 21:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('device', '0011_crashalertjob_crash_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SensorRollupBacklog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('range_start', models.DateTimeField()),
+                ('range_end', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Sensor Rollup Backlog',
+                'verbose_name_plural': 'Sensor Rollup Backlog',
+            },
+        ),
+    ]
@@ -1,7 +1,27 @@
 """Device models."""
 
+from device.models.analysis_record import AnalysisRecord
+from device.models.crash_alert_job import CrashAlertJob
 from device.models.crash_event import CrashEvent
 from device.models.device_token import DeviceToken
+from device.models.notification_outbox import NotificationOutbox
 from device.models.sensor_data import SensorData
+from device.models.sensor_rollup import (
+    SensorRollupBacklog,
+    SensorRollupCheckpoint,
+    SensorRollupMinute,
+    SensorRollupSecond,
+)
 
-__all__ = ["SensorData", "CrashEvent", "DeviceToken"]
+__all__ = [
+    "SensorData",
+    "CrashEvent",
+    "DeviceToken",
+    "SensorRollupSecond",
+    "SensorRollupMinute",
+    "SensorRollupCheckpoint",
+    "SensorRollupBacklog",
+    "CrashAlertJob",
+    "AnalysisRecord",
+    "NotificationOutbox",
+]
@@ -0,0 +1,43 @@
+"""Crash analysis ledger model."""
+
+from typing import ClassVar
+
+from django.db import models
+from django.utils import timezone
+
+
+class AnalysisRecord(models.Model):
+    """Append-only record of one crash alert verdict, whichever tier produced it.
+
+    Rows are written in batches by the analysis ledger and never updated.
+    ``features`` is the window feature vector in ``FEATURE_NAMES`` order.
+    """
+
+    created_at = models.DateTimeField(default=timezone.now)  # Analysis time, not flush time
+    device_id = models.CharField(max_length=255)
+    crash_event_id = models.BigIntegerField(null=True, blank=True)  # Set when the verdict created a CrashEvent
+    source = models.CharField(max_length=40)  # gemini, local_classifier, rules, verdict_cache:<kind>
+    outcome = models.CharField(max_length=20, blank=True)  # Gemini call outcome (see analyze_crash_data)
+    model = models.CharField(max_length=64, blank=True)
+    is_crash = models.BooleanField()
+    severity = models.CharField(max_length=10)
+    confidence = models.FloatField()
+    false_positive_risk = models.FloatField()
+    crash_type = models.CharField(max_length=64, blank=True)
+    features = models.JSONField(default=list)
+    prompt_chars = models.PositiveIntegerField(null=True, blank=True)
+    prompt_tokens = models.PositiveIntegerField(null=True, blank=True)
+    output_tokens = models.PositiveIntegerField(null=True, blank=True)
+    batch_size = models.PositiveSmallIntegerField(default=1)
+    latency_ms = models.FloatField()
+
+    class Meta:  # noqa: D106
+        verbose_name = "Analysis Record"
+        verbose_name_plural = "Analysis Records"
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["created_at"], name="device_analysis_created_idx"),
+            models.Index(fields=["device_id", "created_at"], name="device_analysis_device_idx"),
+        ]
+
+    def __str__(self) -> str:  # noqa: D105
+        return f"Analysis of {self.device_id} at {self.created_at} ({self.source}, is_crash={self.is_crash})"
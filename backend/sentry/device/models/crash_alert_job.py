@@ -0,0 +1,51 @@
+"""Crash alert job model."""
+
+import uuid
+from typing import ClassVar
+
+from core.models import User
+from django.db import models
+
+from device.models.crash_event import CrashEvent
+
+
+class CrashAlertJob(models.Model):
+    """Queued crash alert awaiting Tier 2 analysis by the job worker."""
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    device_id = models.CharField(max_length=255)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True)
+    payload = models.JSONField()  # Validated CrashAlertRequest
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_QUEUED, "Queued"),
+            (STATUS_RUNNING, "Running"),
+            (STATUS_SUCCEEDED, "Succeeded"),
+            (STATUS_FAILED, "Failed"),
+        ],
+        default=STATUS_QUEUED,
+    )
+    result = models.JSONField(null=True, blank=True)  # CrashAlertResponse once succeeded
+    # Set in the transaction that creates the event, so a retried job never creates or notifies twice
+    crash_event = models.ForeignKey(CrashEvent, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:  # noqa: D106
+        verbose_name = "Crash Alert Job"
+        verbose_name_plural = "Crash Alert Jobs"
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["status", "created_at"], name="device_crashjob_status_idx"),
+        ]
+
+    def __str__(self) -> str:  # noqa: D105
+        return f"Crash alert job {self.id} ({self.status}) for {self.device_id}"
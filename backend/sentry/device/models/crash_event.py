@@ -30,6 +30,7 @@ class CrashEvent(models.Model):
     max_g_force = models.FloatField(null=True, blank=True)
     impact_acceleration = models.JSONField(default=dict, blank=True)
     final_tilt = models.JSONField(default=dict, blank=True)
+    crash_features = models.JSONField(default=dict, blank=True)  # Sensor window features (see crash_features.py)
     # GPS Location at Crash Time
     crash_latitude = models.FloatField(null=True, blank=True)
     crash_longitude = models.FloatField(null=True, blank=True)
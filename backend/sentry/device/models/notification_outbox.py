@@ -0,0 +1,63 @@
+"""Notification outbox model."""
+
+from typing import ClassVar
+
+from django.db import models
+from django.utils import timezone
+
+from device.models.crash_event import CrashEvent
+
+
+class NotificationOutbox(models.Model):
+    """One crash alert push, written in the same transaction as its CrashEvent.
+
+    Rows are delivered by the after-commit dispatcher and, when that fails or
+    the process dies, retried by the ``process_notification_outbox`` worker.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_FAILED = "failed"
+
+    ROLE_OWNER = "owner"
+    ROLE_LOVED_ONE = "loved_one"
+
+    crash_event = models.ForeignKey(CrashEvent, on_delete=models.CASCADE, related_name="notifications")
+    device_id = models.CharField(max_length=255)
+    recipient_role = models.CharField(
+        max_length=20,
+        choices=[
+            (ROLE_OWNER, "Owner"),
+            (ROLE_LOVED_ONE, "Loved one"),
+        ],
+    )
+    token = models.CharField(max_length=500)  # Expo push token the message targets
+    message = models.JSONField()  # Expo push message, sent as-is
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            (STATUS_PENDING, "Pending"),
+            (STATUS_SENDING, "Sending"),
+            (STATUS_SENT, "Sent"),
+            (STATUS_FAILED, "Failed"),
+        ],
+        default=STATUS_PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)  # Lease of the sender that claimed the row
+    last_error = models.CharField(max_length=255, blank=True)
+    ticket_id = models.CharField(max_length=100, blank=True)  # Expo push ticket once accepted
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:  # noqa: D106
+        verbose_name = "Notification Outbox Entry"
+        verbose_name_plural = "Notification Outbox"
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["status", "next_attempt_at"], name="device_outbox_due_idx"),
+        ]
+
+    def __str__(self) -> str:  # noqa: D105
+        return f"{self.recipient_role} push for crash event {self.crash_event_id} ({self.status})"  # type: ignore[attr-defined]
@@ -4,6 +4,7 @@ from typing import ClassVar
 
 from core.models import User
 from django.db import models
+from django.utils import timezone
 
 
 class SensorData(models.Model):
@@ -17,7 +18,8 @@ class SensorData(models.Model):
     roll = models.FloatField()
     pitch = models.FloatField()
     tilt_detected = models.BooleanField()
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: batched uploads carry their own per-reading timestamps
+    timestamp = models.DateTimeField(default=timezone.now)
 
     class Meta:  # noqa: D106
         ordering: ClassVar[list[str]] = ["-timestamp"]
@@ -0,0 +1,101 @@
+"""Sensor data rollup models."""
+
+from typing import ClassVar
+
+from django.db import models
+
+
+class SensorRollupBase(models.Model):
+    """Per-device summary of raw sensor readings over a fixed time bucket."""
+
+    device_id = models.CharField(max_length=255)
+    bucket_start = models.DateTimeField()
+    sample_count = models.IntegerField()
+    ax_min = models.FloatField()
+    ax_max = models.FloatField()
+    ax_mean = models.FloatField()
+    ay_min = models.FloatField()
+    ay_max = models.FloatField()
+    ay_mean = models.FloatField()
+    az_min = models.FloatField()
+    az_max = models.FloatField()
+    az_mean = models.FloatField()
+    g_peak = models.FloatField()  # Peak G-force magnitude in g
+    roll_min = models.FloatField()
+    roll_max = models.FloatField()
+    pitch_min = models.FloatField()
+    pitch_max = models.FloatField()
+    tilt_count = models.IntegerField()  # Readings with tilt_detected=True
+
+    class Meta:  # noqa: D106
+        abstract = True
+
+    def __str__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__} for {self.device_id} at {self.bucket_start}"
+
+
+class SensorRollupSecond(SensorRollupBase):
+    """Per-second sensor summary."""
+
+    class Meta:  # noqa: D106
+        verbose_name = "Sensor Rollup (second)"
+        verbose_name_plural = "Sensor Rollups (second)"
+        ordering: ClassVar[list[str]] = ["-bucket_start"]
+        constraints: ClassVar[list[models.UniqueConstraint]] = [
+            models.UniqueConstraint(fields=["device_id", "bucket_start"], name="unique_rollup_second_bucket"),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["bucket_start"], name="device_rollup_second_bkt_idx"),
+        ]
+
+
+class SensorRollupMinute(SensorRollupBase):
+    """Per-minute sensor summary."""
+
+    class Meta:  # noqa: D106
+        verbose_name = "Sensor Rollup (minute)"
+        verbose_name_plural = "Sensor Rollups (minute)"
+        ordering: ClassVar[list[str]] = ["-bucket_start"]
+        constraints: ClassVar[list[models.UniqueConstraint]] = [
+            models.UniqueConstraint(fields=["device_id", "bucket_start"], name="unique_rollup_minute_bucket"),
+        ]
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["bucket_start"], name="device_rollup_minute_bkt_idx"),
+        ]
+
+
+class SensorRollupCheckpoint(models.Model):
+    """Watermark up to which a rollup resolution has been computed (exclusive)."""
+
+    resolution = models.CharField(
+        max_length=20,
+        unique=True,
+        choices=[
+            ("second", "Second"),
+            ("minute", "Minute"),
+        ],
+    )
+    watermark = models.DateTimeField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:  # noqa: D106
+        verbose_name = "Sensor Rollup Checkpoint"
+        verbose_name_plural = "Sensor Rollup Checkpoints"
+
+    def __str__(self) -> str:  # noqa: D105
+        return f"{self.resolution} rollup up to {self.watermark}"
+
+
+class SensorRollupBacklog(models.Model):
+    """Time range of raw readings written behind the per-second watermark, awaiting a re-rollup."""
+
+    range_start = models.DateTimeField()
+    range_end = models.DateTimeField()  # Exclusive
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:  # noqa: D106
+        verbose_name = "Sensor Rollup Backlog"
+        verbose_name_plural = "Sensor Rollup Backlog"
+
+    def __str__(self) -> str:  # noqa: D105
+        return f"Late readings in [{self.range_start}, {self.range_end})"
@@ -1,17 +1,21 @@
 """Crash router."""
 
 import logging
+import uuid
 
 from django.http import HttpRequest
 from ninja import Router
 
 from core.auth.api_key import DeviceAPIKeyAuth
 from device.controllers.crash_controller import (
+    enqueue_crash_alert,
+    get_crash_alert_job,
     get_crash_events,
     process_crash_alert,
     submit_crash_feedback,
 )
 from device.schemas.crash_schema import (
+    CrashAlertJobResponse,
     CrashAlertRequest,
     CrashAlertResponse,
     CrashEventSchema,
@@ -58,6 +62,43 @@ def crash_alert_endpoint(
         raise
 
 
+@crash_router.post("/alert/async", response={202: CrashAlertJobResponse})
+def crash_alert_async_endpoint(
+    request: HttpRequest,
+    payload: CrashAlertRequest,
+) -> tuple[int, CrashAlertJobResponse]:
+    """Queue a threshold-triggered crash alert for background analysis.
+
+    Returns 202 with a job ID straight away; poll the job endpoint for the result.
+
+    URL: /api/v1/device/crash/alert/async
+    """
+    logger.info(
+        "[IN] POST /api/v1/device/crash/alert/async - Async crash alert endpoint called (device_id=%s, timestamp=%s)",
+        payload.device_id,
+        payload.timestamp,
+    )
+    response = enqueue_crash_alert(request, payload)
+    logger.info(
+        "[OK] POST /api/v1/device/crash/alert/async - Queued (device_id=%s, job_id=%s)",
+        payload.device_id,
+        response.job_id,
+    )
+    return 202, response
+
+
+@crash_router.get("/alert/jobs/{job_id}", response=CrashAlertJobResponse)
+def crash_alert_job_endpoint(
+    request: HttpRequest,
+    job_id: uuid.UUID,
+) -> CrashAlertJobResponse:
+    """Get the status and result of an asynchronous crash alert.
+
+    URL: /api/v1/device/crash/alert/jobs/{job_id}
+    """
+    return get_crash_alert_job(request, job_id)
+
+
 @crash_router.get("/events", response=list[CrashEventSchema])
 def crash_events_endpoint(
     request: HttpRequest,
@@ -4,8 +4,17 @@ from core.auth.api_key import DeviceAPIKeyAuth
 from django.http import HttpRequest
 from ninja import Router
 
-from device.controllers.device_controller import receive_device_data
-from device.schemas import DeviceDataRequest, DeviceDataResponse
+from device.controllers.device_controller import (
+    receive_device_data,
+    receive_device_data_batch,
+    receive_device_frame,
+)
+from device.schemas import (
+    DeviceDataBatchRequest,
+    DeviceDataBatchResponse,
+    DeviceDataRequest,
+    DeviceDataResponse,
+)
 from device.router.crash_router import crash_router
 from device.router.mobile_router import mobile_router
 
@@ -24,6 +33,29 @@ def receive_device_data_endpoint(
     return receive_device_data(request, payload)
 
 
+@device_router.post("/data/batch", response=DeviceDataBatchResponse)
+def receive_device_data_batch_endpoint(
+    request: HttpRequest,
+    payload: DeviceDataBatchRequest,
+) -> DeviceDataBatchResponse:
+    """Endpoint the embedded device can POST batches of MPU6050 readings to.
+
+    URL: /api/v1/device/data/batch
+    """
+    return receive_device_data_batch(request, payload)
+
+
+@device_router.post("/data/frame", response=DeviceDataBatchResponse)
+def receive_device_frame_endpoint(request: HttpRequest) -> DeviceDataBatchResponse:
+    """Endpoint the embedded device can POST binary sensor frames to.
+
+    Content-Type: application/vnd.sentry.sensor-frame (Content-Encoding: gzip/deflate optional)
+
+    URL: /api/v1/device/data/frame
+    """
+    return receive_device_frame(request)
+
+
 # Register crash router (uses API key auth)
 device_router.add_router("crash", crash_router)
 
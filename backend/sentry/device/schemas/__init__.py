@@ -1,17 +1,28 @@
 from .crash_schema import (
+    CrashAlertJobResponse,
     CrashAlertRequest,
     CrashAlertResponse,
     SensorReading,
     ThresholdResult,
 )
-from .device_schema import DeviceDataRequest, DeviceDataResponse
+from .device_schema import (
+    DeviceDataBatchRequest,
+    DeviceDataBatchResponse,
+    DeviceDataReading,
+    DeviceDataRequest,
+    DeviceDataResponse,
+)
 from .fcm_schema import FCMTokenRequest, FCMTokenResponse
 
 __all__ = [
     "DeviceDataRequest",
     "DeviceDataResponse",
+    "DeviceDataReading",
+    "DeviceDataBatchRequest",
+    "DeviceDataBatchResponse",
     "CrashAlertRequest",
     "CrashAlertResponse",
+    "CrashAlertJobResponse",
     "SensorReading",
     "ThresholdResult",
     "FCMTokenRequest",
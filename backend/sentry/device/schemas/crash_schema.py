@@ -62,6 +62,19 @@ class CrashAlertResponse(Schema):
     crash_event_id: int | None = None  # ID of created crash event (if any)
 
 
+class CrashAlertJobResponse(Schema):
+    """Status (and result, once finished) of an asynchronous crash alert job."""
+
+    job_id: str
+    status: str  # 'queued', 'running', 'succeeded', 'failed'
+    attempts: int
+    created_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    result: CrashAlertResponse | None = None
+    error: str | None = None
+
+
 class CrashEventSchema(Schema):
     """Crash event schema for API responses."""
 
@@ -1,6 +1,7 @@
 """Schemas for device data."""
 
 from ninja import Schema
+from pydantic import Field
 
 
 class DeviceDataRequest(Schema):
@@ -21,3 +22,33 @@ class DeviceDataResponse(Schema):
 
     success: bool
     message: str
+
+
+class DeviceDataReading(Schema):
+    """Single MPU6050 reading inside a batched upload."""
+
+    ax: float
+    ay: float
+    az: float
+    roll: float
+    pitch: float
+    tilt_detected: bool
+    timestamp: int  # device clock in ms (unix ms, or millis() since boot when sent_at is given)
+
+
+class DeviceDataBatchRequest(Schema):
+    """Batched MPU6050 payload from ESP32 (many readings per POST)."""
+
+    device_id: str | None = None
+    batch_seq: int | None = None  # optional device-side sequence number, echoed back in the ack
+    sent_at: int | None = None  # device clock (ms) when the batch was sent; enables millis() timestamps
+    readings: list[DeviceDataReading] = Field(..., min_length=1)
+
+
+class DeviceDataBatchResponse(Schema):
+    """Per-batch acknowledgement to device."""
+
+    success: bool
+    message: str
+    accepted: int
+    batch_seq: int | None = None
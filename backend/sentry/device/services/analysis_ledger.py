@@ -0,0 +1,88 @@
+"""Append-only ledger of crash alert verdicts.
+
+Every alert's verdict is recorded with its feature vector, model, prompt size
+and latency, whether it came from Gemini, the local classifier, the verdict
+cache or the rule-based fallback. Records are buffered in memory and bulk
+inserted by a background flusher, so the alert path only pays for a deque append.
+"""
+
+import logging
+from typing import Any
+
+from common.utils.batch_writer import BackgroundBatchWriter
+from common.utils.metrics import incr_counter
+from django.db import close_old_connections
+from sentry.settings.config import settings as app_settings
+
+from device.models import AnalysisRecord
+from device.services.crash_features import FEATURE_NAMES
+
+logger = logging.getLogger("device")
+
+
+def _flush_analysis_records(records: list[AnalysisRecord]) -> None:
+    """Write-behind flush callback (runs on the flusher thread)."""
+    close_old_connections()
+    AnalysisRecord.objects.bulk_create(records)  # type: ignore[attr-defined]
+    incr_counter("analysis_ledger.written", len(records))
+    logger.debug("[LEDGER] Flushed %s analysis records", len(records))
+
+
+analysis_ledger: BackgroundBatchWriter[AnalysisRecord] = BackgroundBatchWriter(
+    name="analysis-ledger",
+    flush_func=_flush_analysis_records,
+    capacity=app_settings.analysis_ledger_buffer_capacity,
+    flush_size=app_settings.analysis_ledger_flush_size,
+    flush_interval=app_settings.analysis_ledger_flush_interval_ms / 1000,
+)
+
+
+def record_analysis(  # noqa: PLR0913
+    device_id: str,
+    features: dict[str, Any],
+    analysis: dict[str, Any],
+    latency_ms: float,
+    stats: dict[str, Any] | None = None,
+    crash_event_id: int | None = None,
+) -> bool:
+    """Queue one verdict for the ledger without waiting on the database.
+
+    Args:
+        device_id: Device the alert came from
+        features: Window features (see ``extract_crash_features``)
+        analysis: Verdict in the Gemini result shape
+        latency_ms: Time taken to reach the verdict
+        stats: Gemini call statistics filled by ``analyze_crash_data`` (if it was called)
+        crash_event_id: CrashEvent created from the verdict, if any
+
+    Returns:
+        True if the record was queued, False if disabled or the buffer was full
+
+    """
+    if not app_settings.analysis_ledger_enabled:
+        return False
+    stats = stats or {}
+    record = AnalysisRecord(
+        device_id=device_id,
+        crash_event_id=crash_event_id,
+        source=str(analysis.get("source", "unknown"))[:40],
+        outcome=stats.get("outcome", ""),
+        model=stats.get("model", "") if stats.get("outcome") else "",
+        is_crash=bool(analysis["is_crash"]),
+        severity=analysis["severity"],
+        confidence=float(analysis["confidence"]),
+        false_positive_risk=float(analysis["false_positive_risk"]),
+        crash_type=str(analysis.get("crash_type", ""))[:64],
+        features=[float(features.get(name, 0.0)) for name in FEATURE_NAMES],
+        prompt_chars=stats.get("prompt_chars"),
+        prompt_tokens=stats.get("prompt_tokens"),
+        output_tokens=stats.get("output_tokens"),
+        batch_size=stats.get("batch_size", 1),
+        latency_ms=latency_ms,
+    )
+    if not analysis_ledger.put_many([record]):
+        # put_timeout is 0: never block an alert on a backed-up ledger
+        logger.warning("[LEDGER] Buffer full - dropping analysis record (device_id=%s)", device_id)
+        incr_counter("analysis_ledger.dropped")
+        return False
+    return True
@@ -0,0 +1,238 @@
+"""Local pre-screening classifier (Tier 1.5) over crash window features.
+
+A small L2-regularised logistic regression trained on CrashEvent user feedback.
+Alerts it is confident about are cleared or confirmed locally; everything in
+between is escalated to Gemini.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+from django.conf import settings as django_settings
+from sentry.settings.config import settings as app_settings
+
+logger = logging.getLogger("device")
+
+VERDICT_CRASH = "crash"
+VERDICT_CLEAR = "clear"
+VERDICT_ESCALATE = "escalate"
+
+
+@dataclass(slots=True)
+class ClassifierDecision:
+    """Outcome of pre-screening one alert."""
+
+    verdict: str
+    probability: float  # P(crash)
+    top_features: list[str] = field(default_factory=list)
+
+    def to_analysis(self, severity: str) -> dict[str, Any]:
+        """Return the decision in the same shape as a Gemini analysis result."""
+        is_crash = self.verdict == VERDICT_CRASH
+        return {
+            "is_crash": is_crash,
+            "confidence": self.probability if is_crash else 1.0 - self.probability,
+            "severity": severity if is_crash else "low",
+            "crash_type": "impact" if is_crash else "false_positive",
+            "reasoning": (
+                f"Local classifier {'confirmed' if is_crash else 'cleared'} alert (p_crash={self.probability:.3f})"
+            ),
+            "key_indicators": self.top_features,
+            "false_positive_risk": 1.0 - self.probability,
+            "source": "local_classifier",
+        }
+
+
+@dataclass(slots=True)
+class CrashClassifier:
+    """Logistic regression over standardised CrashFeatures vectors."""
+
+    feature_names: list[str]
+    mean: list[float]
+    scale: list[float]
+    weights: list[float]
+    bias: float
+    clear_threshold: float
+    confirm_threshold: float
+    trained_on: int = 0
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+    def predict_proba(self, vectors: np.ndarray) -> np.ndarray:
+        """Return P(crash) for one vector or a matrix of vectors."""
+        z = (np.asarray(vectors, dtype=np.float64) - self.mean) / self.scale
+        return 1.0 / (1.0 + np.exp(-(z @ np.asarray(self.weights) + self.bias)))
+
+    def decide(self, features: dict[str, Any]) -> ClassifierDecision:
+        """Clear, confirm or escalate an alert from its window features."""
+        vector = np.array([features[name] for name in self.feature_names], dtype=np.float64)
+        probability = float(self.predict_proba(vector))
+        contributions = (vector - self.mean) / self.scale * np.asarray(self.weights)
+        order = np.argsort(-np.abs(contributions))[:3]
+        top_features = [self.feature_names[i] for i in order]
+
+        if probability >= self.confirm_threshold:
+            verdict = VERDICT_CRASH
+        elif probability <= self.clear_threshold:
+            verdict = VERDICT_CLEAR
+        else:
+            verdict = VERDICT_ESCALATE
+        return ClassifierDecision(verdict=verdict, probability=probability, top_features=top_features)
+
+    def save(self, path: Path) -> None:
+        """Write the model as compact JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(self), separators=(",", ":")))
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "CrashClassifier":
+        """Read a model written by ``save``."""
+        return cls(**json.loads(path.read_text()))
+
+
+def fit_logistic_regression(
+    x: np.ndarray,
+    y: np.ndarray,
+    l2: float = 1.0,
+    iterations: int = 25,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    """Fit an L2-regularised logistic regression with Newton's method.
+
+    Args:
+        x: Feature matrix (n_samples, n_features)
+        y: Labels in {0, 1}
+        l2: Ridge penalty on the (standardised) weights
+        iterations: Maximum Newton steps
+
+    Returns:
+        Tuple of (mean, scale, weights, bias) in standardised feature space
+
+    """
+    mean = x.mean(axis=0)
+    scale = x.std(axis=0)
+    scale[scale == 0] = 1.0
+    z = np.hstack([(x - mean) / scale, np.ones((x.shape[0], 1))])
+
+    theta = np.zeros(z.shape[1])
+    penalty = np.full(z.shape[1], l2)
+    penalty[-1] = 0.0  # Do not penalise the bias
+    for _ in range(iterations):
+        p = 1.0 / (1.0 + np.exp(-(z @ theta)))
+        gradient = z.T @ (p - y) + penalty * theta
+        hessian = (z * (p * (1 - p))[:, None]).T @ z + np.diag(penalty)
+        step = np.linalg.solve(hessian, gradient)
+        theta -= step
+        if np.max(np.abs(step)) < 1e-8:  # noqa: PLR2004
+            break
+    return mean, scale, theta[:-1], float(theta[-1])
+
+
+def choose_thresholds(
+    probabilities: np.ndarray,
+    labels: np.ndarray,
+    target_precision: float,
+) -> tuple[float, float]:
+    """Pick the widest clear/confirm bands that keep decisions at ``target_precision``.
+
+    Args:
+        probabilities: Out-of-fold P(crash) per sample
+        labels: True labels in {0, 1}
+        target_precision: Required precision for confirmations and for clears
+
+    Returns:
+        Tuple of (clear_threshold, confirm_threshold); bands that cannot reach the
+        target precision are disabled with thresholds outside [0, 1]
+
+    """
+    confirm_threshold = 1.1
+    for threshold in np.unique(probabilities):
+        picked = probabilities >= threshold
+        if labels[picked].mean() >= target_precision:
+            confirm_threshold = float(threshold)
+            break
+
+    clear_threshold = -0.1
+    for threshold in np.unique(probabilities)[::-1]:
+        picked = probabilities <= threshold
+        if picked.any() and threshold < confirm_threshold and (1 - labels[picked]).mean() >= target_precision:
+            clear_threshold = float(threshold)
+            break
+    return clear_threshold, confirm_threshold
+
+
+def default_model_path() -> Path:
+    """Return the configured model file path."""
+    if app_settings.crash_classifier_path:
+        return Path(app_settings.crash_classifier_path)
+    return Path(django_settings.BASE_DIR) / "ml" / "crash_classifier.json"
+
+
+class CrashPrescreenService:
+    """Loads the trained classifier (reloading it when the file changes) and counts outcomes."""
+
+    _lock = threading.Lock()
+    _model: CrashClassifier | None = None
+    _model_mtime: float | None = None
+    outcomes: ClassVar[Counter[str]] = Counter()
+
+    def get_model(self) -> CrashClassifier | None:
+        """Return the current model, or None if pre-screening is disabled or untrained."""
+        if not app_settings.crash_classifier_enabled:
+            return None
+        path = default_model_path()
+        try:
+            mtime = os.stat(path).st_mtime  # noqa: PTH116
+        except FileNotFoundError:
+            return None
+
+        cls = type(self)
+        if cls._model is None or cls._model_mtime != mtime:
+            with cls._lock:
+                if cls._model is None or cls._model_mtime != mtime:
+                    try:
+                        cls._model = CrashClassifier.load(path)
+                        cls._model_mtime = mtime
+                        logger.info("[TIER1.5] Loaded crash classifier from %s", path)
+                    except (OSError, ValueError, TypeError):
+                        logger.exception("[TIER1.5] Failed to load crash classifier from %s", path)
+                        return None
+        return cls._model
+
+    def prescreen(self, features: dict[str, Any]) -> ClassifierDecision | None:
+        """Pre-screen an alert, returning None when no model is available."""
+        model = self.get_model()
+        if model is None:
+            return None
+
+        decision = model.decide(features)
+        outcomes = type(self).outcomes
+        outcomes[decision.verdict] += 1
+        total = sum(outcomes.values())
+        logger.info(
+            "[TIER1.5] verdict=%s p_crash=%.3f | short-circuited %s/%s alerts (%.1f%%)",
+            decision.verdict,
+            decision.probability,
+            total - outcomes[VERDICT_ESCALATE],
+            total,
+            100.0 * (total - outcomes[VERDICT_ESCALATE]) / total,
+        )
+        return decision
+
+    def stats(self) -> dict[str, Any]:
+        """Return this process's pre-screening outcome counts."""
+        outcomes = type(self).outcomes
+        total = sum(outcomes.values())
+        return {
+            "cleared": outcomes[VERDICT_CLEAR],
+            "confirmed": outcomes[VERDICT_CRASH],
+            "escalated": outcomes[VERDICT_ESCALATE],
+            "short_circuit_share": (total - outcomes[VERDICT_ESCALATE]) / total if total else 0.0,
+        }
@@ -1,7 +1,7 @@
 """Crash detector service for retrieving sensor data."""
 
 import logging
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
 from core.models import UserSettings
@@ -11,6 +11,8 @@ from django.utils import timezone
 
 from device.models import CrashEvent, SensorData
 from device.schemas.crash_schema import GPSDataSchema
+from device.services.sensor_ring import get_sensor_ring, to_micros
+from device.services.sensor_window import SensorWindow
 
 logger = logging.getLogger(__name__)
 
@@ -18,62 +20,69 @@ logger = logging.getLogger(__name__)
 class CrashDetectorService:
     """Service for crash detection operations."""
 
-    def get_recent_sensor_data(
+    def get_recent_sensor_window(
         self,
         device_id: str,
         lookback_seconds: int = 30,
-    ) -> list[dict[str, Any]]:
-        """Get recent sensor data for a device.
+    ) -> SensorWindow:
+        """Get recent sensor data for a device as a columnar window.
 
         Args:
             device_id: Device identifier
             lookback_seconds: Number of seconds to look back
 
         Returns:
-            List of sensor data dictionaries
+            SensorWindow with the readings in the lookback window, oldest first
 
         """
-        try:
-            # Calculate time threshold
-            time_threshold = timezone.now() - timedelta(seconds=lookback_seconds)
+        # Calculate time threshold
+        time_threshold = timezone.now() - timedelta(seconds=lookback_seconds)
 
-            # Query recent sensor data
+        # Serve from the shared-memory ring buffer when it covers the whole window
+        window = self._read_sensor_ring(device_id, time_threshold)
+        if window is not None:
+            logger.debug("Recent sensor data served from ring buffer (device_id=%s)", device_id)
+            return window
+
+        try:
+            # Query recent sensor data. The lower bound on the partition key lets
+            # PostgreSQL prune the scan to the newest partition(s).
             sensor_data = (
                 SensorData.objects.filter(  # pyright: ignore[reportAttributeAccessIssue]
                     device_id=device_id,
                     timestamp__gte=time_threshold,
                 )
                 .order_by("timestamp")
-                .values(
+                .values_list(
+                    "timestamp",
                     "ax",
                     "ay",
                     "az",
                     "roll",
                     "pitch",
                     "tilt_detected",
-                    "timestamp",
                 )
             )
 
-            # Convert to list of dicts with proper timestamp format
-            return [
-                {
-                    "ax": float(data["ax"]),
-                    "ay": float(data["ay"]),
-                    "az": float(data["az"]),
-                    "roll": float(data["roll"]),
-                    "pitch": float(data["pitch"]),
-                    "tilt_detected": bool(data["tilt_detected"]),
-                    "timestamp": data["timestamp"].isoformat()
-                    if hasattr(data["timestamp"], "isoformat")
-                    else str(data["timestamp"]),
-                }
-                for data in sensor_data
-            ]
+            # Stream rows straight into the window's typed columns
+            return SensorWindow.from_rows(
+                (to_micros(timestamp), *values) for timestamp, *values in sensor_data.iterator()
+            )
 
         except DatabaseError:
             logger.exception("Error retrieving recent sensor data")
-            return []
+            return SensorWindow.empty()
+
+    def _read_sensor_ring(self, device_id: str, since: datetime) -> SensorWindow | None:
+        """Read a window from the ring buffer, returning None on a miss or error."""
+        ring = get_sensor_ring()
+        if ring is None:
+            return None
+        try:
+            return ring.read_window(device_id, since)
+        except OSError:
+            logger.exception("Error reading sensor ring buffer")
+            return None
 
     def get_user_crash_alert_interval(self, user: User | None) -> int:
         """Get user's crash alert interval from UserSettings.
@@ -0,0 +1,309 @@
+"""Offline evaluation of crash analysers against user-labelled CrashEvents.
+
+Each labelled event is rebuilt into the alert context the pipeline saw (sensor
+window, triggering reading, features, recent crash history) and replayed through
+an analyser. Built-in analysers are ``gemini``, ``classifier`` and ``rules``;
+any class with a ``name`` and an ``analyze(case)`` method can be plugged in by
+dotted path.
+"""
+
+import logging
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from typing import Any, Protocol
+
+import numpy as np
+from core.ai.gemini_service import GeminiService
+from django.db import DatabaseError
+from django.utils.module_loading import import_string
+
+from device.models import CrashEvent, SensorData
+from device.services.crash_classifier import CrashPrescreenService
+from device.services.crash_features import FEATURE_NAMES, extract_crash_features
+from device.services.crash_rules import rule_based_verdict
+from device.services.sensor_ring import to_micros
+from device.services.sensor_window import SensorWindow
+
+logger = logging.getLogger("device")
+
+LATENCY_PERCENTILES = (50, 95, 99)
+CLASSIFIER_DECISION_THRESHOLD = 0.5
+
+
+@dataclass(slots=True)
+class EvaluationCase:
+    """One labelled alert, rebuilt from a CrashEvent and its stored sensor rows."""
+
+    event_id: int
+    device_id: str
+    is_crash: bool  # user_feedback == "true_positive"
+    severity: str
+    context_seconds: int
+    window: SensorWindow
+    current_reading: dict[str, Any]
+    features: dict[str, Any]
+    crash_events: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class AnalyserResult:
+    """Verdict and cost of one analyser call."""
+
+    is_crash: bool
+    latency_ms: float
+    source: str = ""
+    prompt_tokens: int | None = None
+    output_tokens: int | None = None
+    error: str | None = None  # Set when no real verdict was produced
+
+
+class CrashAnalyser(Protocol):
+    """Interface for analysers replayed by the evaluation harness."""
+
+    name: str
+
+    def analyze(self, case: EvaluationCase) -> AnalyserResult:
+        """Return the analyser's verdict for one case."""
+        ...
+
+
+class GeminiAnalyser:
+    """Gemini verdicts, bypassing the verdict cache, batcher and Tier 1.5 pre-screen."""
+
+    name = "gemini"
+
+    def analyze(self, case: EvaluationCase) -> AnalyserResult:
+        """Return the Gemini verdict; breaker/API fallbacks are reported as errors."""
+        stats: dict[str, Any] = {}
+        analysis = GeminiService().analyze_crash_data(
+            sensor_window=case.window,
+            current_reading=case.current_reading,
+            context_seconds=case.context_seconds,
+            crash_events=case.crash_events,
+            features=case.features,
+            stats=stats,
+        )
+        outcome = stats.get("outcome")
+        return AnalyserResult(
+            is_crash=bool(analysis["is_crash"]),
+            latency_ms=stats["latency_ms"],
+            source=f"gemini:{stats['model']}",
+            prompt_tokens=stats.get("prompt_tokens"),
+            output_tokens=stats.get("output_tokens"),
+            error=None if outcome == "gemini" else outcome,
+        )
+
+
+class ClassifierAnalyser:
+    """The Tier 1.5 classifier forced to decide every alert at p_crash >= 0.5.
+
+    Note that the classifier is trained on the same feedback labels, so its
+    scores here are in-sample unless the model predates the labelled events.
+    """
+
+    name = "classifier"
+
+    def __init__(self) -> None:
+        """Load the configured classifier model."""
+        self.model = CrashPrescreenService().get_model()
+        if self.model is None:
+            msg = "No crash classifier model available (run train_crash_classifier first)"
+            raise ValueError(msg)
+
+    def analyze(self, case: EvaluationCase) -> AnalyserResult:
+        """Return the classifier verdict for the case's features."""
+        started = time.monotonic()
+        decision = self.model.decide(case.features)  # type: ignore[union-attr]
+        return AnalyserResult(
+            is_crash=decision.probability >= CLASSIFIER_DECISION_THRESHOLD,
+            latency_ms=(time.monotonic() - started) * 1000,
+            source="local_classifier",
+        )
+
+
+class RulesAnalyser:
+    """The deterministic rule-based fallback verdict."""
+
+    name = "rules"
+
+    def analyze(self, case: EvaluationCase) -> AnalyserResult:
+        """Return the rule-based verdict for the case's features."""
+        started = time.monotonic()
+        analysis = rule_based_verdict(case.features, case.severity)
+        return AnalyserResult(
+            is_crash=analysis["is_crash"],
+            latency_ms=(time.monotonic() - started) * 1000,
+            source="rules",
+        )
+
+
+ANALYSERS: dict[str, type] = {
+    GeminiAnalyser.name: GeminiAnalyser,
+    ClassifierAnalyser.name: ClassifierAnalyser,
+    RulesAnalyser.name: RulesAnalyser,
+}
+
+
+def load_analyser(name: str) -> CrashAnalyser:
+    """Instantiate a built-in analyser by name, or a plugin by dotted class path.
+
+    Raises:
+        ValueError: If the analyser is unknown or cannot be created
+
+    """
+    if name in ANALYSERS:
+        return ANALYSERS[name]()
+    try:
+        analyser_class = import_string(name)
+    except ImportError as e:
+        msg = f"Unknown analyser '{name}' (built-in: {', '.join(ANALYSERS)}, or a dotted class path)"
+        raise ValueError(msg) from e
+    return analyser_class()
+
+
+def _case_from_event(event: CrashEvent, lookback_seconds: int) -> EvaluationCase:
+    """Rebuild the alert context of one labelled CrashEvent."""
+    since = event.crash_timestamp - timedelta(seconds=lookback_seconds)
+    rows = (
+        SensorData.objects.filter(  # type: ignore[attr-defined]
+            device_id=event.device_id,
+            timestamp__gte=since,
+            timestamp__lte=event.crash_timestamp,
+        )
+        .order_by("timestamp")
+        .values_list("timestamp", "ax", "ay", "az", "roll", "pitch", "tilt_detected")
+    )
+    window = SensorWindow.from_rows((to_micros(timestamp), *values) for timestamp, *values in rows.iterator())
+
+    impact = event.impact_acceleration or {}
+    tilt = event.final_tilt or {}
+    current_reading = {
+        "ax": impact.get("ax", 0.0),
+        "ay": impact.get("ay", 0.0),
+        "az": impact.get("az", 0.0),
+        "roll": tilt.get("roll", 0.0),
+        "pitch": tilt.get("pitch", 0.0),
+        "tilt_detected": bool(window.tilt[-1]) if len(window) else False,
+    }
+    # Prefer the features the pipeline actually scored; recompute for older events
+    features = event.crash_features
+    if not all(name in features for name in FEATURE_NAMES):
+        features = extract_crash_features(window, current_reading).to_dict()
+
+    crash_events = list(
+        CrashEvent.objects.filter(  # type: ignore[attr-defined]
+            device_id=event.device_id,
+            crash_timestamp__gte=since,
+            crash_timestamp__lt=event.crash_timestamp,
+        )
+        .order_by("-crash_timestamp")[:1]
+        .values("is_confirmed_crash", "confidence_score", "severity", "crash_type", "max_g_force", "crash_timestamp"),
+    )
+    return EvaluationCase(
+        event_id=event.id,
+        device_id=event.device_id,
+        is_crash=event.user_feedback == "true_positive",
+        severity=event.severity,
+        context_seconds=lookback_seconds,
+        window=window,
+        current_reading=current_reading,
+        features=features,
+        crash_events=crash_events,
+    )
+
+
+def load_evaluation_cases(lookback_seconds: int, limit: int | None = None) -> Iterator[EvaluationCase]:
+    """Yield evaluation cases for CrashEvents with user feedback, newest first.
+
+    Events whose context cannot be rebuilt are skipped with a warning.
+    """
+    events = CrashEvent.objects.exclude(user_feedback="").order_by("-crash_timestamp")  # type: ignore[attr-defined]
+    if limit:
+        events = events[:limit]
+    for event in events.iterator():
+        try:
+            yield _case_from_event(event, lookback_seconds)
+        except DatabaseError:
+            logger.warning("[EVAL] Skipping crash event %s: could not load its sensor window", event.id)
+
+
+def run_analyser(
+    analyser: CrashAnalyser,
+    cases: list[EvaluationCase],
+    parallel: int = 1,
+) -> list[AnalyserResult]:
+    """Replay every case through an analyser with at most ``parallel`` calls in flight.
+
+    Exceptions raised by the analyser are recorded as errored results.
+    """
+
+    def evaluate(case: EvaluationCase) -> AnalyserResult:
+        started = time.monotonic()
+        try:
+            return analyser.analyze(case)
+        except Exception as e:  # noqa: BLE001 - one bad case must not abort the run
+            logger.warning("[EVAL] %s failed on crash event %s: %s", analyser.name, case.event_id, e)
+            return AnalyserResult(
+                is_crash=False,
+                latency_ms=(time.monotonic() - started) * 1000,
+                source=analyser.name,
+                error=type(e).__name__,
+            )
+
+    if parallel <= 1:
+        return [evaluate(case) for case in cases]
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix=f"eval-{analyser.name}") as executor:
+        return list(executor.map(evaluate, cases))
+
+
+def _ratio(numerator: int, denominator: int) -> float | None:
+    return numerator / denominator if denominator else None
+
+
+def summarize_results(cases: list[EvaluationCase], results: list[AnalyserResult]) -> dict[str, Any]:
+    """Compute classification, latency and token metrics for one analyser run.
+
+    Errored results are counted separately and left out of the confusion matrix.
+    """
+    scored = [(case.is_crash, result) for case, result in zip(cases, results, strict=True) if result.error is None]
+    tp = sum(1 for label, result in scored if label and result.is_crash)
+    fp = sum(1 for label, result in scored if not label and result.is_crash)
+    tn = sum(1 for label, result in scored if not label and not result.is_crash)
+    fn = sum(1 for label, result in scored if label and not result.is_crash)
+
+    latencies = np.array([result.latency_ms for result in results], dtype=np.float64)
+    latency = {f"p{p}": float(np.percentile(latencies, p)) if latencies.size else None for p in LATENCY_PERCENTILES}
+    latency["mean"] = float(latencies.mean()) if latencies.size else None
+
+    metered = [result for result in results if result.prompt_tokens is not None]
+    tokens = {
+        "metered_alerts": len(metered),
+        "prompt_per_alert": _ratio(sum(result.prompt_tokens or 0 for result in metered), len(metered)),
+        "output_per_alert": _ratio(sum(result.output_tokens or 0 for result in metered), len(metered)),
+    }
+
+    errors: dict[str, int] = {}
+    for result in results:
+        if result.error is not None:
+            errors[result.error] = errors.get(result.error, 0) + 1
+
+    return {
+        "alerts": len(results),
+        "scored": len(scored),
+        "confusion": {"tp": tp, "fp": fp, "tn": tn, "fn": fn},
+        "precision": _ratio(tp, tp + fp),
+        "recall": _ratio(tp, tp + fn),
+        "false_positive_rate": _ratio(fp, fp + tn),
+        "accuracy": _ratio(tp + tn, len(scored)),
+        "latency_ms": latency,
+        "tokens": tokens,
+        "errors": errors,
+    }
+
+
+def case_report(case: EvaluationCase, result: AnalyserResult) -> dict[str, Any]:
+    """Return one case's label and verdict as a JSON-serialisable dict."""
+    return {"event_id": case.event_id, "label": case.is_crash, "samples": len(case.window), **asdict(result)}
@@ -0,0 +1,127 @@
+"""Vectorized feature extraction over crash sensor windows."""
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+from sentry.settings.config import settings as app_settings
+
+from device.services.sensor_window import SensorWindow
+
+GRAVITY = 9.81
+MIN_DT_SECONDS = 1e-3  # Guards jerk against duplicate timestamps
+
+FEATURE_NAMES = (
+    "sample_count",
+    "window_seconds",
+    "current_g",
+    "g_peak",
+    "g_mean",
+    "time_of_peak_s",
+    "jerk_peak",
+    "impact_duration_s",
+    "post_impact_g_std",
+    "post_impact_still_fraction",
+    "roll_range",
+    "pitch_range",
+    "roll_change",
+    "pitch_change",
+    "tilt_fraction",
+    "tilt_persistence_s",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CrashFeatures:
+    """Summary features of a sensor window around a crash alert.
+
+    Times are in seconds; ``time_of_peak_s`` is measured back from the newest reading.
+    """
+
+    sample_count: int
+    window_seconds: float
+    current_g: float
+    g_peak: float
+    g_mean: float
+    time_of_peak_s: float
+    jerk_peak: float  # g/s
+    impact_duration_s: float
+    post_impact_g_std: float
+    post_impact_still_fraction: float
+    roll_range: float
+    pitch_range: float
+    roll_change: float
+    pitch_change: float
+    tilt_fraction: float
+    tilt_persistence_s: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the features as a JSON-serialisable dict."""
+        return asdict(self)
+
+    def as_vector(self) -> np.ndarray:
+        """Return the features as a float64 vector in FEATURE_NAMES order."""
+        return np.array([getattr(self, name) for name in FEATURE_NAMES], dtype=np.float64)
+
+
+def _g_magnitude(ax: float, ay: float, az: float) -> float:
+    return float(np.sqrt(ax * ax + ay * ay + az * az) / GRAVITY)
+
+
+def extract_crash_features(window: SensorWindow, current_reading: dict[str, Any]) -> CrashFeatures:
+    """Compute crash features for a window and the reading that triggered the alert.
+
+    Args:
+        window: Recent sensor readings, oldest first
+        current_reading: Triggering reading with ax, ay, az (m/s^2)
+
+    Returns:
+        CrashFeatures for the window
+
+    """
+    current_g = _g_magnitude(
+        float(current_reading.get("ax", 0.0)),
+        float(current_reading.get("ay", 0.0)),
+        float(current_reading.get("az", 0.0)),
+    )
+    count = len(window)
+    if count == 0:
+        return CrashFeatures(count, 0.0, current_g, *([0.0] * (len(FEATURE_NAMES) - 3)))
+
+    g = np.sqrt(window.ax * window.ax + window.ay * window.ay + window.az * window.az) / np.float32(GRAVITY)
+    t = (window.timestamps - window.timestamps[-1]) / 1_000_000.0  # <= 0, newest reading at 0
+    dt = np.diff(t)
+
+    peak_index = int(np.argmax(g))
+    jerk_peak = float(np.max(np.abs(np.diff(g)) / np.maximum(dt, MIN_DT_SECONDS))) if count > 1 else 0.0
+    above = g[:-1] > app_settings.crash_impact_threshold_g
+    impact_duration = float(dt[above].sum()) if count > 1 else 0.0
+
+    post_impact = g[peak_index:]
+    still = np.abs(post_impact - 1.0) < app_settings.crash_stillness_tolerance_g
+
+    # Trailing run of tilt_detected readings, up to the newest one
+    tilt_persistence = 0.0
+    if window.tilt[-1]:
+        not_tilted = np.flatnonzero(~window.tilt)
+        run_start = int(not_tilted[-1]) + 1 if not_tilted.size else 0
+        tilt_persistence = float(-t[run_start])
+
+    return CrashFeatures(
+        sample_count=count,
+        window_seconds=float(-t[0]),
+        current_g=current_g,
+        g_peak=float(g[peak_index]),
+        g_mean=float(g.mean()),
+        time_of_peak_s=float(-t[peak_index]),
+        jerk_peak=jerk_peak,
+        impact_duration_s=impact_duration,
+        post_impact_g_std=float(post_impact.std()),
+        post_impact_still_fraction=float(still.mean()),
+        roll_range=float(np.ptp(window.roll)),
+        pitch_range=float(np.ptp(window.pitch)),
+        roll_change=float(window.roll[-1] - window.roll[0]),
+        pitch_change=float(window.pitch[-1] - window.pitch[0]),
+        tilt_fraction=float(window.tilt.mean()),
+        tilt_persistence_s=tilt_persistence,
+    )
@@ -0,0 +1,137 @@
+"""Crash alert job queue service."""
+
+import logging
+import uuid
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from sentry.settings.config import settings as app_settings
+
+from device.models import CrashAlertJob, CrashEvent
+from device.schemas.crash_schema import CrashAlertRequest
+
+if TYPE_CHECKING:
+    from django.contrib.auth.base_user import AbstractBaseUser
+    from django.contrib.auth.models import AnonymousUser
+
+logger = logging.getLogger("device")
+
+
+class CrashAlertJobService:
+    """Database-backed queue of crash alerts awaiting Tier 2 analysis.
+
+    Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED`` so any number of
+    them can poll the same table without handing out a job twice. A job records
+    the CrashEvent it created, so a retried or re-claimed job never creates (and
+    notifies) a crash twice.
+    """
+
+    def __init__(self) -> None:
+        """Initialize job queue settings."""
+        self.max_attempts = app_settings.crash_job_max_attempts
+        self.stale_after = timedelta(seconds=app_settings.crash_job_stale_seconds)
+
+    def enqueue(
+        self,
+        data: CrashAlertRequest,
+        user: "AbstractBaseUser | AnonymousUser | None",
+    ) -> CrashAlertJob:
+        """Store a validated crash alert for the job worker.
+
+        Args:
+            data: Validated crash alert request
+            user: Requesting user (if authenticated)
+
+        Returns:
+            The queued job
+
+        """
+        job = CrashAlertJob.objects.create(  # type: ignore[attr-defined]
+            device_id=data.device_id,
+            user=user if user is not None and user.is_authenticated else None,
+            payload=data.model_dump(mode="json"),
+        )
+        logger.info("[QUEUE] Crash alert job queued (job_id=%s, device_id=%s)", job.id, data.device_id)
+        return job
+
+    def get(self, job_id: uuid.UUID) -> CrashAlertJob | None:
+        """Return a job by ID, or None if it does not exist."""
+        return CrashAlertJob.objects.filter(id=job_id).first()  # type: ignore[attr-defined]
+
+    def claim_next(self) -> CrashAlertJob | None:
+        """Claim the oldest runnable job (queued, or running but abandoned).
+
+        Returns:
+            The claimed job (now marked running), or None if there is nothing to do
+
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            job = (
+                CrashAlertJob.objects.select_for_update(skip_locked=True)  # type: ignore[attr-defined]
+                .filter(
+                    Q(status=CrashAlertJob.STATUS_QUEUED)
+                    | Q(status=CrashAlertJob.STATUS_RUNNING, started_at__lt=now - self.stale_after),
+                    attempts__lt=self.max_attempts,
+                )
+                .order_by("created_at")
+                .first()
+            )
+            if job is None:
+                return None
+            job.status = CrashAlertJob.STATUS_RUNNING
+            job.started_at = now
+            job.attempts += 1
+            job.save(update_fields=["status", "started_at", "attempts"])
+        return job
+
+    def locked_crash_event(self, job: CrashAlertJob) -> CrashEvent | None:
+        """Lock the job row and return the CrashEvent an earlier attempt already created.
+
+        Must be called inside the transaction that would create the event; a
+        concurrent attempt (e.g. a stale re-claim) waits here and then sees it.
+        """
+        job.crash_event_id = (  # type: ignore[attr-defined]
+            CrashAlertJob.objects.select_for_update()  # type: ignore[attr-defined]
+            .values_list("crash_event_id", flat=True)
+            .get(id=job.id)
+        )
+        return job.crash_event
+
+    def attach_crash_event(self, job: CrashAlertJob, crash_event: CrashEvent) -> None:
+        """Record the CrashEvent a job created (in the transaction that created it)."""
+        job.crash_event = crash_event
+        job.save(update_fields=["crash_event"])
+
+    def complete(self, job: CrashAlertJob, result: dict[str, Any]) -> None:
+        """Mark a job as succeeded with its analysis result."""
+        job.status = CrashAlertJob.STATUS_SUCCEEDED
+        job.result = result
+        job.error = ""
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "result", "error", "finished_at"])
+
+    def fail(self, job: CrashAlertJob, error: str) -> None:
+        """Record a failed attempt, re-queueing the job while attempts remain."""
+        exhausted = job.attempts >= self.max_attempts
+        job.status = CrashAlertJob.STATUS_FAILED if exhausted else CrashAlertJob.STATUS_QUEUED
+        job.error = error
+        job.finished_at = timezone.now() if exhausted else None
+        job.save(update_fields=["status", "error", "finished_at"])
+
+    def fail_abandoned(self) -> int:
+        """Mark abandoned running jobs that have no attempts left as failed.
+
+        Returns:
+            Number of jobs marked failed
+
+        """
+        now = timezone.now()
+        return CrashAlertJob.objects.filter(  # type: ignore[attr-defined]
+            status=CrashAlertJob.STATUS_RUNNING,
+            started_at__lt=now - self.stale_after,
+            attempts__gte=self.max_attempts,
+        ).update(status=CrashAlertJob.STATUS_FAILED, error="Worker stopped before finishing", finished_at=now)
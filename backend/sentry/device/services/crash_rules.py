@@ -0,0 +1,66 @@
+"""Deterministic rule-based crash verdict.
+
+Used in place of the Gemini verdict when the AI stage is unavailable (circuit
+open, API errors, no key), so crash confirmation never waits on an outage.
+"""
+
+from typing import Any
+
+from sentry.settings.config import settings as app_settings
+
+SEVERITY_ORDER = ("low", "medium", "high")
+ORIENTATION_CHANGE_DEG = 45.0
+STILL_FRACTION = 0.6
+TILT_PERSISTENCE_S = 2.0
+
+
+def rule_based_verdict(features: dict[str, Any], client_severity: str = "low") -> dict[str, Any]:
+    """Classify an alert from its window features with fixed rules.
+
+    A crash needs an impact (peak above the impact threshold) followed by at least
+    one post-impact sign: a large orientation change, stillness, or sustained tilt.
+
+    Args:
+        features: Window features (see ``extract_crash_features``)
+        client_severity: Tier 1 severity reported by the mobile app
+
+    Returns:
+        Analysis dict in the same shape as a Gemini result
+
+    """
+    g_peak = features["g_peak"]
+    indicators = []
+    if g_peak >= app_settings.crash_impact_threshold_g and features["impact_duration_s"] > 0:
+        indicators.append("high_g_force")
+    if max(abs(features["roll_change"]), abs(features["pitch_change"])) >= ORIENTATION_CHANGE_DEG:
+        indicators.append("orientation_change")
+    if features["post_impact_still_fraction"] >= STILL_FRACTION:
+        indicators.append("post_impact_stillness")
+    if features["tilt_persistence_s"] >= TILT_PERSISTENCE_S:
+        indicators.append("sustained_tilt")
+
+    has_impact = "high_g_force" in indicators
+    is_crash = has_impact and len(indicators) >= 2  # noqa: PLR2004
+
+    if g_peak >= app_settings.crash_high_severity_g_force:
+        severity = "high"
+    elif g_peak >= app_settings.crash_medium_severity_g_force:
+        severity = "medium"
+    else:
+        severity = "low"
+    if client_severity in SEVERITY_ORDER and SEVERITY_ORDER.index(client_severity) > SEVERITY_ORDER.index(severity):
+        severity = client_severity
+
+    confidence = min(0.9, 0.5 + 0.1 * len(indicators))
+    return {
+        "is_crash": is_crash,
+        "confidence": confidence,
+        "severity": severity if is_crash else "low",
+        "crash_type": "impact" if is_crash else "false_positive",
+        "reasoning": (
+            f"Rule-based verdict (AI unavailable): peak {g_peak:.2f}g; indicators: {', '.join(indicators) or 'none'}"
+        ),
+        "key_indicators": indicators,
+        "false_positive_risk": 1.0 - confidence if is_crash else confidence,
+        "source": "rules",
+    }
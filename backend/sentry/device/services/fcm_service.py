@@ -1,6 +1,10 @@
 """Push notification service using Expo Push Notification API."""
 
+import importlib.util
 import logging
+import os
+import threading
+from dataclasses import dataclass
 from typing import Any
 
 try:
@@ -11,9 +15,89 @@ except ImportError:
 from sentry.settings.config import settings as app_settings
 
 from device.models import CrashEvent, DeviceToken
+from device.services.push_recipients import (
+    ROLE_OWNER,
+    invalidate_push_recipients,
+    owners_of_users,
+    resolve_push_recipients,
+)
 
 logger = logging.getLogger(__name__)
 
+# h2 is only needed for httpx's HTTP/2 support, never imported directly
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+EXPO_HEADERS = {
+    "Accept": "application/json",
+    "Accept-encoding": "gzip, deflate",
+    "Content-Type": "application/json",
+}
+
+EXPO_MAX_MESSAGES_PER_REQUEST = 100  # Expo's limit on messages per push request
+EXPO_DEVICE_NOT_REGISTERED = "DeviceNotRegistered"
+
+_client_lock = threading.Lock()
+_client: Any = None
+_client_pid: int | None = None
+
+
+def get_expo_client() -> Any:  # noqa: ANN401
+    """Return the process-wide pooled HTTP client for the Expo Push API.
+
+    Connections (HTTP/2 when ``h2`` is installed) are kept alive between pushes,
+    so a crash alert reuses a warm connection instead of paying a TCP and TLS
+    handshake. The client is rebuilt after a fork so gunicorn workers never
+    share sockets inherited from the parent process.
+
+    Returns:
+        The ``httpx.Client``, or None if httpx is not installed
+
+    """
+    global _client, _client_pid  # noqa: PLW0603
+
+    if _client is not None and _client_pid == os.getpid():
+        return _client
+    if httpx is None:
+        return None
+
+    with _client_lock:
+        if _client is None or _client_pid != os.getpid():
+            http2 = app_settings.expo_http2 and HTTP2_AVAILABLE
+            if app_settings.expo_http2 and not http2:
+                logger.warning("h2 package not installed - using HTTP/1.1 for Expo pushes")
+            # An inherited client is dropped, not closed: its sockets belong to the parent
+            _client = httpx.Client(
+                http2=http2,
+                headers=EXPO_HEADERS,
+                timeout=httpx.Timeout(
+                    app_settings.expo_request_timeout_seconds,
+                    connect=app_settings.expo_connect_timeout_seconds,
+                ),
+                limits=httpx.Limits(
+                    max_connections=app_settings.expo_max_connections,
+                    max_keepalive_connections=app_settings.expo_max_keepalive_connections,
+                    keepalive_expiry=app_settings.expo_keepalive_expiry_seconds,
+                ),
+            )
+            _client_pid = os.getpid()
+    return _client
+
+
+@dataclass(slots=True)
+class PushTicket:
+    """Expo's push ticket for one message, matched back to the token it targeted."""
+
+    token: str
+    status: str  # "ok" or "error"
+    ticket_id: str | None = None
+    message: str | None = None
+    error: str | None = None  # Expo error code, e.g. DeviceNotRegistered
+
+    @property
+    def ok(self) -> bool:
+        """Whether Expo accepted the message."""
+        return self.status == "ok"
+
 
 class FCMService:
     """Push notification service using Expo Push Notification API.
@@ -28,143 +112,55 @@ class FCMService:
         if httpx is None:
             logger.warning("httpx package not installed. Install it with: pip install httpx")
 
-    def send_crash_notification(
+    def build_crash_message(
         self,
-        device_id: str,
+        expo_token: str,
         crash_event: CrashEvent,
         ai_analysis: dict[str, Any],
-    ) -> bool:
-        """Send crash notification to user's mobile device using Expo Push Notification API.
+    ) -> dict[str, Any]:
+        """Build the owner's crash alert push for an Expo push token.
 
         Args:
-            device_id: Device identifier
+            expo_token: Expo Push Token of the device owner
             crash_event: CrashEvent model instance
             ai_analysis: AI analysis results from Gemini
 
         Returns:
-            True if notification sent successfully, False otherwise
+            Expo push message
 
         """
-        if httpx is None:
-            logger.error("httpx package not available. Install it with: pip install httpx")
-            return False
-
-        try:
-            # Get Expo Push Token for device
-            expo_token = self._get_expo_push_token(device_id)
-            if not expo_token:
-                logger.warning("No Expo push token found for device %s", device_id)
-                return False
-
-            # Build notification message for Expo Push API
-            severity = ai_analysis.get("severity", "unknown").upper()
-            reasoning = ai_analysis.get("reasoning", "Crash detected")[:100]
-
-            # Get GPS location if available
-            gps_location = None
-            map_link = None
-            if crash_event.crash_latitude and crash_event.crash_longitude:  # type: ignore[attr-defined]
-                gps_location = {
-                    "latitude": crash_event.crash_latitude,  # type: ignore[attr-defined]
-                    "longitude": crash_event.crash_longitude,  # type: ignore[attr-defined]
-                    "altitude": crash_event.crash_altitude,  # type: ignore[attr-defined]
-                }
-                map_link = f"https://www.google.com/maps?q={crash_event.crash_latitude},{crash_event.crash_longitude}"  # type: ignore[attr-defined]
-
-            # Prepare notification payload for Expo Push API
-            message = {
-                "to": expo_token,
-                "sound": "default",
-                "title": "🚨 Crash Detected",
-                "body": f"Severity: {severity} | {reasoning}",
-                "data": {
-                    "type": "crash_detected",
-                    "crash_event_id": str(crash_event.id),  # type: ignore[attr-defined]
-                    "severity": ai_analysis.get("severity", "low"),
-                    "confidence": str(ai_analysis.get("confidence", 0.0)),
-                    "crash_type": ai_analysis.get("crash_type", "unknown"),
-                    "timestamp": crash_event.crash_timestamp.isoformat(),  # type: ignore[attr-defined]
-                    "gps_location": gps_location,
-                    "map_link": map_link,
-                },
-                "priority": "high",  # High priority for crash notifications
-                "channelId": "crash_alerts",  # Android notification channel
+        severity = ai_analysis.get("severity", "unknown").upper()
+        reasoning = ai_analysis.get("reasoning", "Crash detected")[:100]
+
+        # Get GPS location if available
+        gps_location = None
+        map_link = None
+        if crash_event.crash_latitude and crash_event.crash_longitude:  # type: ignore[attr-defined]
+            gps_location = {
+                "latitude": crash_event.crash_latitude,  # type: ignore[attr-defined]
+                "longitude": crash_event.crash_longitude,  # type: ignore[attr-defined]
+                "altitude": crash_event.crash_altitude,  # type: ignore[attr-defined]
             }
-
-            # Send notification via Expo Push API
-            return self._send_expo_notification(device_id, message, crash_event)
-
-        except httpx.HTTPError:
-            logger.exception("HTTP error sending Expo push notification")
-        except Exception:
-            logger.exception("Error sending Expo push notification")
-
-        return False
-
-    def _send_expo_notification(
-        self,
-        device_id: str,
-        message: dict[str, Any],
-        crash_event: CrashEvent,
-    ) -> bool:
-        """Send notification via Expo API and handle response.
-
-        Args:
-            device_id: Device identifier for logging
-            message: Notification message payload
-            crash_event: CrashEvent to update on success
-
-        Returns:
-            True if notification sent successfully, False otherwise
-
-        """
-        if httpx is None:
-            return False
-
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                app_settings.expo_push_api_url,
-                json=message,
-                headers={
-                    "Accept": "application/json",
-                    "Accept-encoding": "gzip, deflate",
-                    "Content-Type": "application/json",
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-
-            # Expo API returns a list of results, one per notification
-            # Each result has a "status" field: "ok" or "error"
-            # Sometimes the response is wrapped in a "data" key: {"data": {"status": "ok"}}
-            status = None
-            if isinstance(result, list) and len(result) > 0:
-                status = result[0].get("status")
-                if status != "ok":
-                    error_message = result[0].get("message", "Unknown error")
-                    logger.error("Failed to send Expo push notification: %s", error_message)
-                    return False
-            elif isinstance(result, dict):
-                # Check for nested data structure first: {"data": {"status": "ok"}}
-                if "data" in result and isinstance(result.get("data"), dict):
-                    status = result["data"].get("status")
-                else:
-                    status = result.get("status")
-
-                if status != "ok":
-                    logger.error("Failed to send Expo push notification: %s", result)
-                    return False
-            else:
-                logger.error("Unexpected response format from Expo API: %s", result)
-                return False
-
-            if status == "ok":
-                logger.info("Expo push notification sent successfully for device %s", device_id)
-                crash_event.alert_sent = True  # type: ignore[attr-defined]
-                crash_event.save(update_fields=["alert_sent"])
-                return True
-
-            return False
+            map_link = f"https://www.google.com/maps?q={crash_event.crash_latitude},{crash_event.crash_longitude}"  # type: ignore[attr-defined]
+
+        return {
+            "to": expo_token,
+            "sound": "default",
+            "title": "🚨 Crash Detected",
+            "body": f"Severity: {severity} | {reasoning}",
+            "data": {
+                "type": "crash_detected",
+                "crash_event_id": str(crash_event.id),  # type: ignore[attr-defined]
+                "severity": ai_analysis.get("severity", "low"),
+                "confidence": str(ai_analysis.get("confidence", 0.0)),
+                "crash_type": ai_analysis.get("crash_type", "unknown"),
+                "timestamp": crash_event.crash_timestamp.isoformat(),  # type: ignore[attr-defined]
+                "gps_location": gps_location,
+                "map_link": map_link,
+            },
+            "priority": "high",  # High priority for crash notifications
+            "channelId": "crash_alerts",  # Android notification channel
+        }
 
     def send_test_notification(
         self,
@@ -218,83 +214,143 @@ class FCMService:
         self,
         device_id: str,
         message: dict[str, Any],
+        timeout: float | None = None,
     ) -> bool:
         """Send notification via Expo API without updating crash_event.
 
         Args:
             device_id: Device identifier for logging
             message: Notification message payload
+            timeout: Per-request timeout in seconds (defaults to the client's)
 
         Returns:
             True if notification sent successfully, False otherwise
 
         """
-        if httpx is None:
+        tickets = self.send_push_batch([message], timeout=timeout)
+        if not tickets or not tickets[0].ok:
             return False
+        logger.info("Expo push notification sent successfully for device %s", device_id)
+        return True
 
-        with httpx.Client(timeout=10.0) as client:
-            response = client.post(
-                app_settings.expo_push_api_url,
-                json=message,
-                headers={
-                    "Accept": "application/json",
-                    "Accept-encoding": "gzip, deflate",
-                    "Content-Type": "application/json",
-                },
+    def send_push_batch(self, messages: list[dict[str, Any]], timeout: float | None = None) -> list[PushTicket]:
+        """Send many push messages with as few Expo API requests as possible.
+
+        Messages are packed up to ``EXPO_MAX_MESSAGES_PER_REQUEST`` per request
+        over the pooled client. Expo answers each request with one ticket per
+        message, in order, so tickets are matched back to the message's token.
+        Tokens Expo reports as ``DeviceNotRegistered`` are deactivated.
+
+        Args:
+            messages: Expo push messages, each with a single ``to`` token
+            timeout: Per-request timeout in seconds (defaults to the client's)
+
+        Returns:
+            One ticket per message, in order. Messages of a request that failed
+            as a whole get an error ticket; this method does not raise.
+
+        """
+        client = get_expo_client()
+        if client is None:
+            logger.error("httpx package not available. Install it with: pip install httpx")
+            return [PushTicket(token=message["to"], status="error", error="ClientUnavailable") for message in messages]
+
+        tickets: list[PushTicket] = []
+        for start in range(0, len(messages), EXPO_MAX_MESSAGES_PER_REQUEST):
+            chunk = messages[start : start + EXPO_MAX_MESSAGES_PER_REQUEST]
+            tickets.extend(self._send_push_chunk(client, chunk, timeout))
+
+        failed = [ticket for ticket in tickets if not ticket.ok]
+        if failed:
+            logger.error(
+                "Failed to send %s/%s Expo push notifications: %s",
+                len(failed),
+                len(tickets),
+                sorted({ticket.error or ticket.message or "Unknown error" for ticket in failed}),
             )
-            response.raise_for_status()
-            result = response.json()
+        unregistered = [ticket.token for ticket in failed if ticket.error == EXPO_DEVICE_NOT_REGISTERED]
+        if unregistered:
+            self._deactivate_tokens(unregistered)
+        return tickets
 
-            # Expo API returns a list of results, one per notification
-            # Each result has a "status" field: "ok" or "error"
-            # Sometimes the response is wrapped in a "data" key: {"data": {"status": "ok"}}
-            status = None
-            if isinstance(result, list) and len(result) > 0:
-                status = result[0].get("status")
-                if status != "ok":
-                    error_message = result[0].get("message", "Unknown error")
-                    logger.error("Failed to send Expo push notification: %s", error_message)
-                    return False
-            elif isinstance(result, dict):
-                # Check for nested data structure first: {"data": {"status": "ok"}}
-                if "data" in result and isinstance(result.get("data"), dict):
-                    status = result["data"].get("status")
-                else:
-                    status = result.get("status")
-
-                if status != "ok":
-                    logger.error("Failed to send Expo push notification: %s", result)
-                    return False
-            else:
-                logger.error("Unexpected response format from Expo API: %s", result)
-                return False
+    def _send_push_chunk(
+        self,
+        client: Any,  # noqa: ANN401
+        chunk: list[dict[str, Any]],
+        timeout: float | None = None,
+    ) -> list[PushTicket]:
+        """POST one request's worth of messages and demultiplex its tickets."""
 
-            if status == "ok":
-                logger.info("Expo push notification sent successfully for device %s", device_id)
-                return True
+        def failed(error: str, message: str | None = None) -> list[PushTicket]:
+            return [PushTicket(token=item["to"], status="error", error=error, message=message) for item in chunk]
 
-            return False
+        try:
+            # Pooled keep-alive client: reuses a warm connection to the Expo API
+            # httpx reads an explicit timeout=None as "no timeout", so only pass one when set
+            extra = {"timeout": timeout} if timeout is not None else {}
+            response = client.post(app_settings.expo_push_api_url, json=chunk, **extra)
+            response.raise_for_status()
+            result = response.json()
+        except httpx.HTTPError as e:
+            logger.exception("HTTP error sending %s Expo push notifications", len(chunk))
+            return failed(type(e).__name__, str(e))
+        except ValueError as e:
+            logger.exception("Invalid JSON from Expo API")
+            return failed("InvalidResponse", str(e))
+
+        # Expo returns {"data": [ticket, ...]} in message order; a single-object
+        # request gets {"data": ticket}, and request-level errors come as {"errors": [...]}
+        data = result.get("data") if isinstance(result, dict) else result
+        if isinstance(data, dict):
+            data = [data]
+        if not isinstance(data, list) or len(data) != len(chunk):
+            logger.error("Unexpected response format from Expo API: %s", result)
+            errors = result.get("errors") if isinstance(result, dict) else None
+            return failed("InvalidResponse", str(errors or result)[:200])
+
+        return [
+            PushTicket(
+                token=item["to"],
+                status=ticket.get("status", "error"),
+                ticket_id=ticket.get("id"),
+                message=ticket.get("message"),
+                error=(ticket.get("details") or {}).get("error"),
+            )
+            for item, ticket in zip(chunk, data, strict=True)
+        ]
 
-    def _get_expo_push_token(self, device_id: str) -> str | None:
+    def _deactivate_tokens(self, tokens: list[str]) -> None:
+        """Mark tokens Expo no longer recognises as inactive."""
+        try:
+            stale = DeviceToken.objects.filter(fcm_token__in=tokens, is_active=True)  # type: ignore[attr-defined]
+            owners = list(stale.values_list("device_id", "user_id"))
+            updated = stale.update(is_active=False)
+        except Exception:
+            logger.exception("Error deactivating unregistered Expo push tokens")
+            return
+        # Bulk updates skip the model signals; drop the cached recipient sets here
+        invalidate_push_recipients(
+            device_ids=[device_id for device_id, _ in owners],
+            owner_ids=owners_of_users({user_id for _, user_id in owners}),
+        )
+        logger.info("Deactivated %s unregistered Expo push tokens", updated)
+
+    def _get_expo_push_token(self, device_id: str, owner_id: int | None = None) -> str | None:
         """Get Expo Push Token for device.
 
+        Served from the cached recipient set, which the loved-one fan-out of the
+        same alert then reuses without another query.
+
         Args:
             device_id: Device identifier
+            owner_id: Device owner's user id (shares the cached set with the fan-out)
 
         Returns:
             Expo Push Token string or None if not found
 
         """
-        try:
-            device_token = DeviceToken.objects.filter(  # type: ignore[attr-defined]
-                device_id=device_id,
-                is_active=True,
-            ).first()
-        except Exception:
-            logger.exception("Error retrieving Expo push token")
-            return None
-
-        if device_token:
-            # The fcm_token field actually stores Expo Push Tokens
-            return device_token.fcm_token  # type: ignore[attr-defined]
+        for recipient in resolve_push_recipients(device_id, owner_id):
+            if recipient.role == ROLE_OWNER:
+                # The fcm_token field actually stores Expo Push Tokens
+                return recipient.token
         return None
@@ -0,0 +1,130 @@
+"""After-commit, concurrent fan-out of crash alert notifications."""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from django.db import connection, transaction
+from sentry.settings.config import settings as app_settings
+
+from device.models import CrashEvent, NotificationOutbox
+from device.services.fcm_service import EXPO_MAX_MESSAGES_PER_REQUEST
+from device.services.notification_outbox import NotificationOutboxService
+
+logger = logging.getLogger("device")
+
+
+class NotificationDispatcher:
+    """Sends a confirmed crash's owner and loved-one pushes off the request path.
+
+    The pushes are recorded in the notification outbox inside the transaction
+    that creates the CrashEvent, and sent once it commits, so no row locks are
+    held across Expo calls and a rolled-back event never notifies anyone. The
+    owner push and each loved-one batch (up to ``EXPO_MAX_MESSAGES_PER_REQUEST``
+    tokens) run as separate tasks on a bounded per-process thread pool, each
+    with its own request timeout, so one slow recipient group neither delays the
+    others nor the alert response. Pushes that fail here, or never run because
+    the process died, are retried by the ``process_notification_outbox`` worker.
+    """
+
+    def __init__(self, max_workers: int, send_timeout: float) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            max_workers: Maximum pushes in flight per process
+            send_timeout: Per-request timeout in seconds for each push
+
+        """
+        self.max_workers = max_workers
+        self.send_timeout = send_timeout
+        self.outbox = NotificationOutboxService()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_pid: int | None = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return this process's pool, recreating it after a fork."""
+        with self._lock:
+            if self._executor is None or self._executor_pid != os.getpid():
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="notify")
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def dispatch_crash_alert(self, device_id: str, crash_event: CrashEvent, ai_analysis: dict[str, Any]) -> None:
+        """Queue a crash's notifications in the current transaction and send them once it commits.
+
+        Args:
+            device_id: Device that raised the alert
+            crash_event: The (just created) crash event
+            ai_analysis: AI analysis results used in the owner push
+
+        """
+        rows = self.outbox.enqueue_crash_alert(device_id, crash_event, ai_analysis)
+        if not rows:
+            return
+        owner_ids = [row.id for row in rows if row.recipient_role == NotificationOutbox.ROLE_OWNER]
+        loved_one_ids = [row.id for row in rows if row.recipient_role == NotificationOutbox.ROLE_LOVED_ONE]
+        transaction.on_commit(lambda: self._fan_out(crash_event, owner_ids, loved_one_ids))
+
+    def _fan_out(self, crash_event: CrashEvent, owner_ids: list[int], loved_one_ids: list[int]) -> None:
+        """Submit the owner push and one task per loved-one batch to the pool (runs at commit)."""
+        started = time.monotonic()
+        chunks = [
+            loved_one_ids[start : start + EXPO_MAX_MESSAGES_PER_REQUEST]
+            for start in range(0, len(loved_one_ids), EXPO_MAX_MESSAGES_PER_REQUEST)
+        ]
+        logger.info(
+            "[NOTIFY] Dispatching crash notifications (crash_event_id=%s, owner=%s, loved_ones=%s, requests=%s)",
+            crash_event.id,  # type: ignore[attr-defined]
+            bool(owner_ids),
+            len(loved_one_ids),
+            len(chunks) + bool(owner_ids),
+        )
+        executor = self._get_executor()
+        if owner_ids:
+            executor.submit(self._run, self._deliver, "Owner push", crash_event, owner_ids, started)
+        for chunk in chunks:
+            executor.submit(self._run, self._deliver, "Loved-one batch", crash_event, chunk, started)
+
+    def _run(self, func: Any, *args: Any) -> None:  # noqa: ANN401
+        """Run one notification task on a pool thread."""
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("[NOTIFY] Notification task failed")
+        finally:
+            # Pool threads hold their own DB connection (outbox claims and updates)
+            connection.close()
+
+    def _deliver(self, label: str, crash_event: CrashEvent, ids: list[int], started: float) -> None:
+        # Rows a worker already claimed (or sent) are skipped, never sent twice
+        rows = self.outbox.claim(len(ids), ids=ids)
+        sent = self.outbox.deliver(rows, timeout=self.send_timeout)
+        logger.info(
+            "[NOTIFY] %s done (crash_event_id=%s, sent=%s/%s, %.0f ms after commit)",
+            label,
+            crash_event.id,  # type: ignore[attr-defined]
+            sent,
+            len(ids),
+            (time.monotonic() - started) * 1000,
+        )
+
+    def shutdown(self, timeout: float = 10.0) -> None:
+        """Wait for in-flight notifications (e.g. from gunicorn's worker_exit hook)."""
+        executor = self._executor
+        if executor is None or self._executor_pid != os.getpid():
+            return
+        waiter = threading.Thread(target=executor.shutdown, kwargs={"wait": True}, daemon=True)
+        waiter.start()
+        waiter.join(timeout)
+        if waiter.is_alive():
+            logger.error("[NOTIFY] Shutdown timed out with notifications still in flight")
+
+
+notification_dispatcher = NotificationDispatcher(
+    max_workers=app_settings.notification_max_parallel,
+    send_timeout=app_settings.notification_send_timeout_seconds,
+)
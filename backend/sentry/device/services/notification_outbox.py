@@ -0,0 +1,221 @@
+"""Transactional outbox of crash alert push notifications."""
+
+import logging
+import random
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from sentry.settings.config import settings as app_settings
+
+from device.models import CrashEvent, NotificationOutbox
+from device.services.fcm_service import FCMService, PushTicket
+from device.services.push_recipients import ROLE_OWNER, resolve_push_recipients
+from device.utils.crash_utils import build_loved_one_messages
+
+logger = logging.getLogger("device")
+
+# Expo errors that no retry can fix
+PERMANENT_PUSH_ERRORS = frozenset({"DeviceNotRegistered", "InvalidCredentials", "MessageTooBig", "MismatchSenderId"})
+
+
+class NotificationOutboxService:
+    """Durable queue of crash alert pushes with retries and exponential backoff.
+
+    Pushes are written as ``NotificationOutbox`` rows in the transaction that
+    creates the CrashEvent, so a committed crash always has its notifications
+    recorded. Senders claim due rows with ``SELECT ... FOR UPDATE SKIP LOCKED``
+    and a lease, so any number of dispatcher threads and outbox workers share
+    the table without sending a row twice; a failed push is rescheduled with
+    jittered exponential backoff until it is sent or runs out of attempts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize outbox settings."""
+        self.max_attempts = app_settings.notification_outbox_max_attempts
+        self.backoff_base = app_settings.notification_outbox_backoff_base_seconds
+        self.backoff_max = app_settings.notification_outbox_backoff_max_seconds
+        self.lease = timedelta(seconds=app_settings.notification_outbox_lease_seconds)
+
+    def enqueue_crash_alert(
+        self,
+        device_id: str,
+        crash_event: CrashEvent,
+        ai_analysis: dict[str, Any],
+    ) -> list[NotificationOutbox]:
+        """Record the owner and loved-one pushes of a crash (call inside its transaction).
+
+        Args:
+            device_id: Device that raised the alert
+            crash_event: The (just created) crash event
+            ai_analysis: AI analysis results used in the owner push
+
+        Returns:
+            The created outbox rows, owner push first
+
+        """
+        rows = []
+        owner_token = next(
+            (
+                recipient.token
+                for recipient in resolve_push_recipients(device_id, crash_event.user_id)  # type: ignore[attr-defined]
+                if recipient.role == ROLE_OWNER
+            ),
+            None,
+        )
+        if owner_token:
+            rows.append(
+                NotificationOutbox(
+                    crash_event=crash_event,
+                    device_id=device_id,
+                    recipient_role=NotificationOutbox.ROLE_OWNER,
+                    token=owner_token,
+                    message=FCMService().build_crash_message(owner_token, crash_event, ai_analysis),
+                ),
+            )
+        else:
+            logger.warning("No Expo push token found for device %s", device_id)
+
+        messages, _recipients = build_loved_one_messages(device_id, crash_event)
+        rows.extend(
+            NotificationOutbox(
+                crash_event=crash_event,
+                device_id=device_id,
+                recipient_role=NotificationOutbox.ROLE_LOVED_ONE,
+                token=message["to"],
+                message=message,
+            )
+            for message in messages
+        )
+        if not rows:
+            return []
+        rows = NotificationOutbox.objects.bulk_create(rows)  # type: ignore[attr-defined]
+        logger.info(
+            "[NOTIFY] Crash notifications queued in outbox (crash_event_id=%s, owner=%s, loved_ones=%s)",
+            crash_event.id,  # type: ignore[attr-defined]
+            bool(owner_token),
+            len(messages),
+        )
+        return rows
+
+    def claim(self, limit: int, ids: list[int] | None = None) -> list[NotificationOutbox]:
+        """Claim due pushes (pending and due, or sending with an expired lease).
+
+        Args:
+            limit: Maximum rows to claim
+            ids: Restrict the claim to these rows (the after-commit fast path)
+
+        Returns:
+            The claimed rows, now marked sending under this caller's lease
+
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            rows = NotificationOutbox.objects.select_for_update(skip_locked=True).filter(  # type: ignore[attr-defined]
+                Q(status=NotificationOutbox.STATUS_PENDING, next_attempt_at__lte=now)
+                | Q(status=NotificationOutbox.STATUS_SENDING, locked_until__lt=now),
+                attempts__lt=self.max_attempts,
+            )
+            if ids is not None:
+                rows = rows.filter(id__in=ids)
+            rows = list(rows.order_by("next_attempt_at")[:limit])
+            for row in rows:
+                row.status = NotificationOutbox.STATUS_SENDING
+                row.locked_until = now + self.lease
+                row.attempts += 1
+            NotificationOutbox.objects.bulk_update(rows, ["status", "locked_until", "attempts"])  # type: ignore[attr-defined]
+        return rows
+
+    def deliver(self, rows: list[NotificationOutbox], timeout: float | None = None) -> int:
+        """Send claimed pushes in batches and record each outcome.
+
+        Args:
+            rows: Rows claimed with ``claim``
+            timeout: Per-request timeout in seconds (defaults to the client's)
+
+        Returns:
+            Number of pushes Expo accepted
+
+        """
+        if not rows:
+            return 0
+        tickets = FCMService().send_push_batch([row.message for row in rows], timeout=timeout)
+        now = timezone.now()
+        for row, ticket in zip(rows, tickets, strict=True):
+            self._record(row, ticket, now)
+        NotificationOutbox.objects.bulk_update(  # type: ignore[attr-defined]
+            rows,
+            ["status", "locked_until", "next_attempt_at", "last_error", "ticket_id", "sent_at"],
+        )
+
+        alerted = {
+            row.crash_event_id  # type: ignore[attr-defined]
+            for row in rows
+            if row.status == NotificationOutbox.STATUS_SENT and row.recipient_role == NotificationOutbox.ROLE_OWNER
+        }
+        if alerted:
+            CrashEvent.objects.filter(id__in=alerted).update(alert_sent=True)  # type: ignore[attr-defined]
+        return sum(row.status == NotificationOutbox.STATUS_SENT for row in rows)
+
+    def _record(self, row: NotificationOutbox, ticket: PushTicket, now: datetime) -> None:
+        """Apply one ticket to its row: sent, rescheduled, or failed."""
+        row.locked_until = None
+        if ticket.ok:
+            row.status = NotificationOutbox.STATUS_SENT
+            row.ticket_id = ticket.ticket_id or ""
+            row.last_error = ""
+            row.sent_at = now
+            return
+
+        row.last_error = (ticket.error or ticket.message or "Unknown error")[:255]
+        if ticket.error in PERMANENT_PUSH_ERRORS or row.attempts >= self.max_attempts:
+            row.status = NotificationOutbox.STATUS_FAILED
+            logger.error(
+                "[NOTIFY] Giving up on %s push for crash event %s after %s attempts: %s",
+                row.recipient_role,
+                row.crash_event_id,  # type: ignore[attr-defined]
+                row.attempts,
+                row.last_error,
+            )
+            return
+        row.status = NotificationOutbox.STATUS_PENDING
+        row.next_attempt_at = now + self.backoff(row.attempts)
+        logger.warning(
+            "[NOTIFY] %s push for crash event %s failed (attempt %s/%s), retrying at %s: %s",
+            row.recipient_role,
+            row.crash_event_id,  # type: ignore[attr-defined]
+            row.attempts,
+            self.max_attempts,
+            row.next_attempt_at.isoformat(),
+            row.last_error,
+        )
+
+    def backoff(self, attempts: int) -> timedelta:
+        """Return the delay before the next attempt after ``attempts`` failures.
+
+        The delay doubles per attempt up to the cap, then half of it is
+        randomised ("equal jitter") so pushes that failed together, e.g. during
+        an Expo outage, do not all retry at the same instant.
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** max(attempts - 1, 0))
+        return timedelta(seconds=delay / 2 + random.uniform(0, delay / 2))  # noqa: S311
+
+    def fail_abandoned(self) -> int:
+        """Mark pushes whose sender stopped mid-send with no attempts left as failed.
+
+        Returns:
+            Number of pushes marked failed
+
+        """
+        now = timezone.now()
+        return NotificationOutbox.objects.filter(  # type: ignore[attr-defined]
+            status=NotificationOutbox.STATUS_SENDING,
+            locked_until__lt=now,
+            attempts__gte=self.max_attempts,
+        ).update(
+            status=NotificationOutbox.STATUS_FAILED,
+            locked_until=None,
+            last_error="Sender stopped before finishing",
+        )
@@ -0,0 +1,137 @@
+"""Resolution of push recipients for crash alerts, cached across workers.
+
+One joined query returns every active Expo token of a crash alert's recipients:
+the tokens registered for the alerting device (the owner) and the tokens of the
+owner's active loved ones. Resolved sets live in the shared cache under version
+stamps per device and per owner; ``LovedOne`` and ``DeviceToken`` changes bump
+the stamps (see ``device.signals``), so stale sets are never read again.
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+
+from core.models import LovedOne
+from django.core.cache import caches
+from django.db import DatabaseError, transaction
+from django.db.models import Q
+from sentry.settings.config import settings as app_settings
+
+from device.models import DeviceToken
+
+logger = logging.getLogger("device")
+
+CACHE_ALIAS = "shared"
+RECIPIENTS_KEY = "push_recipients:{device_id}:{owner_id}:{device_version}:{owner_version}"
+DEVICE_VERSION_KEY = "push_recipients:version:device:{device_id}"
+OWNER_VERSION_KEY = "push_recipients:version:owner:{owner_id}"
+
+ROLE_OWNER = "owner"
+ROLE_LOVED_ONE = "loved_one"
+
+
+@dataclass(frozen=True, slots=True)
+class PushRecipient:
+    """One active push token and whose it is."""
+
+    token: str
+    device_id: str
+    user_id: int | None
+    email: str | None
+    role: str  # ROLE_OWNER or ROLE_LOVED_ONE
+
+
+def _version_keys(device_id: str, owner_id: int | None) -> tuple[str, str]:
+    return DEVICE_VERSION_KEY.format(device_id=device_id), OWNER_VERSION_KEY.format(owner_id=owner_id)
+
+
+def _query_recipients(device_id: str, owner_id: int | None) -> list[PushRecipient]:
+    """Fetch owner and loved-one tokens in a single query, newest token first."""
+    condition = Q(device_id=device_id)
+    if owner_id is not None:
+        # Both conditions in one filter() apply to the same LovedOne join row
+        condition |= Q(user__loved_one_for__user_id=owner_id, user__loved_one_for__is_active=True)
+    rows = (
+        DeviceToken.objects.filter(condition, is_active=True)  # type: ignore[attr-defined]
+        .order_by("-created_at")
+        .values_list("fcm_token", "device_id", "user_id", "user__email", "created_at")
+        .distinct()
+    )
+    recipients: dict[str, PushRecipient] = {}
+    for token, token_device_id, user_id, email, _created_at in rows:
+        role = ROLE_OWNER if token_device_id == device_id else ROLE_LOVED_ONE
+        # A token reached through several relationships is notified once
+        recipients.setdefault(token, PushRecipient(token, token_device_id, user_id, email, role))
+    return list(recipients.values())
+
+
+def resolve_push_recipients(device_id: str, owner_id: int | None) -> list[PushRecipient]:
+    """Return every active push recipient of an alert from a device.
+
+    Args:
+        device_id: Device that raised the alert (its tokens are the owner's)
+        owner_id: Device owner's user id; None skips loved ones
+
+    Returns:
+        Recipients, owner tokens and loved-one tokens mixed, newest token first
+
+    """
+    cache = caches[CACHE_ALIAS]
+    device_version_key, owner_version_key = _version_keys(device_id, owner_id)
+    versions = cache.get_many([device_version_key, owner_version_key])
+    key = RECIPIENTS_KEY.format(
+        device_id=device_id,
+        owner_id=owner_id,
+        device_version=versions.get(device_version_key, 0),
+        owner_version=versions.get(owner_version_key, 0),
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return [PushRecipient(**recipient) for recipient in cached]
+
+    try:
+        recipients = _query_recipients(device_id, owner_id)
+    except DatabaseError:
+        logger.exception("Error resolving push recipients for device %s", device_id)
+        return []
+    cache.set(key, [asdict(recipient) for recipient in recipients], app_settings.push_recipient_cache_seconds)
+    return recipients
+
+
+def owners_of_users(user_ids: set[int | None]) -> list[int]:
+    """Return the owners who have any of the users as a loved one (active or not)."""
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not user_ids:
+        return []
+    return list(
+        LovedOne.objects.filter(loved_one_id__in=user_ids)  # type: ignore[attr-defined]
+        .values_list("user_id", flat=True)
+        .distinct(),
+    )
+
+
+def _bump(key: str) -> None:
+    cache = caches[CACHE_ALIAS]
+    if not cache.add(key, 1, None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, None)
+
+
+def invalidate_push_recipients(
+    device_ids: list[str] | tuple[str, ...] = (),
+    owner_ids: list[int] | tuple[int, ...] = (),
+) -> None:
+    """Drop cached recipient sets of the given devices and owners.
+
+    The bump is deferred until the surrounding transaction commits, so a
+    concurrent resolve cannot re-cache the pre-change rows under the new stamp.
+    """
+
+    def bump() -> None:
+        for device_id in set(device_ids):
+            _bump(DEVICE_VERSION_KEY.format(device_id=device_id))
+        for owner_id in set(owner_ids):
+            _bump(OWNER_VERSION_KEY.format(owner_id=owner_id))
+
+    transaction.on_commit(bump)
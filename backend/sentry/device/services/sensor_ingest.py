@@ -0,0 +1,221 @@
+"""Sensor ingest service for persisting MPU6050 readings."""
+
+import logging
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+
+from common.utils.batch_writer import BackgroundBatchWriter
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from sentry.settings.config import settings as app_settings
+
+from device.models import SensorData
+from device.schemas.device_schema import DeviceDataReading
+from device.services.sensor_ring import get_sensor_ring, to_micros
+from device.services.sensor_rollup import SensorRollupService
+from device.utils.sensor_frame import SampleValues
+
+logger = logging.getLogger("device")
+
+# Anything below 2001-01-01 in unix ms is treated as a device uptime clock (ESP32 millis())
+MIN_UNIX_MS = 978_307_200_000
+
+
+def _flush_sensor_rows(rows: list[SensorData]) -> None:
+    """Write-behind flush callback (runs on the flusher thread)."""
+    close_old_connections()
+    SensorIngestService().save_rows(rows)
+    logger.info("Write-behind flush saved %s sensor readings", len(rows))
+
+
+sensor_write_buffer: BackgroundBatchWriter[SensorData] = BackgroundBatchWriter(
+    name="sensor-ingest",
+    flush_func=_flush_sensor_rows,
+    capacity=app_settings.device_ingest_buffer_capacity,
+    flush_size=app_settings.device_ingest_flush_size,
+    flush_interval=app_settings.device_ingest_flush_interval_ms / 1000,
+    put_timeout=app_settings.device_ingest_enqueue_timeout_ms / 1000,
+)
+
+
+class SensorIngestService:
+    """Service for turning device payloads into SensorData rows."""
+
+    def resolve_timestamps(
+        self,
+        timestamps: Sequence[int],
+        sent_at: int | None = None,
+    ) -> list[datetime]:
+        """Map device-clock timestamps (ms) to aware server datetimes.
+
+        If the device sends its clock at send time (``sent_at``), every reading is
+        shifted by the offset between that clock and the server clock, which works for
+        both unix ms and ``millis()`` since boot. Without ``sent_at``, unix ms values are
+        used as-is and uptime values are anchored so the newest reading lands at "now".
+
+        Args:
+            timestamps: Device timestamps in milliseconds
+            sent_at: Device clock (ms) when the batch was sent
+
+        Returns:
+            List of timezone-aware datetimes, one per timestamp
+
+        """
+        now = timezone.now()
+        if not timestamps:
+            return []
+
+        if sent_at is not None:
+            anchor = sent_at
+        elif min(timestamps) >= MIN_UNIX_MS:
+            return [datetime.fromtimestamp(ts / 1000, tz=UTC) for ts in timestamps]
+        else:
+            anchor = max(timestamps)
+
+        return [now - timedelta(milliseconds=anchor - ts) for ts in timestamps]
+
+    def build_rows(
+        self,
+        device_id: str | None,
+        readings: Sequence[DeviceDataReading],
+        sent_at: int | None = None,
+    ) -> list[SensorData]:
+        """Build unsaved SensorData rows for a batch of readings.
+
+        Args:
+            device_id: Device identifier shared by every reading
+            readings: Readings in the batch
+            sent_at: Device clock (ms) when the batch was sent
+
+        Returns:
+            List of unsaved SensorData instances
+
+        """
+        return self.build_rows_from_values(
+            device_id,
+            [
+                (
+                    reading.timestamp,
+                    reading.ax,
+                    reading.ay,
+                    reading.az,
+                    reading.roll,
+                    reading.pitch,
+                    reading.tilt_detected,
+                )
+                for reading in readings
+            ],
+            sent_at=sent_at,
+        )
+
+    def build_rows_from_values(
+        self,
+        device_id: str | None,
+        samples: Sequence[SampleValues],
+        sent_at: int | None = None,
+    ) -> list[SensorData]:
+        """Build unsaved SensorData rows from decoded sample tuples.
+
+        Args:
+            device_id: Device identifier shared by every sample
+            samples: (timestamp_ms, ax, ay, az, roll, pitch, tilt_detected) tuples
+            sent_at: Device clock (ms) when the batch was sent
+
+        Returns:
+            List of unsaved SensorData instances
+
+        """
+        device_id = device_id or "unknown"
+        timestamps = self.resolve_timestamps([sample[0] for sample in samples], sent_at)
+        return [
+            SensorData(
+                device_id=device_id,
+                ax=ax,
+                ay=ay,
+                az=az,
+                roll=roll,
+                pitch=pitch,
+                tilt_detected=tilt_detected,
+                timestamp=timestamp,
+            )
+            for (_, ax, ay, az, roll, pitch, tilt_detected), timestamp in zip(samples, timestamps, strict=True)
+        ]
+
+    def save_rows(self, rows: list[SensorData]) -> int:
+        """Persist rows with a single bulk insert.
+
+        Readings old enough to be behind the rollup watermark are queued for a
+        re-rollup in the same transaction.
+
+        Args:
+            rows: Unsaved SensorData instances
+
+        Returns:
+            Number of rows written
+
+        """
+        if not rows:
+            return 0
+
+        with transaction.atomic():  # type: ignore[call-overload]
+            SensorData.objects.bulk_create(rows, batch_size=len(rows))  # type: ignore[attr-defined]
+            SensorRollupService().record_late_readings(row.timestamp for row in rows)  # type: ignore[attr-defined]
+        return len(rows)
+
+    def ingest(self, rows: list[SensorData]) -> tuple[int, bool]:
+        """Persist rows, through the write-behind buffer when it is enabled.
+
+        When the buffer stays full past the enqueue timeout the rows are written
+        synchronously instead, so a slow database slows uploads down rather than
+        losing readings.
+
+        Args:
+            rows: Unsaved SensorData instances
+
+        Returns:
+            Tuple of (number of rows accepted, whether they were queued rather than written)
+
+        """
+        self.publish_to_ring(rows)
+
+        if app_settings.device_ingest_write_behind:
+            if sensor_write_buffer.put_many(rows):
+                return len(rows), True
+            logger.warning(
+                "Write-behind buffer full (%s buffered), writing %s readings synchronously",
+                len(sensor_write_buffer),
+                len(rows),
+            )
+        return self.save_rows(rows), False
+
+    def publish_to_ring(self, rows: list[SensorData]) -> None:
+        """Append rows to the shared-memory ring buffer used for crash context lookups.
+
+        Failures are logged and never fail the upload: lookups fall back to the database.
+
+        Args:
+            rows: SensorData instances (saved or not)
+
+        """
+        ring = get_sensor_ring()
+        if ring is None:
+            return
+
+        by_device: dict[str, list] = {}
+        for row in rows:
+            by_device.setdefault(row.device_id, []).append(  # type: ignore[attr-defined]
+                (
+                    to_micros(row.timestamp),  # type: ignore[attr-defined]
+                    row.ax,  # type: ignore[attr-defined]
+                    row.ay,  # type: ignore[attr-defined]
+                    row.az,  # type: ignore[attr-defined]
+                    row.roll,  # type: ignore[attr-defined]
+                    row.pitch,  # type: ignore[attr-defined]
+                    row.tilt_detected,  # type: ignore[attr-defined]
+                ),
+            )
+        try:
+            for device_id, records in by_device.items():
+                ring.append(device_id, records)
+        except OSError:
+            logger.exception("Failed to publish sensor readings to ring buffer")
@@ -0,0 +1,209 @@
+"""Partition management for the range-partitioned SensorData table (PostgreSQL)."""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from django.db import connection, transaction
+from sentry.settings.config import settings as app_settings
+
+from device.models import SensorData
+from device.services.sensor_rollup import SensorRollupService
+
+logger = logging.getLogger("device")
+
+_BOUND_RE = re.compile(r"FOR VALUES FROM \((?P<lower>[^)]*)\) TO \((?P<upper>[^)]*)\)")
+
+
+@dataclass(slots=True)
+class SensorPartition:
+    """A partition attached to the sensor data table."""
+
+    name: str
+    lower: datetime | None  # None for MINVALUE
+    upper: datetime | None  # None for MAXVALUE
+    is_default: bool = False
+
+
+def _parse_bound(value: str) -> datetime | None:
+    """Parse one side of a range partition bound expression."""
+    value = value.strip()
+    if value in {"MINVALUE", "MAXVALUE"}:
+        return None
+    return datetime.fromisoformat(value.strip("'"))
+
+
+class SensorPartitionService:
+    """Creates upcoming SensorData partitions and expires old ones."""
+
+    def __init__(self, granularity: str | None = None) -> None:
+        """Initialize partition service.
+
+        Args:
+            granularity: 'day' or 'hour' (defaults to the configured granularity)
+
+        """
+        self.table = SensorData._meta.db_table  # type: ignore[attr-defined]  # noqa: SLF001
+        self.default_partition = f"{self.table}_default"
+        self.granularity = granularity or app_settings.sensor_partition_granularity
+        self.step = timedelta(hours=1) if self.granularity == "hour" else timedelta(days=1)
+
+    def is_supported(self) -> bool:
+        """Return whether the sensor data table is partitioned on this database."""
+        if connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [self.table])
+            return cursor.fetchone() is not None
+
+    def floor(self, moment: datetime) -> datetime:
+        """Truncate a datetime to the start of its partition (UTC)."""
+        moment = moment.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+        if self.granularity == "day":
+            moment = moment.replace(hour=0)
+        return moment
+
+    def partition_name(self, start: datetime) -> str:
+        """Return the partition table name for a partition starting at ``start``."""
+        suffix = f"{start:%Y%m%d%H}" if self.granularity == "hour" else f"{start:%Y%m%d}"
+        return f"{self.table}_p{suffix}"
+
+    def list_partitions(self) -> list[SensorPartition]:
+        """List partitions attached to the sensor data table, oldest first."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = %s::regclass
+                """,
+                [self.table],
+            )
+            rows = cursor.fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            if bound == "DEFAULT":
+                partitions.append(SensorPartition(name=name, lower=None, upper=None, is_default=True))
+                continue
+            match = _BOUND_RE.search(bound)
+            if not match:
+                logger.warning("[PARTITION] Unrecognised bound for %s: %s", name, bound)
+                continue
+            partitions.append(
+                SensorPartition(
+                    name=name,
+                    lower=_parse_bound(match["lower"]),
+                    upper=_parse_bound(match["upper"]),
+                ),
+            )
+        far_past = datetime.min.replace(tzinfo=UTC)
+        return sorted(partitions, key=lambda p: (p.is_default, p.lower or far_past))
+
+    def ensure_partitions(self, premake: int | None = None, now: datetime | None = None) -> list[str]:
+        """Create any missing partitions from the current one up to ``premake`` ahead.
+
+        Rows that already landed in the DEFAULT partition for a new range are moved
+        into it, so a late run of this command never blocks inserts.
+
+        Args:
+            premake: Number of future partitions to keep ready
+            now: Reference time (defaults to now)
+
+        Returns:
+            Names of the partitions created
+
+        """
+        premake = app_settings.sensor_partition_premake if premake is None else premake
+        start = self.floor(now or datetime.now(UTC))
+        existing = [p for p in self.list_partitions() if not p.is_default]
+
+        created = []
+        for offset in range(premake + 1):
+            lower = start + offset * self.step
+            upper = lower + self.step
+            if any(self._overlaps(p, lower, upper) for p in existing):
+                continue
+            self._create_partition(self.partition_name(lower), lower, upper)
+            created.append(self.partition_name(lower))
+        return created
+
+    def _overlaps(self, partition: SensorPartition, lower: datetime, upper: datetime) -> bool:
+        """Return whether an existing partition overlaps [lower, upper)."""
+        return (partition.lower is None or partition.lower < upper) and (
+            partition.upper is None or partition.upper > lower
+        )
+
+    def _create_partition(self, name: str, lower: datetime, upper: datetime) -> None:
+        """Create and attach one partition, moving matching rows out of DEFAULT first."""
+        quote = connection.ops.quote_name
+        with transaction.atomic(), connection.cursor() as cursor:  # type: ignore[call-overload]
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {quote(name)} "
+                f"(LIKE {quote(self.table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            )
+            cursor.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {quote(self.default_partition)}
+                    WHERE "timestamp" >= %s AND "timestamp" < %s
+                    RETURNING *
+                )
+                INSERT INTO {quote(name)} SELECT * FROM moved
+                """,  # noqa: S608
+                [lower, upper],
+            )
+            if cursor.rowcount:
+                logger.warning("[PARTITION] Moved %s rows from DEFAULT into %s", cursor.rowcount, name)
+            cursor.execute(
+                f"ALTER TABLE {quote(self.table)} ATTACH PARTITION {quote(name)} FOR VALUES FROM (%s) TO (%s)",
+                [lower, upper],
+            )
+        logger.info("[PARTITION] Created %s [%s, %s)", name, lower.isoformat(), upper.isoformat())
+
+    def expire_partitions(
+        self,
+        retention_days: int | None = None,
+        drop: bool = False,  # noqa: FBT001, FBT002
+        now: datetime | None = None,
+    ) -> list[str]:
+        """Detach (and optionally drop) partitions entirely older than the retention horizon.
+
+        Partitions holding readings that have not been rolled up yet are kept, and
+        nothing expires before the per-second rollup has run at least once.
+
+        Args:
+            retention_days: Days of raw data to keep
+            drop: Drop detached partitions instead of leaving them as standalone tables
+            now: Reference time (defaults to now)
+
+        Returns:
+            Names of the partitions expired
+
+        """
+        # Same rule as pruning: nothing goes before it has been rolled up, so no
+        # partition expires while the rollups have never run
+        cutoff = SensorRollupService().raw_prune_cutoff(now, retention_days=retention_days)
+        if cutoff is None:
+            logger.info("[PARTITION] Sensor rollups have not run yet, keeping every partition")
+            return []
+        quote = connection.ops.quote_name
+
+        expired = []
+        for partition in self.list_partitions():
+            if partition.is_default or partition.upper is None or partition.upper > cutoff:
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:  # type: ignore[call-overload]
+                cursor.execute(f"ALTER TABLE {quote(self.table)} DETACH PARTITION {quote(partition.name)}")
+                if drop:
+                    cursor.execute(f"DROP TABLE {quote(partition.name)}")
+            logger.info(
+                "[PARTITION] %s %s (upper bound %s)",
+                "Dropped" if drop else "Detached",
+                partition.name,
+                partition.upper,
+            )
+            expired.append(partition.name)
+        return expired
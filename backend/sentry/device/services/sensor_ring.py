@@ -0,0 +1,281 @@
+"""Cross-worker shared-memory ring buffer of recent sensor readings per device.
+
+All gunicorn workers map the same file (on tmpfs under /dev/shm by default), so a
+reading ingested by one worker is visible to crash-alert lookups in any other.
+
+File layout:
+
+    file header : magic | version u32 | slots u32 | capacity u32
+    slot        : key (64 bytes) | seq u64 | count u64 | valid_since i64 (us) | records[capacity]
+    record      : timestamp i64 (us since epoch) | ax, ay, az, roll, pitch f32 | tilt u8 | pad
+
+Writers serialise per slot with an fcntl byte-range lock (plus a thread lock, since
+fcntl locks are per-process) and publish through a seqlock; readers never lock, they
+retry if the slot's sequence number changed while they were copying it.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+from sentry.settings.config import settings as app_settings
+
+from device.services.sensor_window import RECORD_DTYPE, SensorWindow
+
+logger = logging.getLogger("device")
+
+RING_MAGIC = b"SNTRYRB1"
+RING_VERSION = 1
+FILE_HEADER = struct.Struct("<8sIII")
+SLOT_HEADER = struct.Struct("<64sQQq")
+RECORD = struct.Struct("<qfffff?3x")
+KEY_SIZE = 64
+FREE_KEY = b"\0" * KEY_SIZE
+MAX_PROBES = 8
+MAX_READ_RETRIES = 16
+
+# Same fields as RECORD_DTYPE, laid out like RECORD (padded to 32 bytes)
+RING_RECORD_DTYPE = np.dtype(
+    {
+        "names": list(RECORD_DTYPE.names),
+        "formats": [RECORD_DTYPE.fields[name][0] for name in RECORD_DTYPE.names],
+        "offsets": [0, 8, 12, 16, 20, 24, 28],
+        "itemsize": RECORD.size,
+    },
+)
+
+# (timestamp_us, ax, ay, az, roll, pitch, tilt_detected)
+RingRecord = tuple[int, float, float, float, float, float, bool]
+
+
+def _device_key(device_id: str) -> bytes:
+    """Return the fixed-size slot key for a device id."""
+    raw = device_id.encode("utf-8")
+    if len(raw) > KEY_SIZE:
+        raw = hashlib.blake2b(raw, digest_size=KEY_SIZE // 2).digest()
+    return raw.ljust(KEY_SIZE, b"\0")
+
+
+def to_micros(moment: datetime) -> int:
+    """Convert an aware datetime to integer microseconds since the epoch."""
+    delta = moment - datetime(1970, 1, 1, tzinfo=UTC)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class SensorRingBuffer:
+    """Fixed-size per-device ring buffers in a shared memory-mapped file."""
+
+    def __init__(self, path: Path, slots: int, capacity: int) -> None:
+        """Initialize ring buffer (the file is mapped lazily, per process).
+
+        Args:
+            path: Backing file path
+            slots: Number of device slots
+            capacity: Records per slot
+
+        """
+        self.path = path
+        self.slots = slots
+        self.capacity = capacity
+        self.slot_size = SLOT_HEADER.size + capacity * RECORD.size
+        self.size = FILE_HEADER.size + slots * self.slot_size
+        self._pid: int | None = None
+        self._map: mmap.mmap | None = None
+        self._fd: int | None = None
+        self._lock = threading.Lock()
+
+    # -- mapping -----------------------------------------------------------------
+
+    def _mapped(self) -> mmap.mmap:
+        """Return this process's mapping, (re)opening it after a fork."""
+        if self._map is not None and self._pid == os.getpid():
+            return self._map
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)  # type: ignore[union-attr]
+        try:
+            header = os.pread(fd, FILE_HEADER.size, 0)
+            expected = FILE_HEADER.pack(RING_MAGIC, RING_VERSION, self.slots, self.capacity)
+            if header != expected:
+                # New file or different geometry: start from an empty buffer
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, self.size)
+                os.pwrite(fd, expected, 0)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)  # type: ignore[union-attr]
+
+        self._fd = fd
+        self._map = mmap.mmap(fd, self.size)
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        return self._map
+
+    def _slot_offset(self, index: int) -> int:
+        return FILE_HEADER.size + index * self.slot_size
+
+    def _find_slot(self, buf: mmap.mmap, key: bytes, *, claim: bool) -> int | None:
+        """Probe for the slot holding ``key`` (or a free one when claiming)."""
+        home = zlib.crc32(key) % self.slots
+        for probe in range(MAX_PROBES):
+            index = (home + probe) % self.slots
+            slot_key = buf[self._slot_offset(index) : self._slot_offset(index) + KEY_SIZE]
+            if slot_key == key:
+                return index
+            if slot_key == FREE_KEY:
+                return index if claim else None
+        # Probe sequence exhausted: evict the home slot when writing
+        return home if claim else None
+
+    # -- writes ------------------------------------------------------------------
+
+    def _lock_slot_for(self, buf: mmap.mmap, key: bytes) -> int:
+        """Find the slot to write ``key`` into and lock it, returning its offset.
+
+        The slot is searched for without a lock, so once it is locked its key is
+        checked again: if another process claimed it for a different device in the
+        meantime, the search is repeated (still holding no other slot lock).
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            index = self._find_slot(buf, key, claim=True)
+            offset = self._slot_offset(index)  # type: ignore[arg-type]
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self.slot_size, offset)  # type: ignore[union-attr]
+            slot_key = buf[offset : offset + KEY_SIZE]
+            if (
+                slot_key in (key, FREE_KEY)
+                # Another device's slot is only ours to take when eviction is still the answer
+                or self._find_slot(buf, key, claim=True) == index
+                or attempts >= MAX_PROBES
+            ):
+                return offset
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_size, offset)  # type: ignore[union-attr]
+
+    def append(self, device_id: str, records: Iterable[RingRecord]) -> None:
+        """Append records for a device.
+
+        Args:
+            device_id: Device identifier
+            records: Records in arrival order
+
+        """
+        records = list(records)
+        if not records:
+            return
+
+        buf = self._mapped()
+        key = _device_key(device_id)
+        with self._lock:
+            offset = self._lock_slot_for(buf, key)
+            try:
+                slot_key, seq, count, valid_since = SLOT_HEADER.unpack_from(buf, offset)
+                if slot_key != key:
+                    # Claiming a free slot or evicting another device
+                    count = 0
+                    valid_since = min(record[0] for record in records)
+
+                SLOT_HEADER.pack_into(buf, offset, key, seq + 1, count, valid_since)  # odd: write in progress
+                records_offset = offset + SLOT_HEADER.size
+                for record in records[-self.capacity :]:
+                    RECORD.pack_into(buf, records_offset + (count % self.capacity) * RECORD.size, *record)
+                    count += 1
+                SLOT_HEADER.pack_into(buf, offset, key, seq + 2, count, valid_since)  # even: published
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_size, offset)  # type: ignore[union-attr]
+
+    # -- reads -------------------------------------------------------------------
+
+    def _snapshot(self, buf: mmap.mmap, offset: int, key: bytes) -> tuple[int, int, bytes] | None:
+        """Copy a consistent (count, valid_since, records) snapshot of a slot."""
+        for _ in range(MAX_READ_RETRIES):
+            slot_key, seq, count, valid_since = SLOT_HEADER.unpack_from(buf, offset)
+            if slot_key != key:
+                return None
+            if seq % 2:
+                continue
+            data = buf[offset + SLOT_HEADER.size : offset + self.slot_size]
+            if SLOT_HEADER.unpack_from(buf, offset)[1] == seq:
+                return count, valid_since, data
+        return None
+
+    def read_window(self, device_id: str, since: datetime) -> SensorWindow | None:
+        """Return a device's readings at or after ``since`` as a SensorWindow.
+
+        The slot is copied out of shared memory once (required for a consistent
+        seqlock read); the copy is then viewed in place as a structured array and
+        split into contiguous columns.
+
+        Args:
+            device_id: Device identifier
+            since: Start of the window
+
+        Returns:
+            Window of readings, or None if the buffer cannot guarantee the window is
+            complete (device not buffered, buffer started after ``since``, or wrapped past it)
+
+        """
+        buf = self._mapped()
+        key = _device_key(device_id)
+        index = self._find_slot(buf, key, claim=False)
+        if index is None:
+            return None
+        snapshot = self._snapshot(buf, self._slot_offset(index), key)
+        if snapshot is None:
+            return None
+
+        count, valid_since, data = snapshot
+        since_us = to_micros(since)
+        if since_us < valid_since:
+            return None
+
+        records = np.frombuffer(data, dtype=RING_RECORD_DTYPE, count=self.capacity)
+        if count <= self.capacity:
+            records = records[:count]
+        else:
+            # Rotate so the oldest retained record comes first
+            records = np.roll(records, -(count % self.capacity))
+            if records["timestamp"].min() > since_us:
+                return None  # Wrapped: the oldest part of the window was overwritten
+
+        records = records[records["timestamp"] >= since_us]
+        if records.size > 1 and np.any(np.diff(records["timestamp"]) < 0):
+            # Late batches can append older readings after newer ones
+            records = records[np.argsort(records["timestamp"], kind="stable")]
+        return SensorWindow.from_records(records)
+
+
+_ring: SensorRingBuffer | None = None
+_ring_lock = threading.Lock()
+
+
+def get_sensor_ring() -> SensorRingBuffer | None:
+    """Return the process-wide ring buffer, or None when it is disabled or unsupported."""
+    global _ring  # noqa: PLW0603
+    if not app_settings.sensor_ring_enabled or fcntl is None:
+        return None
+    if _ring is None:
+        with _ring_lock:
+            if _ring is None:
+                shm = Path("/dev/shm")  # noqa: S108
+                default_dir = shm if shm.is_dir() else Path(tempfile.gettempdir())
+                _ring = SensorRingBuffer(
+                    path=Path(app_settings.sensor_ring_path or default_dir / "sentry-sensor-ring"),
+                    slots=app_settings.sensor_ring_slots,
+                    capacity=app_settings.sensor_ring_capacity,
+                )
+    return _ring
@@ -0,0 +1,360 @@
+"""Sensor data rollup and retention service."""
+
+import logging
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+
+from django.db import transaction
+from django.db.models import Avg, Count, F, FloatField, Max, Min, Q, QuerySet, Sum
+from django.db.models.functions import Sqrt, TruncMinute, TruncSecond
+from django.utils import timezone
+from sentry.settings.config import settings as app_settings
+
+from device.models import (
+    SensorData,
+    SensorRollupBacklog,
+    SensorRollupCheckpoint,
+    SensorRollupMinute,
+    SensorRollupSecond,
+)
+
+logger = logging.getLogger("device")
+
+GRAVITY = 9.81
+
+AXES = ("ax", "ay", "az")
+SUMMARY_FIELDS = [
+    "sample_count",
+    *(f"{axis}_{stat}" for axis in AXES for stat in ("min", "max", "mean")),
+    "g_peak",
+    "roll_min",
+    "roll_max",
+    "pitch_min",
+    "pitch_max",
+    "tilt_count",
+]
+
+
+class SensorRollupService:
+    """Aggregates raw SensorData into per-second and per-minute summaries.
+
+    Each resolution keeps an exclusive watermark in SensorRollupCheckpoint and every
+    chunk is upserted together with its watermark in one transaction, so an
+    interrupted run resumes where it stopped and re-running a range is harmless.
+    Readings written behind the watermark (offline devices, a backed-up write-behind
+    buffer) are recorded in SensorRollupBacklog and rolled up again on the next run.
+    """
+
+    def get_watermark(self, resolution: str) -> datetime | None:
+        """Return the watermark for a resolution, or None if it never ran."""
+        checkpoint = SensorRollupCheckpoint.objects.filter(resolution=resolution).first()  # type: ignore[attr-defined]
+        return checkpoint.watermark if checkpoint else None  # type: ignore[attr-defined]
+
+    def _set_watermark(self, resolution: str, watermark: datetime) -> None:
+        SensorRollupCheckpoint.objects.update_or_create(  # type: ignore[attr-defined]
+            resolution=resolution,
+            defaults={"watermark": watermark},
+        )
+
+    def record_late_readings(self, timestamps: Iterable[datetime], now: datetime | None = None) -> bool:
+        """Queue the range of readings that may already be behind the per-second watermark.
+
+        The watermark never passes ``now - sensor_rollup_settle_seconds``, so only older
+        readings need a re-rollup. Call inside the transaction that writes the readings,
+        so the backlog entry becomes visible together with them.
+
+        Args:
+            timestamps: Timestamps of the readings being written
+            now: Reference time (defaults to now)
+
+        Returns:
+            True if a backlog entry was recorded
+
+        """
+        settled = (now or timezone.now()) - timedelta(seconds=app_settings.sensor_rollup_settle_seconds)
+        late = [timestamp for timestamp in timestamps if timestamp < settled]
+        if not late:
+            return False
+        SensorRollupBacklog.objects.create(  # type: ignore[attr-defined]
+            range_start=min(late).replace(microsecond=0),
+            range_end=max(late).replace(microsecond=0) + timedelta(seconds=1),
+        )
+        return True
+
+    def _second_aggregates(self, lower: datetime, upper: datetime) -> QuerySet:
+        """Aggregate raw readings in [lower, upper) per device and second."""
+        g_force = Sqrt(F("ax") * F("ax") + F("ay") * F("ay") + F("az") * F("az")) / GRAVITY
+        return (
+            SensorData.objects.filter(timestamp__gte=lower, timestamp__lt=upper)  # type: ignore[attr-defined]
+            .annotate(bucket=TruncSecond("timestamp", tzinfo=UTC))
+            .order_by()  # Drop Meta.ordering so it does not leak into GROUP BY
+            .values("device_id", "bucket")
+            .annotate(
+                sample_count=Count("id"),
+                **{f"{axis}_min": Min(axis) for axis in AXES},
+                **{f"{axis}_max": Max(axis) for axis in AXES},
+                **{f"{axis}_mean": Avg(axis) for axis in AXES},
+                g_peak=Max(g_force, output_field=FloatField()),
+                roll_min=Min("roll"),
+                roll_max=Max("roll"),
+                pitch_min=Min("pitch"),
+                pitch_max=Max("pitch"),
+                tilt_count=Count("id", filter=Q(tilt_detected=True)),
+            )
+        )
+
+    def _minute_aggregates(self, lower: datetime, upper: datetime) -> QuerySet:
+        """Aggregate per-second rollups in [lower, upper) per device and minute."""
+        return (
+            SensorRollupSecond.objects.filter(bucket_start__gte=lower, bucket_start__lt=upper)  # type: ignore[attr-defined]
+            .annotate(bucket=TruncMinute("bucket_start", tzinfo=UTC))
+            .order_by()
+            .values("device_id", "bucket")
+            .annotate(
+                sample_count=Sum("sample_count"),
+                **{f"{axis}_min": Min(f"{axis}_min") for axis in AXES},
+                **{f"{axis}_max": Max(f"{axis}_max") for axis in AXES},
+                **{
+                    f"{axis}_mean": Sum(F(f"{axis}_mean") * F("sample_count"), output_field=FloatField())
+                    / Sum("sample_count")
+                    for axis in AXES
+                },
+                g_peak=Max("g_peak"),
+                roll_min=Min("roll_min"),
+                roll_max=Max("roll_max"),
+                pitch_min=Min("pitch_min"),
+                pitch_max=Max("pitch_max"),
+                tilt_count=Sum("tilt_count"),
+            )
+        )
+
+    def _run(  # noqa: PLR0913
+        self,
+        resolution: str,
+        model: type[SensorRollupSecond] | type[SensorRollupMinute],
+        aggregates: Callable[[datetime, datetime], QuerySet],
+        start: datetime | None,
+        until: datetime,
+        chunk: timedelta,
+    ) -> int:
+        """Roll up [watermark, until) in chunks, committing each chunk with its watermark."""
+        lower = self.get_watermark(resolution) or start
+        if lower is None:
+            return 0
+
+        written = 0
+        while lower < until:
+            upper = min(lower + chunk, until)
+            written += self._upsert_range(resolution, model, aggregates, lower, upper, advance_watermark=True)
+            lower = upper
+        return written
+
+    def _upsert_range(  # noqa: PLR0913
+        self,
+        resolution: str,
+        model: type[SensorRollupSecond] | type[SensorRollupMinute],
+        aggregates: Callable[[datetime, datetime], QuerySet],
+        lower: datetime,
+        upper: datetime,
+        *,
+        advance_watermark: bool,
+    ) -> int:
+        """Recompute and upsert the buckets in [lower, upper), optionally moving the watermark to ``upper``."""
+        rows = [
+            model(
+                device_id=row["device_id"],
+                bucket_start=row["bucket"],
+                **{field: row[field] for field in SUMMARY_FIELDS},
+            )
+            for row in aggregates(lower, upper)
+        ]
+        with transaction.atomic():  # type: ignore[call-overload]
+            if rows:
+                model.objects.bulk_create(  # type: ignore[attr-defined]
+                    rows,
+                    update_conflicts=True,
+                    unique_fields=["device_id", "bucket_start"],
+                    update_fields=SUMMARY_FIELDS,
+                )
+            if advance_watermark:
+                self._set_watermark(resolution, upper)
+        logger.info(
+            "[ROLLUP] %s rollup [%s, %s): %s buckets",
+            resolution,
+            lower.isoformat(),
+            upper.isoformat(),
+            len(rows),
+        )
+        return len(rows)
+
+    def _rollup_backlog(self, chunk: timedelta) -> int:
+        """Roll up again the ranges of late readings that landed behind the watermarks.
+
+        Entries are deleted by id once processed, so entries recorded meanwhile are
+        kept for the next run. Ranges still ahead of a watermark are left to the
+        regular forward rollup.
+
+        Returns:
+            Number of per-second buckets written
+
+        """
+        entries = list(
+            SensorRollupBacklog.objects.order_by("range_start").values_list("id", "range_start", "range_end"),  # type: ignore[attr-defined]
+        )
+        if not entries:
+            return 0
+
+        # Merge overlapping ranges so each bucket is recomputed once
+        ranges: list[list[datetime]] = []
+        for _, start, end in entries:
+            if ranges and start <= ranges[-1][1]:
+                ranges[-1][1] = max(ranges[-1][1], end)
+            else:
+                ranges.append([start, end])
+
+        second_watermark = self.get_watermark("second")
+        minute_watermark = self.get_watermark("minute")
+        written = 0
+        for start, end in ranges:
+            if second_watermark is not None:
+                lower, until = start, min(end, second_watermark)
+                while lower < until:
+                    upper = min(lower + chunk, until)
+                    written += self._upsert_range(
+                        "second",
+                        SensorRollupSecond,
+                        self._second_aggregates,
+                        lower,
+                        upper,
+                        advance_watermark=False,
+                    )
+                    lower = upper
+            if minute_watermark is not None:
+                lower = start.replace(second=0)
+                until = min(end.replace(second=0) + timedelta(minutes=1), minute_watermark)
+                if lower < until:
+                    self._upsert_range(
+                        "minute",
+                        SensorRollupMinute,
+                        self._minute_aggregates,
+                        lower,
+                        until,
+                        advance_watermark=False,
+                    )
+
+        SensorRollupBacklog.objects.filter(pk__in=[entry_id for entry_id, _, _ in entries]).delete()  # type: ignore[attr-defined]
+        logger.info("[ROLLUP] Rolled up %s late reading ranges (%s backlog entries)", len(ranges), len(entries))
+        return written
+
+    def rollup_seconds(self, chunk: timedelta = timedelta(minutes=10), now: datetime | None = None) -> int:
+        """Roll raw readings up into per-second summaries.
+
+        Ranges of late readings from the backlog are rolled up again afterwards, at
+        both resolutions.
+
+        Args:
+            chunk: Time range processed per transaction
+            now: Reference time (defaults to now)
+
+        Returns:
+            Number of per-second buckets written
+
+        """
+        now = now or timezone.now()
+        until = (now - timedelta(seconds=app_settings.sensor_rollup_settle_seconds)).replace(microsecond=0)
+        earliest = (
+            SensorData.objects.order_by("timestamp").values_list("timestamp", flat=True).first()  # type: ignore[attr-defined]
+        )
+        start = earliest.replace(microsecond=0) if earliest else None
+        written = self._run("second", SensorRollupSecond, self._second_aggregates, start, until, chunk)
+        return written + self._rollup_backlog(chunk)
+
+    def rollup_minutes(self, chunk: timedelta = timedelta(hours=6)) -> int:
+        """Roll per-second summaries up into per-minute summaries.
+
+        Only whole minutes already covered by the per-second watermark are processed.
+
+        Args:
+            chunk: Time range processed per transaction
+
+        Returns:
+            Number of per-minute buckets written
+
+        """
+        second_watermark = self.get_watermark("second")
+        if second_watermark is None:
+            return 0
+        until = second_watermark.replace(second=0, microsecond=0)
+        earliest = (
+            SensorRollupSecond.objects.order_by("bucket_start").values_list("bucket_start", flat=True).first()  # type: ignore[attr-defined]
+        )
+        start = earliest.replace(second=0, microsecond=0) if earliest else None
+        return self._run("minute", SensorRollupMinute, self._minute_aggregates, start, until, chunk)
+
+    def raw_prune_cutoff(self, now: datetime | None = None, retention_days: int | None = None) -> datetime | None:
+        """Return the time before which raw readings may be deleted.
+
+        Never later than the per-second watermark or the oldest backlog entry, so
+        readings are not deleted before they have been rolled up.
+
+        Args:
+            now: Reference time (defaults to now)
+            retention_days: Days of raw data to keep (defaults to ``sensor_raw_retention_days``)
+
+        Returns:
+            The cutoff, or None if nothing may be deleted yet (rollups never ran)
+
+        """
+        watermark = self.get_watermark("second")
+        if watermark is None:
+            return None
+        retention_days = app_settings.sensor_raw_retention_days if retention_days is None else retention_days
+        horizon = (now or timezone.now()) - timedelta(days=retention_days)
+        # Late readings still waiting in the backlog have not been rolled up either
+        backlog_start = (
+            SensorRollupBacklog.objects.order_by("range_start").values_list("range_start", flat=True).first()  # type: ignore[attr-defined]
+        )
+        return min(horizon, watermark, backlog_start or watermark)
+
+    def prune(self, now: datetime | None = None) -> tuple[int, int]:
+        """Delete raw readings and per-second rollups beyond their retention horizons.
+
+        Args:
+            now: Reference time (defaults to now)
+
+        Returns:
+            Tuple of (raw rows deleted, per-second rollups deleted)
+
+        """
+        now = now or timezone.now()
+        raw_deleted = 0
+        cutoff = self.raw_prune_cutoff(now)
+        if cutoff is not None:
+            raw_deleted, _ = SensorData.objects.filter(timestamp__lt=cutoff).delete()  # type: ignore[attr-defined]
+
+        minute_watermark = self.get_watermark("minute")
+        seconds_deleted = 0
+        if minute_watermark is not None:
+            seconds_cutoff = min(
+                now - timedelta(days=app_settings.sensor_rollup_second_retention_days),
+                minute_watermark,
+            )
+            seconds_deleted, _ = SensorRollupSecond.objects.filter(  # type: ignore[attr-defined]
+                bucket_start__lt=seconds_cutoff,
+            ).delete()
+
+        logger.info("[ROLLUP] Pruned %s raw readings and %s per-second rollups", raw_deleted, seconds_deleted)
+        return raw_deleted, seconds_deleted
+
+    def get_history(self, device_id: str, start: datetime, end: datetime) -> QuerySet:
+        """Return rollups for a device over [start, end) at a resolution suited to the span.
+
+        Spans over an hour read per-minute rollups, shorter ones per-second rollups, so
+        the number of rows returned does not depend on the raw sample rate.
+        """
+        model = SensorRollupMinute if end - start > timedelta(hours=1) else SensorRollupSecond
+        return model.objects.filter(  # type: ignore[attr-defined]
+            device_id=device_id,
+            bucket_start__gte=start,
+            bucket_start__lt=end,
+        ).order_by("bucket_start")
@@ -0,0 +1,110 @@
+"""Columnar sensor window representation for crash analysis."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+# Row layout shared by the ring buffer records and DB row conversion
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<i8"),
+        ("ax", "<f4"),
+        ("ay", "<f4"),
+        ("az", "<f4"),
+        ("roll", "<f4"),
+        ("pitch", "<f4"),
+        ("tilt", "?"),
+    ],
+)
+
+
+@dataclass(frozen=True, slots=True)
+class SensorWindow:
+    """A window of sensor readings stored as contiguous column arrays, oldest first.
+
+    Attributes:
+        timestamps: int64 microseconds since the epoch
+        ax, ay, az: float32 acceleration in m/s^2
+        roll, pitch: float32 angles in degrees
+        tilt: bool tilt_detected flags
+
+    """
+
+    timestamps: np.ndarray
+    ax: np.ndarray
+    ay: np.ndarray
+    az: np.ndarray
+    roll: np.ndarray
+    pitch: np.ndarray
+    tilt: np.ndarray
+
+    def __len__(self) -> int:
+        """Return the number of readings in the window."""
+        return int(self.timestamps.shape[0])
+
+    @classmethod
+    def empty(cls) -> "SensorWindow":
+        """Return a window with no readings."""
+        return cls.from_records(np.empty(0, dtype=RECORD_DTYPE))
+
+    @classmethod
+    def from_records(cls, records: np.ndarray) -> "SensorWindow":
+        """Build a window from a structured array with (at least) RECORD_DTYPE's fields.
+
+        Each column is gathered into its own contiguous array in a single pass.
+        """
+        return cls(
+            timestamps=np.ascontiguousarray(records["timestamp"], dtype=np.int64),
+            ax=np.ascontiguousarray(records["ax"], dtype=np.float32),
+            ay=np.ascontiguousarray(records["ay"], dtype=np.float32),
+            az=np.ascontiguousarray(records["az"], dtype=np.float32),
+            roll=np.ascontiguousarray(records["roll"], dtype=np.float32),
+            pitch=np.ascontiguousarray(records["pitch"], dtype=np.float32),
+            tilt=np.ascontiguousarray(records["tilt"], dtype=np.bool_),
+        )
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple], count: int = -1) -> "SensorWindow":
+        """Build a window from (timestamp_us, ax, ay, az, roll, pitch, tilt) tuples.
+
+        Rows are streamed straight into a typed buffer (e.g. from ``values_list``),
+        without materialising per-reading dicts or floats.
+
+        Args:
+            rows: Row tuples, oldest first
+            count: Number of rows if known (lets numpy allocate once)
+
+        """
+        return cls.from_records(np.fromiter(rows, dtype=RECORD_DTYPE, count=count))
+
+    def tail(self, count: int) -> "SensorWindow":
+        """Return a view of the newest ``count`` readings."""
+        start = max(len(self) - count, 0)
+        return SensorWindow(
+            timestamps=self.timestamps[start:],
+            ax=self.ax[start:],
+            ay=self.ay[start:],
+            az=self.az[start:],
+            roll=self.roll[start:],
+            pitch=self.pitch[start:],
+            tilt=self.tilt[start:],
+        )
+
+    def isoformat(self, index: int) -> str:
+        """Return the timestamp of one reading as an ISO 8601 string."""
+        return datetime.fromtimestamp(int(self.timestamps[index]) / 1_000_000, tz=UTC).isoformat()
+
+    def reading(self, index: int) -> dict[str, Any]:
+        """Return one reading as a plain dict (for logging and JSON payloads)."""
+        return {
+            "ax": float(self.ax[index]),
+            "ay": float(self.ay[index]),
+            "az": float(self.az[index]),
+            "roll": float(self.roll[index]),
+            "pitch": float(self.pitch[index]),
+            "tilt_detected": bool(self.tilt[index]),
+            "timestamp": self.isoformat(index),
+        }
@@ -0,0 +1,225 @@
+"""Cache of crash verdicts keyed by a quantised sensor-window fingerprint.
+
+Sits in front of ``GeminiService.analyze_crash_data``: an alert whose current
+reading and window features fall into the same quantisation cell as a recent
+analysis (or close to it, or close to a user-labelled CrashEvent) reuses that
+verdict instead of making another API call.
+"""
+
+import logging
+import time
+from typing import Any
+
+import numpy as np
+from common.utils.metrics import incr_counter
+from core.ai.gemini_service import gemini_circuit_breaker
+from django.core.cache import caches
+from sentry.settings.config import settings as app_settings
+
+from device.models import CrashEvent
+
+logger = logging.getLogger("device")
+
+# Quantisation step per fingerprint dimension: readings closer than one step are "the same"
+FINGERPRINT_STEPS: dict[str, float] = {
+    "ax": 1.0,  # m/s²
+    "ay": 1.0,
+    "az": 1.0,
+    "roll": 10.0,  # degrees
+    "pitch": 10.0,
+    "g_peak": 0.25,  # g
+    "impact_duration_s": 0.25,
+    "post_impact_still_fraction": 0.2,
+    "roll_change": 10.0,
+    "pitch_change": 10.0,
+    "tilt_persistence_s": 1.0,
+}
+READING_KEYS = ("ax", "ay", "az", "roll", "pitch")
+STEPS = np.array(list(FINGERPRINT_STEPS.values()))
+
+ENTRIES_KEY = "crash_verdict_cache:entries"
+LABELLED_KEY = "crash_verdict_cache:labelled"
+LABELLED_TTL_SECONDS = 300
+LABELLED_MAX_EVENTS = 1000
+COUNTER_PREFIX = "crash_verdict_cache"
+
+
+def fingerprint(current_reading: dict[str, Any], features: dict[str, Any]) -> np.ndarray:
+    """Return the quantised fingerprint of an alert (integer steps per dimension)."""
+    values = np.array(
+        [
+            float(current_reading.get(name, 0.0)) if name in READING_KEYS else float(features.get(name, 0.0))
+            for name in FINGERPRINT_STEPS
+        ],
+    )
+    return np.rint(values / STEPS)
+
+
+def fingerprint_key(vector: np.ndarray) -> str:
+    """Return the exact-match cache key of a fingerprint."""
+    return "v1:" + ",".join(str(int(v)) for v in vector)
+
+
+class VerdictCache:
+    """Shared TTL + LRU verdict cache with nearest-neighbour lookup.
+
+    Entries live in one blob in the shared cache so every worker can reuse them;
+    concurrent writers may occasionally drop an entry, which only costs a miss.
+    """
+
+    def __init__(self) -> None:
+        """Initialize cache settings."""
+        self.enabled = app_settings.crash_verdict_cache_enabled
+        self.ttl = app_settings.crash_verdict_cache_ttl_seconds
+        self.max_entries = app_settings.crash_verdict_cache_size
+        self.max_distance = app_settings.crash_verdict_cache_max_distance
+        self.cache = caches["shared"]
+
+    def _entries(self, now: float) -> dict[str, dict[str, Any]]:
+        entries = self.cache.get(ENTRIES_KEY) or {}
+        return {key: entry for key, entry in entries.items() if entry["expires_at"] > now}
+
+    def _labelled(self) -> dict[str, Any]:
+        """Return fingerprints of user-labelled CrashEvents (cached briefly)."""
+        index = self.cache.get(LABELLED_KEY)
+        if index is not None:
+            return index
+
+        vectors, events = [], []
+        rows = (
+            CrashEvent.objects.exclude(user_feedback="")  # type: ignore[attr-defined]
+            .exclude(crash_features={})
+            .order_by("-updated_at")
+            .values(
+                "id",
+                "user_feedback",
+                "severity",
+                "crash_type",
+                "key_indicators",
+                "impact_acceleration",
+                "final_tilt",
+                "crash_features",
+            )[:LABELLED_MAX_EVENTS]
+        )
+        for row in rows:
+            reading = {**row["impact_acceleration"], **row["final_tilt"]}
+            vectors.append(fingerprint(reading, row["crash_features"]).tolist())
+            events.append(
+                {
+                    "id": row["id"],
+                    "is_crash": row["user_feedback"] == "true_positive",
+                    "severity": row["severity"],
+                    "crash_type": row["crash_type"],
+                    "key_indicators": row["key_indicators"],
+                },
+            )
+        index = {"vectors": vectors, "events": events}
+        self.cache.set(LABELLED_KEY, index, LABELLED_TTL_SECONDS)
+        return index
+
+    def invalidate_labelled(self) -> None:
+        """Drop the labelled-event index (call after user feedback changes)."""
+        self.cache.delete(LABELLED_KEY)
+
+    def lookup(self, current_reading: dict[str, Any], features: dict[str, Any]) -> dict[str, Any] | None:
+        """Return a reusable verdict for this alert, or None on a miss.
+
+        Args:
+            current_reading: Reading that triggered the alert
+            features: Window features (see ``extract_crash_features``)
+
+        Returns:
+            Analysis dict (``source`` set to the kind of hit), or None
+
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        vector = fingerprint(current_reading, features)
+        entries = self._entries(now)
+
+        kind, distance, verdict, saved_ms = None, np.inf, None, 0.0
+        key = fingerprint_key(vector)
+        if key in entries:
+            kind, distance = "exact", 0.0
+        elif entries:
+            keys = list(entries)
+            distances = np.linalg.norm(np.array([entries[k]["vector"] for k in keys]) - vector, axis=1)
+            best = int(np.argmin(distances))
+            if distances[best] <= self.max_distance:
+                kind, distance, key = "nearest", float(distances[best]), keys[best]
+        if kind is not None:
+            entry = entries[key]
+            entry["last_used"] = now
+            self.cache.set(ENTRIES_KEY, entries, self.ttl)
+            verdict, saved_ms = dict(entry["verdict"]), entry["latency_ms"]
+
+        # User feedback is ground truth: a labelled event at least as close wins
+        labelled = self._labelled()
+        if labelled["vectors"]:
+            distances = np.linalg.norm(np.array(labelled["vectors"]) - vector, axis=1)
+            best = int(np.argmin(distances))
+            if distances[best] <= min(distance, self.max_distance):
+                event = labelled["events"][best]
+                kind, distance = "labelled", float(distances[best])
+                verdict = {
+                    "is_crash": event["is_crash"],
+                    "confidence": 0.9,
+                    "severity": event["severity"] if event["is_crash"] else "low",
+                    "crash_type": event["crash_type"] if event["is_crash"] else "false_positive",
+                    "reasoning": f"Matches user-labelled crash event #{event['id']}",
+                    "key_indicators": event["key_indicators"],
+                    "false_positive_risk": 0.1 if event["is_crash"] else 0.9,
+                }
+                saved_ms = gemini_circuit_breaker.snapshot()["latency_p50_ms"] or 0.0
+
+        if verdict is None:
+            incr_counter(f"{COUNTER_PREFIX}.misses")
+            return None
+
+        incr_counter(f"{COUNTER_PREFIX}.hits_{kind}")
+        incr_counter(f"{COUNTER_PREFIX}.saved_latency_ms", round(saved_ms, 1))
+        verdict["source"] = f"verdict_cache:{kind}"
+        logger.info(
+            "[CACHE] Reusing %s verdict (distance=%.2f, is_crash=%s, saved ~%.0f ms)",
+            kind,
+            distance,
+            verdict["is_crash"],
+            saved_ms,
+        )
+        return verdict
+
+    def store(
+        self,
+        current_reading: dict[str, Any],
+        features: dict[str, Any],
+        verdict: dict[str, Any],
+        latency_ms: float,
+    ) -> None:
+        """Cache a Gemini verdict (fallback and local verdicts are not cached).
+
+        Args:
+            current_reading: Reading that triggered the alert
+            features: Window features
+            verdict: Analysis result
+            latency_ms: Time the analysis took (reported as saved on reuse)
+
+        """
+        if not self.enabled or verdict.get("source") != "gemini":
+            return
+
+        now = time.time()
+        vector = fingerprint(current_reading, features)
+        entries = self._entries(now)
+        entries[fingerprint_key(vector)] = {
+            "vector": vector.tolist(),
+            "verdict": verdict,
+            "expires_at": now + self.ttl,
+            "last_used": now,
+            "latency_ms": latency_ms,
+        }
+        if len(entries) > self.max_entries:
+            for key in sorted(entries, key=lambda k: entries[k]["last_used"])[: len(entries) - self.max_entries]:
+                del entries[key]
+        self.cache.set(ENTRIES_KEY, entries, self.ttl)
@@ -0,0 +1,35 @@
+"""Signal handlers keeping cached push recipient sets in step with the database."""
+
+from typing import Any
+
+from core.models import LovedOne
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from device.models import DeviceToken
+from device.services.push_recipients import invalidate_push_recipients, owners_of_users
+
+
+@receiver(pre_save, sender=DeviceToken)
+def remember_device_token_user(sender: type, instance: DeviceToken, **_kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Remember a token's previous user so its old owners are invalidated too."""
+    instance._previous_user_id = (  # type: ignore[attr-defined]  # noqa: SLF001
+        DeviceToken.objects.filter(pk=instance.pk).values_list("user_id", flat=True).first()  # type: ignore[attr-defined]
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=DeviceToken)
+@receiver(post_delete, sender=DeviceToken)
+def invalidate_device_token_recipients(sender: type, instance: DeviceToken, **_kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Drop recipient sets that include (or should now include) this token."""
+    user_ids = {instance.user_id, getattr(instance, "_previous_user_id", None)}  # type: ignore[attr-defined]
+    invalidate_push_recipients(device_ids=[instance.device_id], owner_ids=owners_of_users(user_ids))  # type: ignore[attr-defined]
+
+
+@receiver(post_save, sender=LovedOne)
+@receiver(post_delete, sender=LovedOne)
+def invalidate_loved_one_recipients(sender: type, instance: LovedOne, **_kwargs: Any) -> None:  # noqa: ANN401, ARG001
+    """Drop the owner's recipient sets when a loved-one relationship changes."""
+    invalidate_push_recipients(owner_ids=[instance.user_id])  # type: ignore[attr-defined]
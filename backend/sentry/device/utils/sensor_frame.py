@@ -0,0 +1,221 @@
+"""Compact binary frame format for sensor telemetry uploads.
+
+Frame layout (little-endian):
+
+    header  : magic "SF" | version u8 | flags u8 | base_timestamp i64 (ms) | sent_at i64 (ms)
+              | sample_count u16 | device_id_len u8 | device_id (utf-8, device_id_len bytes)
+    samples : sample_count x (delta_ms u16 | ax i16 | ay i16 | az i16 | roll i16 | pitch i16 | flags u8)
+
+Each sample's ``delta_ms`` is relative to the previous sample (the first one to
+``base_timestamp``). Accelerations are m/s^2 x 100 and angles are degrees x 100, which
+covers the MPU6050's +/-16g range and +/-180 deg at 0.01 resolution in 13 bytes per sample.
+The whole frame may be gzip or deflate compressed (signalled with Content-Encoding).
+"""
+
+import struct
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+FRAME_CONTENT_TYPE = "application/vnd.sentry.sensor-frame"
+FRAME_MAGIC = b"SF"
+FRAME_VERSION = 1
+
+FLAG_HAS_SENT_AT = 0x01
+SAMPLE_FLAG_TILT = 0x01
+
+ACCEL_SCALE = 100.0
+ANGLE_SCALE = 100.0
+
+HEADER = struct.Struct("<2sBBqqHB")
+SAMPLE = struct.Struct("<HhhhhhB")
+
+MAX_DEVICE_ID_BYTES = 0xFF  # device_id_len is a u8
+MAX_DELTA_MS = 0xFFFF  # delta_ms is a u16
+MAX_SAMPLES = 0xFFFF
+MAX_FRAME_BYTES = HEADER.size + MAX_DEVICE_ID_BYTES + MAX_SAMPLES * SAMPLE.size
+
+# Decoded sample: (timestamp_ms, ax, ay, az, roll, pitch, tilt_detected)
+SampleValues = tuple[int, float, float, float, float, float, bool]
+
+
+class FrameDecodeError(ValueError):
+    """Raised when a sensor frame is malformed."""
+
+
+@dataclass(slots=True)
+class SensorFrame:
+    """Decoded sensor frame."""
+
+    device_id: str
+    sent_at: int | None
+    samples: list[SampleValues]
+
+
+def _decompress(body: bytes, content_encoding: str | None) -> bytes:
+    """Decompress a frame body, refusing anything larger than a maximal frame."""
+    encoding = (content_encoding or "identity").strip().lower()
+    if encoding == "identity":
+        return body
+    if encoding == "gzip":
+        wbits = 16 + zlib.MAX_WBITS
+    elif encoding == "deflate":
+        wbits = zlib.MAX_WBITS
+    else:
+        message = f"Unsupported Content-Encoding: {content_encoding}"
+        raise FrameDecodeError(message)
+
+    decompressor = zlib.decompressobj(wbits)
+    try:
+        data = decompressor.decompress(body, MAX_FRAME_BYTES + 1)
+    except zlib.error as e:
+        message = f"Invalid {encoding} stream: {e}"
+        raise FrameDecodeError(message) from None
+    if len(data) > MAX_FRAME_BYTES or decompressor.unconsumed_tail:
+        message = "Decompressed frame exceeds maximum size"
+        raise FrameDecodeError(message)
+    return data
+
+
+def decode_frame(body: bytes, content_encoding: str | None = None) -> SensorFrame:
+    """Decode a (possibly compressed) binary sensor frame.
+
+    Args:
+        body: Raw request body
+        content_encoding: Value of the Content-Encoding header, if any
+
+    Returns:
+        Decoded SensorFrame with absolute device-clock timestamps
+
+    Raises:
+        FrameDecodeError: If the frame is malformed
+
+    """
+    data = _decompress(body, content_encoding)
+    if len(data) < HEADER.size:
+        message = "Frame shorter than header"
+        raise FrameDecodeError(message)
+
+    magic, version, flags, base_timestamp, sent_at, sample_count, device_id_len = HEADER.unpack_from(data)
+    if magic != FRAME_MAGIC:
+        message = "Bad frame magic"
+        raise FrameDecodeError(message)
+    if version != FRAME_VERSION:
+        message = f"Unsupported frame version: {version}"
+        raise FrameDecodeError(message)
+
+    samples_offset = HEADER.size + device_id_len
+    expected_size = samples_offset + sample_count * SAMPLE.size
+    if len(data) != expected_size:
+        message = f"Frame size mismatch: expected {expected_size} bytes, got {len(data)}"
+        raise FrameDecodeError(message)
+
+    try:
+        device_id = data[HEADER.size : samples_offset].decode("utf-8")
+    except UnicodeDecodeError:
+        message = "Device id is not valid UTF-8"
+        raise FrameDecodeError(message) from None
+
+    samples: list[SampleValues] = []
+    timestamp = base_timestamp
+    for delta_ms, ax, ay, az, roll, pitch, sample_flags in SAMPLE.iter_unpack(
+        memoryview(data)[samples_offset:],
+    ):
+        timestamp += delta_ms
+        samples.append(
+            (
+                timestamp,
+                ax / ACCEL_SCALE,
+                ay / ACCEL_SCALE,
+                az / ACCEL_SCALE,
+                roll / ANGLE_SCALE,
+                pitch / ANGLE_SCALE,
+                bool(sample_flags & SAMPLE_FLAG_TILT),
+            ),
+        )
+
+    return SensorFrame(
+        device_id=device_id,
+        sent_at=sent_at if flags & FLAG_HAS_SENT_AT else None,
+        samples=samples,
+    )
+
+
+def _clamp_i16(value: float, scale: float) -> int:
+    return max(-0x8000, min(0x7FFF, round(value * scale)))
+
+
+def encode_frame(
+    device_id: str,
+    readings: Iterable[dict[str, Any]],
+    sent_at: int | None = None,
+    content_encoding: str | None = None,
+) -> bytes:
+    """Encode readings into a binary sensor frame (reference encoder).
+
+    Mirrors what the ESP32 firmware should emit. Readings must be in timestamp order
+    and consecutive readings must be less than 65.5 seconds apart.
+
+    Args:
+        device_id: Device identifier (at most 255 UTF-8 bytes)
+        readings: Dicts with ax, ay, az, roll, pitch, tilt_detected and timestamp (ms)
+        sent_at: Device clock (ms) at send time, if timestamps are not unix ms
+        content_encoding: None, "gzip" or "deflate"
+
+    Returns:
+        Encoded frame bytes
+
+    Raises:
+        ValueError: If the readings cannot be represented in a frame
+
+    """
+    readings = list(readings)
+    device_id_bytes = device_id.encode("utf-8")
+    if len(device_id_bytes) > MAX_DEVICE_ID_BYTES:
+        message = f"Device id longer than {MAX_DEVICE_ID_BYTES} bytes"
+        raise ValueError(message)
+    if len(readings) > MAX_SAMPLES:
+        message = f"Too many samples for one frame (max {MAX_SAMPLES})"
+        raise ValueError(message)
+
+    base_timestamp = int(readings[0]["timestamp"]) if readings else 0
+    parts = [
+        HEADER.pack(
+            FRAME_MAGIC,
+            FRAME_VERSION,
+            FLAG_HAS_SENT_AT if sent_at is not None else 0,
+            base_timestamp,
+            sent_at or 0,
+            len(readings),
+            len(device_id_bytes),
+        ),
+        device_id_bytes,
+    ]
+
+    previous = base_timestamp
+    for reading in readings:
+        timestamp = int(reading["timestamp"])
+        delta_ms = timestamp - previous
+        if not 0 <= delta_ms <= MAX_DELTA_MS:
+            message = f"Timestamp delta out of range: {delta_ms} ms"
+            raise ValueError(message)
+        previous = timestamp
+        parts.append(
+            SAMPLE.pack(
+                delta_ms,
+                _clamp_i16(reading["ax"], ACCEL_SCALE),
+                _clamp_i16(reading["ay"], ACCEL_SCALE),
+                _clamp_i16(reading["az"], ACCEL_SCALE),
+                _clamp_i16(reading["roll"], ANGLE_SCALE),
+                _clamp_i16(reading["pitch"], ANGLE_SCALE),
+                SAMPLE_FLAG_TILT if reading["tilt_detected"] else 0,
+            ),
+        )
+
+    frame = b"".join(parts)
+    if content_encoding == "gzip":
+        return zlib.compress(frame, wbits=16 + zlib.MAX_WBITS)
+    if content_encoding == "deflate":
+        return zlib.compress(frame)
+    return frame
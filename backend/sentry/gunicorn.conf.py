@@ -0,0 +1,15 @@
+"""Gunicorn configuration for the Sentry backend.
+
+Loaded automatically by gunicorn from the working directory (/app/sentry).
+"""
+
+from typing import Any
+
+
+def worker_exit(server: Any, worker: Any) -> None:  # noqa: ANN401, ARG001
+    """Drain in-process write-behind buffers and in-flight notifications before the worker exits."""
+    from common.utils.batch_writer import shutdown_all_writers  # noqa: PLC0415
+    from device.services.notification_dispatcher import notification_dispatcher  # noqa: PLC0415
+
+    notification_dispatcher.shutdown(timeout=float(server.cfg.graceful_timeout) / 4)
+    shutdown_all_writers(timeout=float(server.cfg.graceful_timeout) / 4)
@@ -9,6 +9,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import tempfile
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -66,6 +67,26 @@ else:
     raise ValueError(message)
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# "shared" lives on local tmpfs so every gunicorn worker and management command
+# worker on the host sees the same entries (Gemini model resolution, etc.)
+_shm = Path("/dev/shm")  # noqa: S108
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": settings.shared_cache_dir
+        or str((_shm if _shm.is_dir() else Path(tempfile.gettempdir())) / "sentry-cache"),
+        "TIMEOUT": 3600,
+        "OPTIONS": {"MAX_ENTRIES": 10000},
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -107,6 +107,77 @@ class Settings(BaseSettings):
         default=None,
         description="The API key for the device",
     )
+    # Sensor ingest settings
+    device_ingest_max_batch_size: int = Field(
+        default=500,
+        description="Maximum number of sensor readings accepted in a single batched upload",
+    )
+    device_ingest_write_behind: bool = Field(
+        default=False,
+        description="Acknowledge sensor uploads immediately and persist them from a background flusher",
+    )
+    device_ingest_buffer_capacity: int = Field(
+        default=20000,
+        description="Maximum number of sensor readings held in the write-behind buffer per worker",
+    )
+    device_ingest_flush_size: int = Field(
+        default=1000,
+        description="Number of buffered sensor readings that triggers a write-behind flush",
+    )
+    device_ingest_flush_interval_ms: int = Field(
+        default=500,
+        description="Maximum time a sensor reading waits in the write-behind buffer before flushing",
+    )
+    device_ingest_enqueue_timeout_ms: int = Field(
+        default=50,
+        description="How long an upload waits for room in a full write-behind buffer before writing synchronously",
+    )
+    sensor_ring_enabled: bool = Field(
+        default=True,
+        description="Keep recent readings per device in a shared-memory ring buffer for crash context lookups",
+    )
+    sensor_ring_path: str | None = Field(
+        default=None,
+        description="Path of the shared-memory ring buffer file (defaults to /dev/shm or the temp dir)",
+    )
+    sensor_ring_slots: int = Field(
+        default=256,
+        description="Number of devices the shared-memory ring buffer can hold at once",
+    )
+    sensor_ring_capacity: int = Field(
+        default=2048,
+        description="Readings kept per device in the shared-memory ring buffer",
+    )
+    # Sensor data partitioning / retention settings (PostgreSQL only)
+    sensor_partition_granularity: str = Field(
+        default="day",
+        description="Range partition size for sensor data: 'day' or 'hour'",
+        pattern="^(day|hour)$",
+    )
+    sensor_partition_premake: int = Field(
+        default=3,
+        description="Number of future sensor data partitions to keep pre-created",
+    )
+    sensor_raw_retention_days: int = Field(
+        default=30,
+        description="Days of raw sensor data to keep (older rows are pruned once rolled up)",
+    )
+    sensor_rollup_settle_seconds: int = Field(
+        default=60,
+        description=(
+            "Delay before a second is rolled up, so most late (buffered/batched) readings are included; "
+            "readings older than this are queued for a re-rollup"
+        ),
+    )
+    sensor_rollup_second_retention_days: int = Field(
+        default=90,
+        description="Days of per-second sensor rollups to keep (per-minute rollups are kept indefinitely)",
+    )
+    # Host-wide cache shared by all gunicorn and worker processes
+    shared_cache_dir: str | None = Field(
+        default=None,
+        description="Directory of the shared file-based cache (defaults to /dev/shm or the temp dir)",
+    )
     # Gemini AI settings
     gemini_api_key: str | None = Field(
         default=None,
@@ -116,15 +187,131 @@ class Settings(BaseSettings):
         default="gemini-2.0-flash-exp",
         description="Gemini model name to use. Try: 'gemini-2.0-flash-exp', 'gemini-2.5-flash', 'gemini-2.5-pro', or 'gemini-pro'",
     )
+    gemini_base_url: str | None = Field(
+        default=None,
+        description="Override the Gemini API endpoint (e.g. a local run_fake_gemini server for load tests)",
+    )
     gemini_analysis_lookback_seconds: int = Field(
         default=30,
         description="Number of seconds of sensor data to analyze",
     )
+    gemini_request_timeout_seconds: float = Field(
+        default=20.0,
+        description="Overall deadline for one crash analysis (all hedged model attempts included)",
+    )
+    gemini_hedge_delay_ms: int = Field(
+        default=1500,
+        description="Race the next fallback model if no verdict arrives within this delay (0 = sequential fallback)",
+    )
+    gemini_hedge_max_in_flight: int = Field(
+        default=2,
+        description="Maximum model requests racing in parallel for one analysis",
+    )
+    gemini_breaker_window_seconds: int = Field(
+        default=60,
+        description="Rolling window of Gemini call outcomes used by the circuit breaker",
+    )
+    gemini_breaker_min_calls: int = Field(
+        default=5,
+        description="Calls required in the window before the circuit breaker can open",
+    )
+    gemini_breaker_failure_rate: float = Field(
+        default=0.5,
+        description="Share of failed or slow Gemini calls in the window that opens the circuit",
+    )
+    gemini_breaker_slow_call_seconds: float = Field(
+        default=8.0,
+        description="Gemini calls slower than this count as failures for the circuit breaker",
+    )
+    gemini_breaker_open_seconds: int = Field(
+        default=30,
+        description="How long the circuit stays open before a half-open probe call is allowed",
+    )
+    gemini_response_mode: str = Field(
+        default="json",
+        description=(
+            "'json': schema-constrained JSON response; 'stream': same, streamed, "
+            "with early exit once a dismissed (not a crash) decision arrives"
+        ),
+        pattern="^(json|stream)$",
+    )
+    gemini_prompt_token_base: int = Field(
+        default=250,
+        description="Prompt token budget before the window table (features, history, current reading)",
+    )
+    gemini_prompt_tokens_per_second: int = Field(
+        default=6,
+        description="Extra prompt tokens per second of lookback (more sampled readings for longer windows)",
+    )
+    gemini_prompt_token_max: int = Field(
+        default=1500,
+        description="Upper bound on the crash analysis prompt size in tokens",
+    )
+    gemini_model_cache_seconds: int = Field(
+        default=3600,
+        description="How long the resolved (listed/working) Gemini model name is cached across workers",
+    )
     # Push notification settings (Expo)
     expo_push_api_url: str = Field(
         default="https://exp.host/--/api/v2/push/send",
         description="Expo Push Notification API endpoint URL",
     )
+    push_recipient_cache_seconds: int = Field(
+        default=600,
+        description="How long a resolved set of crash alert push recipients is cached (changes invalidate it)",
+    )
+    notification_max_parallel: int = Field(
+        default=8,
+        description="Maximum crash alert pushes in flight per worker process",
+    )
+    notification_send_timeout_seconds: float = Field(
+        default=5.0,
+        description="Timeout of each crash alert push request (owner push or one loved-one batch)",
+    )
+    notification_outbox_batch_size: int = Field(
+        default=100,
+        description="Outbox rows the notification worker claims and sends per batch",
+    )
+    notification_outbox_max_attempts: int = Field(
+        default=8,
+        description="Send attempts before a crash alert push is marked failed",
+    )
+    notification_outbox_backoff_base_seconds: float = Field(
+        default=2.0,
+        description="Retry delay after the first failed push; doubles with each further attempt (jittered)",
+    )
+    notification_outbox_backoff_max_seconds: float = Field(
+        default=300.0,
+        description="Upper bound of the retry delay between push attempts",
+    )
+    notification_outbox_lease_seconds: int = Field(
+        default=60,
+        description="Seconds a claimed push is reserved for its sender before another worker may retry it",
+    )
+    expo_http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 to the Expo API (multiplexes concurrent pushes over one connection; needs h2)",
+    )
+    expo_max_connections: int = Field(
+        default=10,
+        description="Maximum open connections to the Expo API per worker",
+    )
+    expo_max_keepalive_connections: int = Field(
+        default=5,
+        description="Idle connections to the Expo API kept warm per worker",
+    )
+    expo_keepalive_expiry_seconds: float = Field(
+        default=300.0,
+        description="How long an idle Expo API connection is kept open for reuse",
+    )
+    expo_connect_timeout_seconds: float = Field(
+        default=3.0,
+        description="Timeout for opening a new connection to the Expo API",
+    )
+    expo_request_timeout_seconds: float = Field(
+        default=10.0,
+        description="Read/write timeout of one Expo push request",
+    )
     # FCM settings (deprecated - using Expo Push API now)
     fcm_credentials_path: str | None = Field(
         default=None,
@@ -143,6 +330,78 @@ class Settings(BaseSettings):
         default=12.0,
         description="G-force threshold for medium severity crashes",
     )
+    crash_classifier_enabled: bool = Field(
+        default=True,
+        description="Pre-screen alerts with the local classifier (when a trained model file exists)",
+    )
+    crash_classifier_path: str | None = Field(
+        default=None,
+        description="Path of the trained local crash classifier (defaults to <BASE_DIR>/ml/crash_classifier.json)",
+    )
+    crash_verdict_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse verdicts of near-identical past alerts instead of calling Gemini",
+    )
+    crash_verdict_cache_ttl_seconds: int = Field(
+        default=600,
+        description="How long a cached Gemini verdict can be reused",
+    )
+    crash_verdict_cache_size: int = Field(
+        default=512,
+        description="Maximum cached verdicts (least recently used are evicted)",
+    )
+    crash_verdict_cache_max_distance: float = Field(
+        default=1.0,
+        description="Maximum fingerprint distance (in quantisation steps) for a nearest-neighbour reuse",
+    )
+    crash_impact_threshold_g: float = Field(
+        default=2.5,
+        description="G-force magnitude above which a reading counts towards impact duration",
+    )
+    crash_stillness_tolerance_g: float = Field(
+        default=0.15,
+        description="Maximum deviation from 1g for a post-impact reading to count as still",
+    )
+    crash_batch_enabled: bool = Field(
+        default=True,
+        description="Combine Gemini analyses of alerts processed concurrently in one process into one request",
+    )
+    crash_batch_window_ms: int = Field(
+        default=100,
+        description="Maximum time an analysis waits for other alerts to join its batch",
+    )
+    crash_batch_max_size: int = Field(
+        default=8,
+        description="Maximum alerts per batched Gemini request",
+    )
+    # Crash analysis ledger
+    analysis_ledger_enabled: bool = Field(
+        default=True,
+        description=(
+            "Record every crash alert verdict (with features, model, prompt size and latency) to AnalysisRecord"
+        ),
+    )
+    analysis_ledger_buffer_capacity: int = Field(
+        default=5000,
+        description="Maximum analysis records buffered per worker; records are dropped rather than block alerts",
+    )
+    analysis_ledger_flush_size: int = Field(
+        default=200,
+        description="Number of buffered analysis records that triggers a flush",
+    )
+    analysis_ledger_flush_interval_ms: int = Field(
+        default=2000,
+        description="Maximum time an analysis record waits in the buffer before flushing",
+    )
+    # Asynchronous crash alert jobs
+    crash_job_max_attempts: int = Field(
+        default=3,
+        description="Attempts before a queued crash alert job is marked failed",
+    )
+    crash_job_stale_seconds: int = Field(
+        default=180,
+        description="Seconds after which a running crash alert job is presumed abandoned and re-claimed",
+    )
 
     @field_validator(
         "django_allowed_hosts",
@@ -5,6 +5,7 @@ from .base import (
     AUTH_USER_MODEL,
     AUTHENTICATION_BACKENDS,
     BASE_DIR,
+    CACHES,
     DATABASES,
     DEBUG,
     DEFAULT_AUTO_FIELD,
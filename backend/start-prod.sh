@@ -15,10 +15,53 @@ python manage.py makemigrations || echo "ℹ️  No new migrations to create"
 echo "🔄 Running migrations..."
 python manage.py migrate
 
+echo "🗂️  Pre-creating sensor data partitions..."
+python manage.py manage_sensor_partitions --skip-expire || echo "ℹ️  Sensor data partitioning not available"
+
 echo "👤 Creating initial data (superuser)..."
 python manage.py create_initial_data
 
 echo "✅ Production setup complete!"
+
+# Keep upcoming sensor data partitions pre-created; without this, rows land in the
+# DEFAULT partition once the partitions made at boot run out
+SENSOR_PARTITION_INTERVAL_SECONDS=${SENSOR_PARTITION_INTERVAL_SECONDS:-3600}
+(
+    while sleep "$SENSOR_PARTITION_INTERVAL_SECONDS"; do
+        python manage.py manage_sensor_partitions --skip-expire || echo "⚠️  Sensor data partition maintenance failed"
+    done
+) &
+
+# Runs a background worker command, restarting it whenever it exits so a crashed
+# worker does not silently stop its queue. Run under a process supervisor
+# (systemd, supervisord or separate containers) if you need more than this.
+supervise() {
+    local name=$1
+    shift
+    (
+        while true; do
+            echo "🧵 Starting $name..."
+            # Capture the status explicitly: a bare failing command would trip set -e
+            status=0
+            "$@" || status=$?
+            echo "⚠️  $name exited with status $status, restarting in ${WORKER_RESTART_DELAY_SECONDS:-5}s"
+            sleep "${WORKER_RESTART_DELAY_SECONDS:-5}"
+        done
+    ) &
+}
+
+# Background workers for asynchronous crash alerts (POST /api/v1/device/crash/alert/async)
+CRASH_JOB_WORKERS=${CRASH_JOB_WORKERS:-1}
+for _ in $(seq 1 "$CRASH_JOB_WORKERS"); do
+    supervise "crash alert job worker" python manage.py process_crash_jobs
+done
+
+# Background workers that retry crash alert pushes from the notification outbox
+NOTIFICATION_OUTBOX_WORKERS=${NOTIFICATION_OUTBOX_WORKERS:-1}
+for _ in $(seq 1 "$NOTIFICATION_OUTBOX_WORKERS"); do
+    supervise "notification outbox worker" python manage.py process_notification_outbox
+done
+
 echo "🌐 Starting Gunicorn server..."
 
 # Start Gunicorn with production settings
@@ -28,10 +71,13 @@ echo "🌐 Starting Gunicorn server..."
 # --access-logfile: access log file (use - for stdout)
 # --error-logfile: error log file (use - for stderr)
 # --capture-output: capture stdout/stderr
+# --config: worker hooks (drain write-behind buffers on shutdown)
 exec gunicorn \
+    --config gunicorn.conf.py \
     --bind 0.0.0.0:8000 \
     --workers 4 \
     --timeout 120 \
+    --graceful-timeout 30 \
     --access-logfile - \
     --error-logfile - \
     --capture-output \